@@ -0,0 +1 @@
+"""Benchmarks for the policedatauk package."""
@@ -0,0 +1,299 @@
+"""End-to-end client benchmarks against a local fake API.
+
+Usage:
+    python -m benchmarks.bench_client [--ops 200] [--latency 0.02]
+        [--error-rate 0.05] [--concurrency 10] [--output results.json]
+        [--baseline previous.json]
+
+Starts `benchmarks.fake_api` (requires the "bench" extra) and runs each
+scenario through the sync client (one call after another) and the async
+client (`--concurrency` calls in flight). For each it reports throughput,
+p50 / p99 call latency and the client's peak traced memory, which is
+measured in a separate, shorter pass as tracing slows the client down.
+
+Results are written to `benchmarks/results/<version>.json` by default and
+compared with a baseline (the newest other results file unless given), so
+regressions are visible between versions. Rate limiting is lifted so the
+client itself is measured. Injected 429s and 503s are both retried with
+short backoff, and the 503s also count as circuit breaker failures, so
+"errors" only counts calls whose retries ran out or that an open breaker
+refused.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+from pyrate_limiter import Duration, InMemoryBucket, Rate
+from shapely.geometry import Polygon
+
+from policedatauk import AsyncPoliceClient, PoliceClient, RetryPolicy
+
+from .fake_api import FakeAPIConfig, serve
+
+RESULTS_DIR = Path(__file__).parent / "results"
+AREA = Polygon([(-1.2, 52.6), (-1.2, 52.7), (-1.0, 52.7), (-1.0, 52.6)])
+
+SyncCall = Callable[[PoliceClient], object]
+AsyncCall = Callable[[AsyncPoliceClient], Awaitable[object]]
+
+SCENARIOS: Dict[str, Callable] = {
+    "crimes": lambda client: client.crimes.get_crimes_by_location(
+        poly=AREA, date="2024-01"
+    ),
+    "forces": lambda client: client.forces.get_all_forces(),
+    "neighbourhoods": lambda client: (
+        client.neighbourhoods.get_all_neighbourhoods("leicestershire")
+    ),
+    "boundary": lambda client: client.neighbourhoods.get_boundary(
+        "leicestershire", "NC01"
+    ),
+    "postcode": lambda client: client.postcodes.get_postcode_info("LE1 6SE"),
+}
+
+
+@dataclass
+class Result:
+    """The measurements of one scenario on one client."""
+
+    client: str
+    scenario: str
+    ops: int
+    errors: int
+    seconds: float
+    ops_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_mb: float
+
+
+def client_options(police_url: str, postcode_url: str) -> dict:
+    """Return the client options pointing at the fake API."""
+    return {
+        "bucket": InMemoryBucket([Rate(1_000_000, Duration.SECOND)]),
+        "retry_policy": RetryPolicy(base_wait=0.01, max_wait=0.1),
+        "police_url": police_url,
+        "postcode_url": postcode_url,
+    }
+
+
+def run_sync(client: PoliceClient, call: SyncCall, ops: int) -> List[float]:
+    """Run calls one after another, returning each latency (or NaN)."""
+    latencies = []
+    for _ in range(ops):
+        started = time.perf_counter()
+        try:
+            call(client)
+        except Exception:
+            latencies.append(float("nan"))
+            continue
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run_async(
+    client: AsyncPoliceClient, call: AsyncCall, ops: int, concurrency: int
+) -> List[float]:
+    """Run calls `concurrency` at a time, returning each latency (or NaN)."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> float:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(client)
+            except Exception:
+                return float("nan")
+            return time.perf_counter() - started
+
+    return await asyncio.gather(*(timed() for _ in range(ops)))
+
+
+def peak_memory(run: Callable[[], object]) -> float:
+    """Return the peak traced memory (in MB) while running a callable."""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+
+def summarise(
+    client: str,
+    scenario: str,
+    latencies: List[float],
+    seconds: float,
+    peak_mb: float,
+) -> Result:
+    """Aggregate the latencies of one run into a Result."""
+    ok = sorted(latency for latency in latencies if latency == latency)
+    if len(ok) >= 2:
+        centiles = statistics.quantiles(ok, n=100, method="inclusive")
+        p50, p99 = centiles[49], centiles[98]
+    else:
+        p50 = p99 = ok[0] if ok else float("nan")
+    return Result(
+        client=client,
+        scenario=scenario,
+        ops=len(latencies),
+        errors=len(latencies) - len(ok),
+        seconds=seconds,
+        ops_per_second=len(ok) / seconds,
+        p50_ms=p50 * 1e3,
+        p99_ms=p99 * 1e3,
+        peak_memory_mb=peak_mb,
+    )
+
+
+def bench(
+    police_url: str,
+    postcode_url: str,
+    ops: int,
+    concurrency: int,
+    memory_ops: int,
+) -> List[Result]:
+    """Run every scenario through the sync and async clients."""
+    options = client_options(police_url, postcode_url)
+    sync_client = PoliceClient(**options)
+    results = []
+    for scenario, call in SCENARIOS.items():
+        run_sync(sync_client, call, 1)  # warm up connections and caches
+        started = time.perf_counter()
+        latencies = run_sync(sync_client, call, ops)
+        seconds = time.perf_counter() - started
+        peak = peak_memory(lambda: run_sync(sync_client, call, memory_ops))
+        results.append(summarise("sync", scenario, latencies, seconds, peak))
+
+    async def main() -> None:
+        async_client = AsyncPoliceClient(**options)
+        for scenario, call in SCENARIOS.items():
+            await run_async(async_client, call, 1, 1)
+            started = time.perf_counter()
+            latencies = await run_async(async_client, call, ops, concurrency)
+            seconds = time.perf_counter() - started
+            tracemalloc.start()
+            try:
+                await run_async(async_client, call, memory_ops, concurrency)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            results.append(
+                summarise("async", scenario, latencies, seconds, peak / 1e6)
+            )
+
+    asyncio.run(main())
+    return results
+
+
+def package_version() -> str:
+    """Return the installed policedatauk version, or "dev"."""
+    try:
+        return version("policedatauk")
+    except PackageNotFoundError:
+        return "dev"
+
+
+def latest_baseline(output: Path) -> Path | None:
+    """Return the newest results file other than `output`, if any."""
+    candidates = [
+        path
+        for path in RESULTS_DIR.glob("*.json")
+        if path.resolve() != output.resolve()
+    ]
+    return max(candidates, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def compare(results: List[Result], baseline: Path) -> None:
+    """Print the change in throughput and p99 latency from a baseline."""
+    previous = {
+        (row["client"], row["scenario"]): row
+        for row in json.loads(baseline.read_text())["results"]
+    }
+    print(f"\nChange from {baseline.name}:")
+    for result in results:
+        before = previous.get((result.client, result.scenario))
+        if before is None:
+            continue
+        throughput = result.ops_per_second / before["ops_per_second"] - 1
+        p99 = result.p99_ms / before["p99_ms"] - 1
+        print(
+            f"  {result.client:<5} {result.scenario:<14} "
+            f"throughput {throughput:+7.1%}   p99 {p99:+7.1%}"
+        )
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmark and store the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--memory-ops", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--crimes", type=int, default=1_000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    args = parser.parse_args()
+
+    config = FakeAPIConfig(
+        crimes=args.crimes,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    with serve(config) as (police_url, postcode_url):
+        results = bench(
+            police_url,
+            postcode_url,
+            args.ops,
+            args.concurrency,
+            args.memory_ops,
+        )
+
+    print(
+        f"{'client':<6} {'scenario':<14} {'ops/s':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'peak MB':>8} {'errors':>6}"
+    )
+    for result in results:
+        print(
+            f"{result.client:<6} {result.scenario:<14} "
+            f"{result.ops_per_second:9.1f} {result.p50_ms:8.2f} "
+            f"{result.p99_ms:8.2f} {result.peak_memory_mb:8.2f} "
+            f"{result.errors:6d}"
+        )
+
+    output = args.output or RESULTS_DIR / f"{package_version()}.json"
+    baseline = args.baseline or latest_baseline(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "version": package_version(),
+                "python": platform.python_version(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "config": {**vars(args), "output": str(output)},
+                "results": [asdict(result) for result in results],
+            },
+            indent=2,
+            default=str,
+        )
+    )
+    print(f"\nResults written to {output}")
+    if baseline is not None and baseline.exists():
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
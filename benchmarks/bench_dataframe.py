@@ -0,0 +1,162 @@
+"""Profile each stage of the `to_polars=True` conversion pipeline.
+
+Usage:
+    python -m benchmarks.bench_dataframe [--rows 1000 10000 100000]
+        [--payload crimes outcomes postcodes neighbourhoods] [--repeat 3]
+
+Runs synthetic crime, outcome, postcode and neighbourhood payloads through
+the same steps as `utils.pydantic_to_df`, timing each stage on its own:
+
+    validate   decode the body and validate every item into its model
+    dump       dump the models to dicts (`model_dump(mode="json")`)
+    normalise  flatten nested dicts and expand lists-of-dicts into rows
+    frame      build the DataFrame from the flat records
+    rename     apply the endpoint's RENAME_MAP entry
+    clean      `clean_polars_df` (empty strings, empty columns and rows)
+
+and `pydantic_to_df` end to end. Reports rows per second and the peak
+memory allocated per input row for each stage. Allocations are traced
+with tracemalloc, which only sees Python allocations: memory polars
+allocates natively (most of "frame" and "clean") is not counted.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple, Type
+
+import polars as pl
+from pydantic import BaseModel
+
+from policedatauk.models import CrimeReport, CrimeWithOutcomes, PostCode
+from policedatauk.models.neighbourhood import Neighbourhood
+from policedatauk.utils import get_decoder
+from policedatauk.utils.dataframe import (
+    RENAME_MAP,
+    _to_record,
+    clean_polars_df,
+    normalise_records,
+    pydantic_to_df,
+)
+
+from .payloads import (
+    crime_payload,
+    neighbourhood_payload,
+    outcome_payload,
+    postcode_payload,
+    to_bytes,
+)
+
+# Payload name -> (payload builder, model, rename key)
+PAYLOADS: Dict[str, Tuple[Callable[[int], list], Type[BaseModel], str]] = {
+    "crimes": (crime_payload, CrimeReport, "crimes"),
+    "outcomes": (outcome_payload, CrimeWithOutcomes, "outcomes"),
+    "postcodes": (postcode_payload, PostCode, ""),
+    "neighbourhoods": (neighbourhood_payload, Neighbourhood, ""),
+}
+
+
+def stages(
+    body: bytes, model: Type[BaseModel], rename_key: str
+) -> List[Tuple[str, Callable[[], object]]]:
+    """Build the pipeline stages, each fed the output of the one before.
+
+    The inputs of every stage are computed once up front, so each stage
+    can be timed on its own.
+
+    Args:
+        body: The raw response body.
+        model: The pydantic model the items are validated into.
+        rename_key: The key of the endpoint's RENAME_MAP entry.
+
+    Returns:
+        The stage names and callables, in pipeline order.
+    """
+    decoder = get_decoder()
+    models = [model.model_validate(item) for item in decoder(body)]
+    records = [_to_record(item, exclude_none=True) for item in models]
+    rows = normalise_records(records)
+    df = pl.DataFrame(rows)
+    renamed = df.rename(RENAME_MAP.get(rename_key, {}), strict=False)
+    return [
+        (
+            "validate",
+            lambda: [model.model_validate(item) for item in decoder(body)],
+        ),
+        (
+            "dump",
+            lambda: [_to_record(item, exclude_none=True) for item in models],
+        ),
+        ("normalise", lambda: normalise_records(records)),
+        ("frame", lambda: pl.DataFrame(rows)),
+        (
+            "rename",
+            lambda: df.rename(RENAME_MAP.get(rename_key, {}), strict=False),
+        ),
+        ("clean", lambda: clean_polars_df(renamed)),
+        (
+            "to_df",
+            lambda: pydantic_to_df(models, rename_key=rename_key or None),
+        ),
+    ]
+
+
+def peak_allocated(run: Callable[[], object]) -> int:
+    """Measure the peak memory (in bytes) allocated while running a stage."""
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench(
+    payload: str, rows: int, repeat: int = 3
+) -> List[Tuple[str, float, int]]:
+    """Time and measure each stage on one payload.
+
+    Args:
+        payload: The name of the payload in PAYLOADS.
+        rows: The number of input rows (API items).
+        repeat: The number of timed runs; the best is reported.
+            Defaults to 3.
+
+    Returns:
+        The best time (in seconds) and peak allocated bytes per stage.
+    """
+    build, model, rename_key = PAYLOADS[payload]
+    body = to_bytes(build(rows))
+    results = []
+    for name, run in stages(body, model, rename_key):
+        best = min(timeit.repeat(run, number=1, repeat=repeat))
+        results.append((name, best, peak_allocated(run)))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print one table per payload and size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--payload", nargs="+", choices=list(PAYLOADS), default=list(PAYLOADS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for payload in args.payload:
+        for rows in args.rows:
+            print(f"\n{payload} ({rows:,} rows)")
+            for name, seconds, peak in bench(payload, rows, args.repeat):
+                print(
+                    f"  {name:<10} {seconds * 1e3:10.2f} ms "
+                    f"{rows / seconds:14,.0f} rows/s "
+                    f"{peak / rows:10,.0f} B/row"
+                )
+
+
+if __name__ == "__main__":
+    main()
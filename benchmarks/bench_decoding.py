@@ -0,0 +1,76 @@
+"""Compare the JSON decoder backends on crime payloads.
+
+Usage:
+    python -m benchmarks.bench_decoding [recorded.json ...]
+
+With no arguments, synthetic /crimes-street/all-crime payloads of 1k, 10k
+and 50k crimes are used. Pass saved response bodies (e.g. from
+`curl -d "date=2024-01&poly=..." .../crimes-street/all-crime`) to benchmark
+recorded payloads instead.
+"""
+
+import sys
+import timeit
+from typing import Dict, List, Tuple
+
+from policedatauk.utils import get_decoder
+
+from .payloads import crime_payload, load_recorded, to_bytes
+
+
+def available_decoders() -> Dict[str, object]:
+    """Return the installed decoder backends by name."""
+    decoders = {}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            decoders[name] = get_decoder(name)
+        except ImportError:
+            print(f"{name}: not installed, skipping")
+    return decoders
+
+
+def bench(body: bytes, repeat: int = 5) -> List[Tuple[str, float]]:
+    """Time each decoder on one payload.
+
+    Args:
+        body: The raw response body.
+        repeat: The number of timed runs; the best is reported.
+            Defaults to 5.
+
+    Returns:
+        The best decode time (in seconds) per decoder.
+    """
+    results = []
+    for name, decoder in available_decoders().items():
+        best = min(
+            timeit.repeat(lambda: decoder(body), number=1, repeat=repeat)
+        )
+        results.append((name, best))
+    return results
+
+
+def main(paths: List[str]) -> None:
+    """Run the benchmark and print one table per payload."""
+    if paths:
+        bodies = [(path, load_recorded(path)) for path in paths]
+    else:
+        bodies = [
+            (f"synthetic {rows:,} crimes", to_bytes(crime_payload(rows)))
+            for rows in (1_000, 10_000, 50_000)
+        ]
+
+    for label, body in bodies:
+        size_mb = len(body) / 1e6
+        print(f"\n{label} ({size_mb:.2f} MB)")
+        results = bench(body)
+        baseline = dict(results)["json"]
+        for name, seconds in results:
+            print(
+                f"  {name:<8} {seconds * 1e3:9.2f} ms "
+                f"{size_mb / seconds:8.1f} MB/s "
+                f"x{baseline / seconds:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+"""Compare the model backends and validation modes on crime payloads.
+
+Usage:
+    python -m benchmarks.bench_models [recorded.json ...]
+
+Each backend parses the raw response body exactly as the resources do:
+"pydantic" decodes the JSON then validates every item into CrimeReport,
+"trusted" validates the whole list from the bytes in one TypeAdapter call
+(validate="trusted"), and "msgspec" decodes the bytes straight into the
+CrimeReport Struct.
+Reports parsed objects per second and the memory retained per object.
+"""
+
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import TypeAdapter
+
+from policedatauk.models import CrimeReport
+from policedatauk.utils import get_decoder
+
+from .payloads import crime_payload, load_recorded, to_bytes
+
+Parser = Callable[[bytes], list]
+
+
+def available_parsers() -> Dict[str, Parser]:
+    """Return the installed model backends by name."""
+    decoder = get_decoder()
+    parsers: Dict[str, Parser] = {
+        "pydantic": lambda body: [
+            CrimeReport.model_validate(item) for item in decoder(body)
+        ],
+        "trusted": TypeAdapter(List[CrimeReport]).validate_json,
+    }
+    try:
+        import msgspec
+
+        from policedatauk.models import structs
+
+        parsers["msgspec"] = msgspec.json.Decoder(
+            List[structs.CrimeReport], strict=False
+        ).decode
+    except ImportError:
+        print("msgspec: not installed, skipping")
+    return parsers
+
+
+def retained_bytes(parser: Parser, body: bytes) -> int:
+    """Measure the memory (in bytes) held by the parsed objects."""
+    tracemalloc.start()
+    try:
+        models = parser(body)  # noqa: F841 - keep the objects alive
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current
+
+
+def bench(body: bytes, repeat: int = 5) -> List[Tuple[str, float, int]]:
+    """Time and measure each backend on one payload.
+
+    Args:
+        body: The raw response body.
+        repeat: The number of timed runs; the best is reported.
+            Defaults to 5.
+
+    Returns:
+        The best parse time (in seconds) and retained bytes per backend.
+    """
+    results = []
+    for name, parser in available_parsers().items():
+        best = min(
+            timeit.repeat(lambda: parser(body), number=1, repeat=repeat)
+        )
+        results.append((name, best, retained_bytes(parser, body)))
+    return results
+
+
+def main(paths: List[str]) -> None:
+    """Run the benchmark and print one table per payload."""
+    if paths:
+        bodies = [(path, load_recorded(path)) for path in paths]
+    else:
+        bodies = [
+            (f"synthetic {rows:,} crimes", to_bytes(crime_payload(rows)))
+            for rows in (1_000, 10_000, 50_000)
+        ]
+
+    for label, body in bodies:
+        rows = len(get_decoder()(body))
+        print(f"\n{label} ({rows:,} objects)")
+        results = bench(body)
+        baseline = results[0][1]
+        for name, seconds, retained in results:
+            print(
+                f"  {name:<8} {seconds * 1e3:9.2f} ms "
+                f"{rows / seconds:12,.0f} obj/s "
+                f"{retained / rows:8,.0f} B/obj "
+                f"x{baseline / seconds:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
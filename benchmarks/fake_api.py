@@ -0,0 +1,202 @@
+"""Local stand-in for the Police and Postcodes.io APIs.
+
+A dependency-free ASGI app serving the synthetic payloads from
+`benchmarks.payloads`, with configurable latency and error injection, so
+the clients can be benchmarked end to end without touching (or being
+throttled by) the live APIs. The app is served by uvicorn (the "bench"
+extra) in a separate process, so the server does not compete with the
+client for the GIL or show up in its memory measurements.
+
+Routes, relative to the served root:
+    /api/crimes-street/all-crime        GET or POST
+    /api/forces
+    /api/{force}/neighbourhoods
+    /api/{force}/{neighbourhood}/boundary
+    /postcodes/{postcode}/validate
+    /postcodes/{postcode}
+"""
+
+import asyncio
+import multiprocessing
+import random
+import socket
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, Tuple
+
+from .payloads import (
+    boundary_payload,
+    crime_payload,
+    forces_payload,
+    neighbourhoods_payload,
+    postcode_record,
+    to_bytes,
+)
+
+Message = Dict[str, object]
+Receive = Callable[[], "asyncio.Future[Message]"]
+Send = Callable[[Message], "asyncio.Future[None]"]
+
+
+@dataclass
+class FakeAPIConfig:
+    """Behaviour of the fake API.
+
+    Args:
+        crimes: The number of crimes in each crime response.
+            Defaults to 1,000.
+        latency: The base latency (in seconds) added to every response.
+            Defaults to 0.
+        jitter: The maximum random latency (in seconds) added on top.
+            Defaults to 0.
+        error_rate: The fraction of requests answered with an injected
+            error instead of data. Defaults to 0.
+        error_statuses: The statuses injected errors are drawn from.
+            429s carry "Retry-After: 0". Defaults to (429, 503).
+        seed: The random seed for payloads, latency and errors.
+            Defaults to 0.
+    """
+
+    crimes: int = 1_000
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (429, 503)
+    seed: int = 0
+
+
+class FakeAPI:
+    """ASGI app answering the benchmarked endpoints from memory.
+
+    Args:
+        config: The behaviour of the fake API.
+            Defaults to FakeAPIConfig().
+    """
+
+    def __init__(self, config: FakeAPIConfig | None = None) -> None:
+        """Initialise the FakeAPI class."""
+        self.config = config or FakeAPIConfig()
+        self.rng = random.Random(self.config.seed)
+        self.crimes = to_bytes(crime_payload(self.config.crimes))
+        self.forces = to_bytes(forces_payload())
+        self.neighbourhoods = to_bytes(neighbourhoods_payload())
+        self.boundary = to_bytes(boundary_payload())
+        self.valid = to_bytes({"status": 200, "result": True})
+
+    def route(self, path: str) -> Tuple[int, bytes]:
+        """Return the status and body for a request path."""
+        parts = path.strip("/").split("/")
+        if parts[0] == "api":
+            parts = parts[1:]
+            if parts == ["crimes-street", "all-crime"]:
+                return 200, self.crimes
+            if parts == ["forces"]:
+                return 200, self.forces
+            if len(parts) == 2 and parts[1] == "neighbourhoods":
+                return 200, self.neighbourhoods
+            if len(parts) == 3 and parts[2] == "boundary":
+                return 200, self.boundary
+        elif parts[0] == "postcodes":
+            if len(parts) == 3 and parts[2] == "validate":
+                return 200, self.valid
+            if len(parts) == 2:
+                record = postcode_record(parts[1])
+                return 200, to_bytes({"status": 200, "result": record})
+        return 404, to_bytes({"error": "Not found"})
+
+    async def __call__(
+        self, scope: Message, receive: Receive, send: Send
+    ) -> None:
+        """Serve one ASGI connection scope."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        # Drain the request body (form-encoded crime queries)
+        while (await receive()).get("more_body"):
+            pass
+
+        config = self.config
+        delay = config.latency + self.rng.uniform(0, config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers = [(b"content-type", b"application/json")]
+        if config.error_rate and self.rng.random() < config.error_rate:
+            status = self.rng.choice(config.error_statuses)
+            body = to_bytes({"error": "Injected failure"})
+            if status == 429:
+                headers.append((b"retry-after", b"0"))
+        else:
+            status, body = self.route(scope["path"])
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _run(config: dict, port: int) -> None:
+    """Serve the fake API with uvicorn (in a child process)."""
+    import uvicorn
+
+    app = FakeAPI(FakeAPIConfig(**config))
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_until_up(port: int, timeout: float) -> None:
+    """Block until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Fake API did not start on port {port}")
+
+
+@contextmanager
+def serve(
+    config: FakeAPIConfig | None = None, timeout: float = 10
+) -> Iterator[Tuple[str, str]]:
+    """Run the fake API in a child process for the duration of a block.
+
+    Args:
+        config: The behaviour of the fake API.
+            Defaults to FakeAPIConfig().
+        timeout: How long (in seconds) to wait for the server to start.
+            Defaults to 10.
+
+    Yields:
+        The Police API and Postcodes.io base URLs to pass to the clients.
+    """
+    port = _free_port()
+    process = multiprocessing.Process(
+        target=_run, args=(asdict(config or FakeAPIConfig()), port)
+    )
+    process.start()
+    try:
+        _wait_until_up(port, timeout)
+        root = f"http://127.0.0.1:{port}"
+        yield f"{root}/api", f"{root}/postcodes"
+    finally:
+        process.terminate()
+        process.join()
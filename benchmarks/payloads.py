@@ -0,0 +1,263 @@
+"""Synthetic and recorded API payloads for the benchmarks.
+
+The synthetic payloads follow the shape of real data.police.uk responses,
+and are deterministic so runs can be compared with each other.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import List
+
+CATEGORIES = [
+    "anti-social-behaviour",
+    "burglary",
+    "criminal-damage-arson",
+    "shoplifting",
+    "vehicle-crime",
+    "violent-crime",
+]
+
+OUTCOMES = [
+    "Investigation complete; no suspect identified",
+    "Under investigation",
+    "Unable to prosecute suspect",
+    "Awaiting court outcome",
+]
+
+
+def crime_record(index: int, rng: random.Random) -> dict:
+    """Build one /crimes-street/all-crime record.
+
+    Args:
+        index: The position of the record, used for its IDs.
+        rng: The random generator to draw values from.
+
+    Returns:
+        A crime record.
+    """
+    street_id = rng.randrange(900000, 1100000)
+    outcome = (
+        {"category": rng.choice(OUTCOMES), "date": "2024-02"}
+        if rng.random() < 0.7
+        else None
+    )
+    return {
+        "category": rng.choice(CATEGORIES),
+        "location_type": "Force",
+        "location": {
+            "latitude": f"{rng.uniform(52.5, 52.7):.6f}",
+            "street": {
+                "id": street_id,
+                "name": f"On or near Street {street_id}",
+            },
+            "longitude": f"{rng.uniform(-1.3, -1.0):.6f}",
+        },
+        "context": "",
+        "outcome_status": outcome,
+        "persistent_id": f"{index:064x}" if outcome else "",
+        "id": 116000000 + index,
+        "location_subtype": "",
+        "month": "2024-01",
+    }
+
+
+def crime_payload(rows: int, seed: int = 0) -> List[dict]:
+    """Build a /crimes-street/all-crime response body.
+
+    Args:
+        rows: The number of crime records.
+        seed: The random seed.
+            Defaults to 0.
+
+    Returns:
+        The list of crime records.
+    """
+    rng = random.Random(seed)
+    return [crime_record(index, rng) for index in range(rows)]
+
+
+def to_bytes(payload: object) -> bytes:
+    """Serialise a payload the way the API sends it."""
+    return json.dumps(payload).encode()
+
+
+def load_recorded(path: str | Path) -> bytes:
+    """Load a response body recorded from the live API.
+
+    Args:
+        path: The path to a saved JSON response body.
+
+    Returns:
+        The raw response bytes.
+    """
+    return Path(path).read_bytes()
+
+
+def forces_payload() -> List[dict]:
+    """Build a /forces response body (the 44 territorial forces)."""
+    return [
+        {"id": f"force-{index:02d}", "name": f"Force {index:02d} Police"}
+        for index in range(44)
+    ]
+
+
+def neighbourhoods_payload(count: int = 60) -> List[dict]:
+    """Build a /{force}/neighbourhoods response body.
+
+    Args:
+        count: The number of neighbourhoods.
+            Defaults to 60.
+
+    Returns:
+        The list of neighbourhood summaries.
+    """
+    return [
+        {"id": f"NC{index:02d}", "name": f"Neighbourhood {index}"}
+        for index in range(count)
+    ]
+
+
+def boundary_payload(points: int = 500, seed: int = 0) -> List[dict]:
+    """Build a /{force}/{id}/boundary response body.
+
+    Args:
+        points: The number of boundary points.
+            Defaults to 500.
+        seed: The random seed.
+            Defaults to 0.
+
+    Returns:
+        The boundary points, roughly on a circle.
+    """
+    import math
+
+    rng = random.Random(seed)
+    return [
+        {
+            "latitude": f"{52.6 + 0.02 * math.sin(angle):.6f}",
+            "longitude": f"{-1.1 + 0.03 * math.cos(angle):.6f}",
+        }
+        for angle in sorted(rng.uniform(0, 2 * math.pi) for _ in range(points))
+    ]
+
+
+def postcode_record(postcode: str = "LE16SE") -> dict:
+    """Build one postcodes.io postcode record."""
+    return {
+        "postcode": postcode,
+        "quality": 1,
+        "eastings": 458850,
+        "northings": 304296,
+        "country": "England",
+        "nhs_ha": "East Midlands",
+        "longitude": -1.135,
+        "latitude": 52.6389,
+        "european_electoral_region": "East Midlands",
+        "primary_care_trust": "Leicester City",
+        "region": "East Midlands",
+        "lsoa": "Leicester 020A",
+        "msoa": "Leicester 020",
+        "incode": postcode[-3:],
+        "outcode": postcode[:-3],
+        "parliamentary_constituency": "Leicester South",
+        "admin_district": "Leicester",
+        "parish": "Leicester, unparished area",
+        "admin_county": None,
+        "date_of_introduction": "198001",
+        "admin_ward": "Castle",
+        "ced": None,
+        "ccg": "NHS Leicester, Leicestershire and Rutland",
+        "nuts": "Leicester",
+        "pfa": "Leicestershire",
+        "codes": {"admin_district": "E06000016"},
+    }
+
+
+def outcome_payload(rows: int, seed: int = 0) -> List[dict]:
+    """Build an /outcomes-for-crime style body: crimes with their outcomes.
+
+    Each crime carries one to three outcomes, which the DataFrame
+    conversion expands into one row each.
+
+    Args:
+        rows: The number of crimes.
+        seed: The random seed.
+            Defaults to 0.
+
+    Returns:
+        The list of crimes with outcomes.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "crime": crime_record(index, rng),
+            "outcomes": [
+                {
+                    "category": {
+                        "code": f"outcome-{rng.randrange(10)}",
+                        "name": rng.choice(OUTCOMES),
+                    },
+                    "date": "2024-02",
+                    "person_id": None,
+                }
+                for _ in range(rng.randint(1, 3))
+            ],
+        }
+        for index in range(rows)
+    ]
+
+
+def postcode_payload(rows: int) -> List[dict]:
+    """Build the records of a bulk postcodes.io lookup.
+
+    Args:
+        rows: The number of postcode records.
+
+    Returns:
+        The list of postcode records.
+    """
+    return [
+        postcode_record(f"LE{index % 20}{index % 10}{chr(65 + index % 26)}X")
+        for index in range(rows)
+    ]
+
+
+def neighbourhood_payload(rows: int, seed: int = 0) -> List[dict]:
+    """Build detailed /{force}/{id} neighbourhood records.
+
+    Args:
+        rows: The number of neighbourhoods.
+        seed: The random seed.
+            Defaults to 0.
+
+    Returns:
+        The list of neighbourhood records, each with links and locations.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "contact_details": {
+                "email": f"team{index}@example.police.uk",
+                "telephone": "101",
+            },
+            "name": f"Neighbourhood {index}",
+            "description": "<p>A neighbourhood policing team.</p>",
+            "links": [
+                {
+                    "url": f"https://example.police.uk/{index}",
+                    "description": None,
+                    "title": "Team page",
+                }
+            ],
+            "id": f"NC{index:05d}",
+            "centre": {
+                "latitude": f"{rng.uniform(52.5, 52.7):.6f}",
+                "longitude": f"{rng.uniform(-1.3, -1.0):.6f}",
+            },
+            "locations": [],
+            "url_force": f"https://example.police.uk/{index}",
+            "population": str(rng.randrange(1000, 20000)),
+        }
+        for index in range(rows)
+    ]
@@ -1,22 +1,59 @@
-"""Initialisation file for the policedatauk package."""
-
-from policedatauk.api.client import PoliceClient, AsyncPoliceClient
-from policedatauk.exceptions import (
-    PoliceDataError,
-    PoliceAPIError,
-    RateLimitError,
-    NotFoundError,
-    ValidationError,
-    NetworkError,
-)
-
-__all__ = [
-    "PoliceClient",
-    "AsyncPoliceClient",
-    "PoliceDataError",
-    "PoliceAPIError",
-    "RateLimitError",
-    "NotFoundError",
-    "ValidationError",
-    "NetworkError",
-]
+"""Initialisation file for the policedatauk package.
+
+Exports are imported on first access, so `import policedatauk` stays fast
+and only the parts of the package actually used are loaded.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from policedatauk.api.client import AsyncPoliceClient, PoliceClient
+    from policedatauk.api.instrumentation import MetricsRegistry
+    from policedatauk.api.transports import caller_tag
+    from policedatauk.exceptions import (
+        CircuitOpenError,
+        DataNotAvailableError,
+        NetworkError,
+        NotFoundError,
+        PoliceAPIError,
+        PoliceDataError,
+        RateLimitError,
+        ReplayMissError,
+        ValidationError,
+    )
+    from policedatauk.utils import RetryPolicy
+
+# Exported name -> module it is imported from
+_EXPORTS = {
+    "PoliceClient": "policedatauk.api.client",
+    "AsyncPoliceClient": "policedatauk.api.client",
+    "PoliceDataError": "policedatauk.exceptions",
+    "PoliceAPIError": "policedatauk.exceptions",
+    "RateLimitError": "policedatauk.exceptions",
+    "NotFoundError": "policedatauk.exceptions",
+    "ValidationError": "policedatauk.exceptions",
+    "NetworkError": "policedatauk.exceptions",
+    "CircuitOpenError": "policedatauk.exceptions",
+    "DataNotAvailableError": "policedatauk.exceptions",
+    "ReplayMissError": "policedatauk.exceptions",
+    "RetryPolicy": "policedatauk.utils",
+    "caller_tag": "policedatauk.api.transports",
+    "MetricsRegistry": "policedatauk.api.instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    """Import the exported classes and functions on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List the exports alongside the module attributes."""
+    return sorted({*globals(), *__all__})
@@ -1,15 +1,37 @@
 """Initialisation file for the api submodule."""
 
+from .availability import AvailabilityIndex
 from .client import AsyncPoliceClient, PoliceClient
+from .instrumentation import (
+    CacheEvent,
+    Instrumentation,
+    MetricsRegistry,
+    OpenTelemetryHook,
+    RequestEvent,
+    StageEvent,
+)
+from .profiler import Profiler
 from .resources.base import BaseResource
 from .resources.crimes import AsyncCrimes, Crimes
 from .resources.forces import AsyncForces, Forces
 from .resources.neighbourhoods import AsyncNeighbourhoods, Neighbourhoods
 from .resources.postcodes import AsyncPostcodes, Postcodes
+from .resources.stops import AsyncStopsAndSearches, StopsAndSearches
+from .runner import BackgroundLoop, get_background_loop
+from .streets import StreetIndex
+from .versioning import UpdateTracker, VersionedCache
 
 __all__ = [
+    "AvailabilityIndex",
     "AsyncPoliceClient",
     "PoliceClient",
+    "CacheEvent",
+    "Instrumentation",
+    "MetricsRegistry",
+    "OpenTelemetryHook",
+    "RequestEvent",
+    "StageEvent",
+    "Profiler",
     "BaseResource",
     "AsyncCrimes",
     "Crimes",
@@ -19,4 +41,11 @@ __all__ = [
     "Neighbourhoods",
     "AsyncPostcodes",
     "Postcodes",
+    "AsyncStopsAndSearches",
+    "StopsAndSearches",
+    "BackgroundLoop",
+    "get_background_loop",
+    "StreetIndex",
+    "UpdateTracker",
+    "VersionedCache",
 ]
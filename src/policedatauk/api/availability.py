@@ -0,0 +1,144 @@
+"""Availability index module for the policedatauk package."""
+
+import threading
+import time
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, List
+
+from ..exceptions import DataNotAvailableError
+from ..models import AvailableDate
+from ..utils.concurrency import RefreshLock
+
+
+class AvailabilityIndex:
+    """Cached index of the months of crime data published by the API.
+
+    Built from `/crimes-street-dates`, which lists every month of
+    street-level crime data along with the forces that published stop and
+    search data for it. Crime resources given an index consult it before
+    dispatching a request, so months that are not published yet fail
+    locally (or are skipped by bulk methods) without using rate limit
+    budget. The index is refreshed once it is older than `ttl`.
+
+    The index is thread-safe, so the sync resources and their async bulk
+    engine can share one instance, and concurrent async callers that find
+    it stale share a single refresh (see `refresh`).
+
+    Args:
+        ttl: How long (in seconds) the index is trusted before refreshing.
+            Defaults to 3600.
+    """
+
+    def __init__(self, ttl: float = 3600) -> None:
+        """Initialise the AvailabilityIndex class."""
+        self.ttl = ttl
+        self._months: Dict[str, FrozenSet[str]] = {}
+        self._updated_at: float | None = None
+        self._lock = threading.Lock()
+        self._refresh_lock = RefreshLock()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the index is empty or older than its TTL."""
+        with self._lock:
+            return (
+                self._updated_at is None
+                or time.monotonic() - self._updated_at >= self.ttl
+            )
+
+    @property
+    def months(self) -> List[str]:
+        """The published months, oldest first."""
+        with self._lock:
+            return sorted(self._months)
+
+    @property
+    def latest_month(self) -> str | None:
+        """The most recent published month, if any."""
+        months = self.months
+        return months[-1] if months else None
+
+    def update(self, dates: Iterable[AvailableDate]) -> None:
+        """Replace the index with a fresh /crimes-street-dates response.
+
+        Args:
+            dates: The published months.
+        """
+        months = {item.date: frozenset(item.stop_and_search) for item in dates}
+        with self._lock:
+            self._months = months
+            self._updated_at = time.monotonic()
+
+    async def refresh(
+        self, fetch: Callable[[], Awaitable[Iterable[AvailableDate]]]
+    ) -> None:
+        """Refresh the index if it is stale, once for all concurrent callers.
+
+        Callers that find the index stale while a refresh is in flight
+        wait for it rather than sending their own request.
+
+        Args:
+            fetch: Returns the /crimes-street-dates response.
+        """
+        if not self.stale:
+            return
+        async with self._refresh_lock():
+            if self.stale:
+                self.update(await fetch())
+
+    def invalidate(self) -> None:
+        """Mark the index stale, so it is refreshed before the next check."""
+        with self._lock:
+            self._updated_at = None
+
+    def has_crimes(self, month: str) -> bool:
+        """Check whether street-level crime data is published for a month.
+
+        Args:
+            month: The month, in YYYY-MM format.
+
+        Returns:
+            True if the month is in the index.
+        """
+        with self._lock:
+            return month in self._months
+
+    def has_stop_and_search(self, force: str, month: str) -> bool:
+        """Check whether a force published stop and search data for a month.
+
+        Args:
+            force: The ID of the police force.
+            month: The month, in YYYY-MM format.
+
+        Returns:
+            True if the force is listed for the month.
+        """
+        with self._lock:
+            return force in self._months.get(month, frozenset())
+
+    def available_months(self, months: Iterable[str]) -> List[str]:
+        """Filter a multi-month sweep down to the published months.
+
+        Args:
+            months: The months to request, in YYYY-MM format.
+
+        Returns:
+            The published months, in the given order.
+        """
+        with self._lock:
+            return [month for month in months if month in self._months]
+
+    def check(self, month: str) -> None:
+        """Fail locally if a month of crime data is not published.
+
+        Args:
+            month: The month, in YYYY-MM format.
+
+        Raises:
+            DataNotAvailableError: If the month is not in the index.
+        """
+        if not self.has_crimes(month):
+            raise DataNotAvailableError(
+                f"No crime data published for {month} "
+                f"(latest is {self.latest_month}).",
+                month=month,
+            )
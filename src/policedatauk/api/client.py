@@ -1,6 +1,7 @@
 """Overarching API client for the policedatauk package."""
 
-from typing import Final
+from pathlib import Path
+from typing import Dict, Final, Iterable
 
 import httpx
 from pyrate_limiter import (
@@ -11,20 +12,51 @@ from pyrate_limiter import (
     Rate,
 )
 
+from ..models.location import CoordinateMode
+from ..utils import DecoderName, RetryPolicy
+from .availability import AvailabilityIndex
+from .instrumentation import Hook, Instrumentation
+from .profiler import Profiler
+from .resources import ModelBackend, ValidationMode
 from .resources.crimes import AsyncCrimes, Crimes
 from .resources.forces import AsyncForces, Forces
 from .resources.neighbourhoods import AsyncNeighbourhoods, Neighbourhoods
 from .resources.postcodes import AsyncPostcodes, Postcodes
-from .transports import AsyncTransport, Transport
+from .resources.stops import AsyncStopsAndSearches, StopsAndSearches
+from .runner import get_background_loop
+from .streets import StreetIndex
+from .transports import (
+    AsyncReplayTransport,
+    AsyncTransport,
+    Cassette,
+    CircuitBreaker,
+    Hedger,
+    PriorityScheduler,
+    ReplayMode,
+    ReplayTransport,
+    Transport,
+)
+from .versioning import UpdateTracker, VersionedCache
 
 
 class BaseClient:
-    """Shared configuration for both sync and async clients."""
+    """Shared configuration for both sync and async clients.
+
+    Args:
+        police_url: The base URL of the Police API.
+            Defaults to None, which uses POLICE_URL.
+        postcode_url: The base URL of the Postcodes.io postcodes API.
+            Defaults to None, which uses POSTCODE_URL.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, police_url: str | None = None, postcode_url: str | None = None
+    ) -> None:
         """The Base Client."""
         self.POLICE_URL: Final = "https://data.police.uk/api"
         self.POSTCODE_URL: Final = "https://api.postcodes.io/postcodes"
+        self.police_url = police_url or self.POLICE_URL
+        self.postcode_url = postcode_url or self.POSTCODE_URL
         self.DEFAULT_RATES = [
             Rate(30, Duration.SECOND),
             Rate(150, Duration.SECOND * 10),
@@ -32,46 +64,331 @@ class BaseClient:
 
 
 class PoliceClient(BaseClient):
-    """Main class for synchronous UK Police & Postcodes.io API interaction."""
+    """Main class for synchronous UK Police & Postcodes.io API interaction.
+
+    Args:
+        bucket: The rate limit bucket shared by both APIs.
+            Defaults to an in-memory bucket with the Police API rates.
+        retry_policy: The retry rules applied to every request.
+            Defaults to RetryPolicy().
+        circuit_breaker: Whether to fail fast during upstream outages, with
+            one CircuitBreaker per API on `transport.breaker`.
+            Defaults to True.
+        json_decoder: The JSON backend for response bodies: "orjson",
+            "msgspec", "json", or "auto" for the fastest one installed.
+            Defaults to "auto".
+        model_backend: The models returned by the resources: "pydantic",
+            or "msgspec" for the faster Structs in
+            `policedatauk.models.structs` (requires msgspec).
+            Defaults to "pydantic".
+        validate: "full" validates pydantic models item by item, while
+            "trusted" validates each response in one call from the raw
+            bytes, for data that is known to be well formed.
+            Defaults to "full".
+        coordinates: The type of model latitude / longitude fields:
+            "float", or "str" for the raw API strings of earlier versions.
+            Defaults to "float".
+        check_availability: Whether crime methods check the months
+            published by the API (cached as `client.availability`) before
+            sending requests, failing locally with DataNotAvailableError.
+            Bulk stop and search methods also skip unpublished forces.
+            Defaults to False.
+        track_updates: Whether crime methods poll /crime-last-updated
+            (memoised on `client.updates`) to default to the newest
+            published month, rather than assuming the previous month.
+            Defaults to False.
+        cache_size: The number of crime query results to cache on
+            `client.cache`. Entries are versioned by the last update date,
+            so they are only refetched after new data is published; this
+            enables `track_updates`. Defaults to 0 (no caching).
+        index_streets: Whether to index the street ID and coordinates of
+            every fetched crime on `client.streets`, for street ID
+            watchlists with `crimes.get_crimes_at_locations`.
+            Defaults to False.
+        police_url: The base URL of the Police API, e.g. for a mirror or
+            a local stand-in. Defaults to None, the public API.
+        postcode_url: The base URL of the Postcodes.io postcodes API.
+            Defaults to None, the public API.
+        hooks: Callables receiving an event for every request, processing
+            stage and cache lookup, e.g. a MetricsRegistry or an
+            OpenTelemetryHook. More can be added later through
+            `client.instrumentation.add_hook`.
+            Defaults to None.
+        profile: Whether to collect a session summary on `client.profiler`
+            (calls and latency per endpoint, time per processing stage,
+            limiter stalls), printable with `client.profiler.report()`.
+            Defaults to False.
+        cassette: A gzip cassette file to record responses to and replay
+            them from, with no network access or rate limiting, for
+            deterministic offline runs and fast tests.
+            Defaults to None (no recording).
+        replay_mode: How the cassette is used: "auto" replays recorded
+            responses and records the rest, "replay" never touches the
+            network (unrecorded requests raise ReplayMissError), and
+            "record" refetches and re-records every response.
+            Defaults to "auto".
+    """
 
-    def __init__(self, bucket: AbstractBucket | None = None) -> None:
+    def __init__(
+        self,
+        bucket: AbstractBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: bool = True,
+        json_decoder: DecoderName = "auto",
+        model_backend: ModelBackend = "pydantic",
+        validate: ValidationMode = "full",
+        coordinates: CoordinateMode = "float",
+        check_availability: bool = False,
+        track_updates: bool = False,
+        cache_size: int = 0,
+        index_streets: bool = False,
+        police_url: str | None = None,
+        postcode_url: str | None = None,
+        hooks: Iterable[Hook] | None = None,
+        profile: bool = False,
+        cassette: str | Path | None = None,
+        replay_mode: ReplayMode = "auto",
+    ) -> None:
         """Initialise the PoliceClient class."""
-        super().__init__()
+        super().__init__(police_url, postcode_url)
         self.bucket = bucket or InMemoryBucket(self.DEFAULT_RATES)
+        self.profiler = Profiler() if profile else None
+        self.instrumentation = Instrumentation(hooks or ())
+        if self.profiler is not None:
+            self.instrumentation.add_hook(self.profiler)
         self.police_transport = Transport(
-            base_url=self.POLICE_URL,
+            base_url=self.police_url,
             client=httpx.Client(),
             limiter=Limiter(self.bucket),
+            retry_policy=retry_policy,
+            breaker=CircuitBreaker() if circuit_breaker else None,
+            decoder=json_decoder,
+            instrumentation=self.instrumentation,
         )
         self.postcode_transport = Transport(
-            base_url=self.POSTCODE_URL,
+            base_url=self.postcode_url,
             client=httpx.Client(),
             limiter=Limiter(self.bucket),
+            retry_policy=retry_policy,
+            breaker=CircuitBreaker() if circuit_breaker else None,
+            decoder=json_decoder,
+            instrumentation=self.instrumentation,
+        )
+        if cassette is not None:
+            # One cassette for both APIs, keyed by the full request URL
+            self.cassette = Cassette(cassette)
+            self.police_transport = ReplayTransport(
+                self.cassette, self.police_transport, mode=replay_mode
+            )
+            self.postcode_transport = ReplayTransport(
+                self.cassette, self.postcode_transport, mode=replay_mode
+            )
+        else:
+            self.cassette = None
+        options = {
+            "model_backend": model_backend,
+            "validate": validate,
+            "coordinates": coordinates,
+        }
+        # Bulk methods run on the async engine in a background event loop
+        self.runner = get_background_loop()
+        self.async_police_transport = self.police_transport.to_async()
+        self.availability = AvailabilityIndex() if check_availability else None
+        self.updates = UpdateTracker() if track_updates or cache_size else None
+        self.cache = VersionedCache(cache_size) if cache_size else None
+        self.streets = StreetIndex() if index_streets else None
+        self.crimes = Crimes(
+            self.police_transport,
+            async_transport=self.async_police_transport,
+            runner=self.runner,
+            availability=self.availability,
+            updates=self.updates,
+            cache=self.cache,
+            streets=self.streets,
+            **options,
+        )
+        self.forces = Forces(
+            self.police_transport,
+            async_transport=self.async_police_transport,
+            runner=self.runner,
+            **options,
+        )
+        self.stops = StopsAndSearches(
+            self.police_transport,
+            async_transport=self.async_police_transport,
+            runner=self.runner,
+            availability=self.availability,
+            **options,
         )
-        self.crimes = Crimes(self.police_transport)
-        self.forces = Forces(self.police_transport)
-        self.neighbourhoods = Neighbourhoods(self.police_transport)
-        self.postcodes = Postcodes(self.postcode_transport)
+        self.neighbourhoods = Neighbourhoods(
+            self.police_transport,
+            async_transport=self.async_police_transport,
+            runner=self.runner,
+            **options,
+        )
+        self.postcodes = Postcodes(self.postcode_transport, **options)
 
 
 class AsyncPoliceClient(BaseClient):
-    """Main class for Asynchronous UK Police & Postcodes.io API interaction."""
+    """Main class for Asynchronous UK Police & Postcodes.io API interaction.
+
+    Args:
+        bucket: The rate limit bucket shared by both APIs.
+            Defaults to an in-memory bucket with the Police API rates.
+        retry_policy: The retry rules applied to every request.
+            Defaults to RetryPolicy().
+        circuit_breaker: Whether to fail fast during upstream outages, with
+            one CircuitBreaker per API on `transport.breaker`.
+            Defaults to True.
+        json_decoder: The JSON backend for response bodies: "orjson",
+            "msgspec", "json", or "auto" for the fastest one installed.
+            Defaults to "auto".
+        model_backend: The models returned by the resources: "pydantic",
+            or "msgspec" for the faster Structs in
+            `policedatauk.models.structs` (requires msgspec).
+            Defaults to "pydantic".
+        validate: "full" validates pydantic models item by item, while
+            "trusted" validates each response in one call from the raw
+            bytes, for data that is known to be well formed.
+            Defaults to "full".
+        coordinates: The type of model latitude / longitude fields:
+            "float", or "str" for the raw API strings of earlier versions.
+            Defaults to "float".
+        check_availability: Whether crime methods check the months
+            published by the API (cached as `client.availability`) before
+            sending requests, failing locally with DataNotAvailableError.
+            Bulk stop and search methods also skip unpublished forces.
+            Defaults to False.
+        track_updates: Whether crime methods poll /crime-last-updated
+            (memoised on `client.updates`) to default to the newest
+            published month, rather than assuming the previous month.
+            Defaults to False.
+        cache_size: The number of crime query results to cache on
+            `client.cache`. Entries are versioned by the last update date,
+            so they are only refetched after new data is published; this
+            enables `track_updates`. Defaults to 0 (no caching).
+        index_streets: Whether to index the street ID and coordinates of
+            every fetched crime on `client.streets`, for street ID
+            watchlists with `crimes.get_crimes_at_locations`.
+            Defaults to False.
+        priority_weights: The fair-share weight of each caller tag (see
+            `caller_tag`) when queueing for the rate limiter.
+            Defaults to None, which weighs every tag equally.
+        hedging: Whether to duplicate GET requests that are slower than
+            usual for their endpoint and take the first response, with
+            one Hedger per API on `transport.hedger`. Each duplicate uses
+            a spare rate limit slot.
+            Defaults to False.
+        police_url: The base URL of the Police API, e.g. for a mirror or
+            a local stand-in. Defaults to None, the public API.
+        postcode_url: The base URL of the Postcodes.io postcodes API.
+            Defaults to None, the public API.
+        hooks: Callables receiving an event for every request, processing
+            stage and cache lookup, e.g. a MetricsRegistry or an
+            OpenTelemetryHook. More can be added later through
+            `client.instrumentation.add_hook`.
+            Defaults to None.
+        profile: Whether to collect a session summary on `client.profiler`
+            (calls and latency per endpoint, time per processing stage,
+            limiter stalls), printable with `client.profiler.report()`.
+            Defaults to False.
+        cassette: A gzip cassette file to record responses to and replay
+            them from, with no network access or rate limiting, for
+            deterministic offline runs and fast tests.
+            Defaults to None (no recording).
+        replay_mode: How the cassette is used: "auto" replays recorded
+            responses and records the rest, "replay" never touches the
+            network (unrecorded requests raise ReplayMissError), and
+            "record" refetches and re-records every response.
+            Defaults to "auto".
+    """
 
-    def __init__(self, bucket: AbstractBucket | None = None) -> None:
+    def __init__(
+        self,
+        bucket: AbstractBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: bool = True,
+        json_decoder: DecoderName = "auto",
+        model_backend: ModelBackend = "pydantic",
+        validate: ValidationMode = "full",
+        coordinates: CoordinateMode = "float",
+        check_availability: bool = False,
+        track_updates: bool = False,
+        cache_size: int = 0,
+        index_streets: bool = False,
+        priority_weights: Dict[str, float] | None = None,
+        hedging: bool = False,
+        police_url: str | None = None,
+        postcode_url: str | None = None,
+        hooks: Iterable[Hook] | None = None,
+        profile: bool = False,
+        cassette: str | Path | None = None,
+        replay_mode: ReplayMode = "auto",
+    ) -> None:
         """Initialise the PoliceClient class."""
-        super().__init__()
+        super().__init__(police_url, postcode_url)
         self.bucket = bucket or InMemoryBucket(self.DEFAULT_RATES)
+        self.profiler = Profiler() if profile else None
+        self.instrumentation = Instrumentation(hooks or ())
+        if self.profiler is not None:
+            self.instrumentation.add_hook(self.profiler)
+        # One queue for both APIs, as they draw from the same bucket
+        self.scheduler = PriorityScheduler(priority_weights)
         self.police_transport = AsyncTransport(
-            base_url=self.POLICE_URL,
+            base_url=self.police_url,
             client=httpx.AsyncClient(),
             limiter=Limiter(self.bucket),
+            retry_policy=retry_policy,
+            breaker=CircuitBreaker() if circuit_breaker else None,
+            decoder=json_decoder,
+            scheduler=self.scheduler,
+            instrumentation=self.instrumentation,
+            hedger=Hedger() if hedging else None,
         )
         self.postcode_transport = AsyncTransport(
-            base_url=self.POSTCODE_URL,
+            base_url=self.postcode_url,
             client=httpx.AsyncClient(),
             limiter=Limiter(self.bucket),
+            retry_policy=retry_policy,
+            breaker=CircuitBreaker() if circuit_breaker else None,
+            decoder=json_decoder,
+            scheduler=self.scheduler,
+            instrumentation=self.instrumentation,
+            hedger=Hedger() if hedging else None,
+        )
+        if cassette is not None:
+            # One cassette for both APIs, keyed by the full request URL
+            self.cassette = Cassette(cassette)
+            self.police_transport = AsyncReplayTransport(
+                self.cassette, self.police_transport, mode=replay_mode
+            )
+            self.postcode_transport = AsyncReplayTransport(
+                self.cassette, self.postcode_transport, mode=replay_mode
+            )
+        else:
+            self.cassette = None
+        options = {
+            "model_backend": model_backend,
+            "validate": validate,
+            "coordinates": coordinates,
+        }
+        self.availability = AvailabilityIndex() if check_availability else None
+        self.updates = UpdateTracker() if track_updates or cache_size else None
+        self.cache = VersionedCache(cache_size) if cache_size else None
+        self.streets = StreetIndex() if index_streets else None
+        self.crimes = AsyncCrimes(
+            self.police_transport,
+            availability=self.availability,
+            updates=self.updates,
+            cache=self.cache,
+            streets=self.streets,
+            **options,
+        )
+        self.forces = AsyncForces(self.police_transport, **options)
+        self.stops = AsyncStopsAndSearches(
+            self.police_transport, availability=self.availability, **options
+        )
+        self.neighbourhoods = AsyncNeighbourhoods(
+            self.police_transport, **options
         )
-        self.crimes = AsyncCrimes(self.police_transport)
-        self.forces = AsyncForces(self.police_transport)
-        self.neighbourhoods = AsyncNeighbourhoods(self.police_transport)
-        self.postcodes = AsyncPostcodes(self.postcode_transport)
+        self.postcodes = AsyncPostcodes(self.postcode_transport, **options)
@@ -0,0 +1,636 @@
+"""Request instrumentation for the policedatauk package.
+
+The transports and resources report what they do as events:
+
+- RequestEvent: one per request (all of its attempts), with the time
+  spent waiting for the rate limiter, connecting, waiting for the server
+  and downloading, plus bytes transferred and the number of attempts.
+- StageEvent: one per client-side processing stage of a response,
+  i.e. JSON decoding, model validation and Polars conversion.
+- CacheEvent: one per lookup in a response cache, hit or miss.
+
+Events are passed to hooks: any callable taking an event, a
+MetricsRegistry aggregating them Prometheus-style, or an
+OpenTelemetryHook exporting them as spans.
+"""
+
+import threading
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from httpx import URL, Request, RequestNotRead, Response
+
+
+@dataclass
+class RequestEvent:
+    """The timings and sizes of one request, across all of its attempts.
+
+    The connect, server and download phases come from httpx's trace
+    extension, so they are 0 when no connection is made (e.g. a reused
+    keep-alive connection skips connecting, and mocked transports skip
+    all three).
+
+    Args:
+        api: The host of the API, e.g. "data.police.uk".
+        method: The HTTP method.
+        endpoint: The endpoint requested, relative to the API base URL.
+        status: The status of the last response received, or None if no
+            response was received.
+        attempts: The number of attempts made.
+        limiter_wait: The time (in seconds) spent waiting for rate limit
+            slots.
+        connect: The time (in seconds) spent opening connections
+            (TCP and TLS).
+        server: The time (in seconds) from sending each request to
+            receiving the response headers.
+        download: The time (in seconds) spent reading response bodies.
+        total: The wall time (in seconds) of the whole request,
+            including retry backoff.
+        bytes_sent: The size of the request bodies sent.
+        bytes_received: The size of the response bodies received.
+        hedges: The number of duplicate requests sent to cut tail
+            latency (see Hedger).
+        error: The name of the exception raised, if the request failed.
+    """
+
+    api: str
+    method: str
+    endpoint: str
+    status: int | None = None
+    attempts: int = 0
+    limiter_wait: float = 0.0
+    connect: float = 0.0
+    server: float = 0.0
+    download: float = 0.0
+    total: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    hedges: int = 0
+    error: str | None = None
+
+    @property
+    def retries(self) -> int:
+        """The number of attempts after the first."""
+        return max(self.attempts - 1, 0)
+
+
+@dataclass
+class StageEvent:
+    """The time spent on one client-side processing stage of a response.
+
+    Args:
+        stage: The stage: "decode" (JSON decoding), "validate" (model
+            validation; decoding included for the msgspec backend and
+            validate="trusted") or "to_polars" (DataFrame conversion).
+        target: What was processed: the endpoint path for "decode", the
+            model name for "validate" and the rename key (or model name)
+            for "to_polars".
+        seconds: The time spent.
+        items: The number of items processed.
+    """
+
+    stage: str
+    target: str
+    seconds: float
+    items: int
+
+
+@dataclass
+class CacheEvent:
+    """One lookup in a response cache.
+
+    Args:
+        cache: The name of the cache, e.g. "crimes".
+        hit: Whether the lookup was answered from the cache.
+    """
+
+    cache: str
+    hit: bool
+
+
+Event = RequestEvent | StageEvent | CacheEvent
+Hook = Callable[[Event], None]
+
+# The httpx trace steps timed for each RequestEvent phase
+TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "connect",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+
+class RequestTiming:
+    """Collects the measurements of one request while it is in flight.
+
+    Created by the transports for each request when instrumentation is
+    enabled; `trace` / `async_trace` are passed to httpx as the "trace"
+    request extension.
+
+    Args:
+        api: The host of the API.
+        method: The HTTP method.
+        endpoint: The endpoint requested.
+    """
+
+    def __init__(self, api: str, method: str, endpoint: str) -> None:
+        """Initialise the RequestTiming class."""
+        self.event = RequestEvent(api, method.upper(), endpoint)
+        self.started = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+
+    def trace(self, name: str, info: dict) -> None:
+        """Record one event of the httpx "trace" request extension.
+
+        Args:
+            name: The name of the trace event.
+            info: The event details (unused).
+        """
+        parts = name.split(".")
+        if len(parts) != 3 or parts[1] not in TRACE_PHASES:
+            return
+        _, step, edge = parts
+        now = time.perf_counter()
+        if edge == "started":
+            self._marks[step] = now
+        elif edge == "complete" and step in self._marks:
+            phase = TRACE_PHASES[step]
+            elapsed = now - self._marks.pop(step)
+            setattr(self.event, phase, getattr(self.event, phase) + elapsed)
+
+    async def async_trace(self, name: str, info: dict) -> None:
+        """Record an httpx trace event from an asynchronous client."""
+        self.trace(name, info)
+
+    def attempt(self) -> None:
+        """Count a new attempt."""
+        self.event.attempts += 1
+
+    def hedged(self) -> None:
+        """Count a duplicate request."""
+        self.event.hedges += 1
+
+    def waited(self, seconds: float) -> None:
+        """Add time spent waiting for the rate limiter."""
+        self.event.limiter_wait += seconds
+
+    def response(self, response: Response, size: int | None = None) -> None:
+        """Record the status and sizes of a received response.
+
+        Args:
+            response: The response.
+            size: The body size, for streamed responses whose content is
+                not kept. Defaults to None, which measures the content.
+        """
+        self.event.status = response.status_code
+        self.event.bytes_sent += _content_length(response.request)
+        self.event.bytes_received += (
+            len(response.content) if size is None else size
+        )
+
+    def finish(self, error: BaseException | None = None) -> RequestEvent:
+        """Complete the measurements.
+
+        Args:
+            error: The exception the request failed with, if any.
+                Defaults to None.
+
+        Returns:
+            The finished RequestEvent.
+        """
+        self.event.total = time.perf_counter() - self.started
+        if error is not None:
+            self.event.error = type(error).__name__
+        return self.event
+
+
+def _content_length(request: Request) -> int:
+    """Return the size of a request body (0 if it was streamed)."""
+    try:
+        return len(request.content)
+    except RequestNotRead:
+        return 0
+
+
+class Instrumentation:
+    """Dispatches instrumentation events to hooks.
+
+    Shared by a client's transports and resources. With no hooks, the
+    transports skip all measurements, so instrumentation costs nothing
+    until a hook is added.
+
+    Args:
+        hooks: The callables receiving every event, e.g. a
+            MetricsRegistry or an OpenTelemetryHook.
+            Defaults to none.
+    """
+
+    def __init__(self, hooks: Iterable[Hook] = ()) -> None:
+        """Initialise the Instrumentation class."""
+        self.hooks: List[Hook] = list(hooks)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any hooks are registered."""
+        return bool(self.hooks)
+
+    def add_hook(self, hook: Hook) -> None:
+        """Register a hook to receive every subsequent event.
+
+        Args:
+            hook: The callable receiving events.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        """Unregister a hook.
+
+        Args:
+            hook: The hook to remove.
+        """
+        self.hooks.remove(hook)
+
+    def timing(
+        self, base_url: str, method: str, endpoint: str | None
+    ) -> RequestTiming | None:
+        """Start measuring a request, if any hooks are registered.
+
+        Args:
+            base_url: The base URL of the API.
+            method: The HTTP method.
+            endpoint: The endpoint requested.
+
+        Returns:
+            A RequestTiming, or None when instrumentation is disabled.
+        """
+        if not self.hooks:
+            return None
+        return RequestTiming(URL(base_url).host, method, endpoint or "")
+
+    def stage(
+        self, stage: str, target: str, items: int, started: float
+    ) -> None:
+        """Emit a StageEvent for a stage started at `started`.
+
+        Args:
+            stage: The name of the stage.
+            target: What was processed.
+            items: The number of items processed.
+            started: The time.perf_counter() value when the stage started.
+        """
+        if self.hooks:
+            seconds = time.perf_counter() - started
+            self.emit(StageEvent(stage, target, seconds, items))
+
+    def cache(self, cache: str, hit: bool) -> None:
+        """Emit a CacheEvent.
+
+        Args:
+            cache: The name of the cache.
+            hit: Whether the lookup was a hit.
+        """
+        if self.hooks:
+            self.emit(CacheEvent(cache, hit))
+
+    def emit(self, event: Event) -> None:
+        """Pass an event to every hook.
+
+        A failing hook is reported as a RuntimeWarning rather than failing
+        the request it measured.
+
+        Args:
+            event: The event.
+        """
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                warnings.warn(
+                    f"Instrumentation hook {hook!r} failed: {e!r}",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# Histogram bucket upper bounds (in seconds)
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+@dataclass
+class Histogram:
+    """A cumulative histogram of observed values.
+
+    Args:
+        bounds: The bucket upper bounds.
+        counts: The number of observations at or below each bound.
+        count: The number of observations.
+        sum: The sum of the observations.
+    """
+
+    bounds: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Start every bucket at zero."""
+        if not self.counts:
+            self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """In-memory, Prometheus-style aggregation of instrumentation events.
+
+    Pass the registry as a hook. It keeps these metrics:
+
+    - policedatauk_requests_total{api, method, status}
+    - policedatauk_request_retries_total{api}
+    - policedatauk_request_hedges_total{api}
+    - policedatauk_request_bytes_sent_total{api}
+    - policedatauk_request_bytes_received_total{api}
+    - policedatauk_request_seconds{api, phase}: a histogram per phase
+      ("limiter_wait", "connect", "server", "download" and "total")
+    - policedatauk_stage_seconds{stage}: a histogram per stage
+    - policedatauk_stage_items_total{stage}
+    - policedatauk_cache_lookups_total{cache, result}
+
+    Failed requests without a response have the status "error". Read
+    values with `counter` / `histogram`, or export them all in the
+    Prometheus text format with `render`. The registry is thread-safe.
+
+    Args:
+        buckets: The histogram bucket upper bounds (in seconds).
+            Defaults to DEFAULT_BUCKETS.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        """Initialise the MetricsRegistry class."""
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._histograms: Dict[str, Dict[LabelSet, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        """Record an event (the hook interface)."""
+        if isinstance(event, RequestEvent):
+            self._record_request(event)
+        elif isinstance(event, StageEvent):
+            self.observe(
+                "policedatauk_stage_seconds", event.seconds, stage=event.stage
+            )
+            self.inc(
+                "policedatauk_stage_items_total",
+                event.items,
+                stage=event.stage,
+            )
+        elif isinstance(event, CacheEvent):
+            result = "hit" if event.hit else "miss"
+            self.inc(
+                "policedatauk_cache_lookups_total",
+                cache=event.cache,
+                result=result,
+            )
+
+    def _record_request(self, event: RequestEvent) -> None:
+        """Record a RequestEvent."""
+        api = event.api
+        status = "error" if event.status is None else str(event.status)
+        self.inc(
+            "policedatauk_requests_total",
+            api=api,
+            method=event.method,
+            status=status,
+        )
+        self.inc("policedatauk_request_retries_total", event.retries, api=api)
+        self.inc("policedatauk_request_hedges_total", event.hedges, api=api)
+        self.inc(
+            "policedatauk_request_bytes_sent_total", event.bytes_sent, api=api
+        )
+        self.inc(
+            "policedatauk_request_bytes_received_total",
+            event.bytes_received,
+            api=api,
+        )
+        for phase in (
+            "limiter_wait",
+            "connect",
+            "server",
+            "download",
+            "total",
+        ):
+            self.observe(
+                "policedatauk_request_seconds",
+                getattr(event, phase),
+                api=api,
+                phase=phase,
+            )
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increase a counter.
+
+        Args:
+            name: The name of the counter.
+            value: The amount to add.
+                Defaults to 1.
+            **labels: The labels of the series.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add an observation to a histogram.
+
+        Args:
+            name: The name of the histogram.
+            value: The observed value.
+            **labels: The labels of the series.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(self.buckets)
+            series[key].observe(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Return the value of a counter, summed over unspecified labels.
+
+        Args:
+            name: The name of the counter.
+            **labels: The labels to match.
+
+        Returns:
+            The counter value (0 if never increased).
+        """
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(
+                value
+                for key, value in self._counters.get(name, {}).items()
+                if wanted <= set(key)
+            )
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        """Return a copy of one histogram series.
+
+        Args:
+            name: The name of the histogram.
+            **labels: The exact labels of the series.
+
+        Returns:
+            The histogram, or None if nothing was observed.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(key)
+            if histogram is None:
+                return None
+            return Histogram(
+                histogram.bounds,
+                list(histogram.counts),
+                histogram.count,
+                histogram.sum,
+            )
+
+    def render(self) -> str:
+        """Export every metric in the Prometheus text exposition format.
+
+        Returns:
+            The metrics, e.g. to serve from a /metrics endpoint.
+        """
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(series.items()):
+                    bounds = [f"{bound:g}" for bound in histogram.bounds]
+                    for bound, count in zip(bounds, histogram.counts):
+                        le = _labels(key, ("le", bound))
+                        lines.append(f"{name}_bucket{le} {count}")
+                    le = _labels(key, ("le", "+Inf"))
+                    lines.append(f"{name}_bucket{le} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {histogram.sum:g}")
+                    lines.append(
+                        f"{name}_count{_labels(key)} {histogram.count}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: LabelSet, *extra: Tuple[str, str]) -> str:
+    """Format a label set as {name="value",...}."""
+    pairs = [*key, *extra]
+    if not pairs:
+        return ""
+    inner = ",".join(f'{name}="{value}"' for name, value in pairs)
+    return "{" + inner + "}"
+
+
+class OpenTelemetryHook:
+    """Exports instrumentation events as OpenTelemetry spans.
+
+    Each request becomes a client span named after its method, with the
+    phase timings, attempts and sizes as attributes, and each processing
+    stage a span named "policedatauk.<stage>". The spans are recorded
+    after the fact with their measured start and end times, under the
+    caller's current span. Cache lookups become events on the current
+    span. Requires the opentelemetry-api package.
+
+    Args:
+        tracer: The tracer creating the spans.
+            Defaults to the global tracer provider's "policedatauk" tracer.
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed.
+    """
+
+    def __init__(self, tracer: object | None = None) -> None:
+        """Initialise the OpenTelemetryHook class."""
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api"
+            ) from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("policedatauk")
+
+    def __call__(self, event: Event) -> None:
+        """Export an event (the hook interface)."""
+        if isinstance(event, CacheEvent):
+            self._trace.get_current_span().add_event(
+                "policedatauk.cache",
+                {"cache": event.cache, "hit": event.hit},
+            )
+            return
+
+        end = time.time_ns()
+        if isinstance(event, RequestEvent):
+            name = event.method
+            seconds = event.total
+            attributes = {
+                "http.request.method": event.method,
+                "server.address": event.api,
+                "url.path": event.endpoint,
+                "policedatauk.attempts": event.attempts,
+                "policedatauk.hedges": event.hedges,
+                "policedatauk.limiter_wait": event.limiter_wait,
+                "policedatauk.connect": event.connect,
+                "policedatauk.server": event.server,
+                "policedatauk.download": event.download,
+                "policedatauk.bytes_sent": event.bytes_sent,
+                "policedatauk.bytes_received": event.bytes_received,
+            }
+            if event.status is not None:
+                attributes["http.response.status_code"] = event.status
+            if event.error is not None:
+                attributes["error.type"] = event.error
+            kind = self._trace.SpanKind.CLIENT
+        else:
+            name = f"policedatauk.{event.stage}"
+            seconds = event.seconds
+            attributes = {
+                "policedatauk.target": event.target,
+                "policedatauk.items": event.items,
+            }
+            kind = self._trace.SpanKind.INTERNAL
+
+        span = self.tracer.start_span(
+            name,
+            kind=kind,
+            attributes=attributes,
+            start_time=end - int(seconds * 1e9),
+        )
+        if getattr(event, "error", None) is not None:
+            span.set_status(self._trace.StatusCode.ERROR)
+        span.end(end_time=end)
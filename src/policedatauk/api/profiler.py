@@ -0,0 +1,236 @@
+"""Session profiling for the policedatauk package."""
+
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..utils.endpoints import endpoint_template
+from ..utils.profiling import add_listener, remove_listener
+from .instrumentation import CacheEvent, Event, RequestEvent, StageEvent
+
+# Stages reported by the resources; the other stages are helper functions
+# called within them (or before requests, like `buffer_point`)
+RESOURCE_STAGES = ("decode", "validate", "to_polars")
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    if not ordered:
+        return math.nan
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class Profiler:
+    """Summarises where a session's time goes.
+
+    Enabled with `PoliceClient(profile=True)` (or `AsyncPoliceClient`),
+    which registers the profiler as an instrumentation hook on
+    `client.profiler`. It collects:
+
+    - calls, errors, total time and p50 / p95 / p99 latency per endpoint
+      (IDs grouped, e.g. "/{id}/{id}/people");
+    - time inside the processing stages: "decode" (JSON decoding),
+      "validate" (`_to_model_list` and friends), "to_polars"
+      (`pydantic_to_df`, which includes `clean_polars_df`), and the
+      `clean_polars_df`, `buffer_point` and `parse_polygon` helpers;
+    - the number of limiter stalls (requests that waited longer than
+      `stall_threshold` for rate limit slots), and cache hits / misses.
+
+    The time totals are summed over calls, so concurrent requests count
+    in full. Comparing the network, limiter and CPU totals shows what a
+    session is bound by. Helper timings are process-wide, so they include
+    calls made for other clients that are profiled at the same time.
+
+    Args:
+        stall_threshold: The limiter wait (in seconds) above which a
+            request counts as stalled.
+            Defaults to 0.01.
+    """
+
+    def __init__(self, stall_threshold: float = 0.01) -> None:
+        """Initialise the Profiler class."""
+        self.stall_threshold = stall_threshold
+        self._lock = threading.Lock()
+        self.reset()
+        add_listener(self)
+
+    def reset(self) -> None:
+        """Discard everything collected so far."""
+        with self._lock:
+            self._latencies: Dict[Tuple[str, str], List[float]] = {}
+            self._errors: Dict[Tuple[str, str], int] = {}
+            self._bytes: Dict[Tuple[str, str], int] = {}
+            self._stages: Dict[str, List[float]] = {}
+            self._cache = {"hits": 0, "misses": 0}
+            self._limiter_wait = 0.0
+            self._stalls = 0
+
+    def close(self) -> None:
+        """Stop collecting helper function timings."""
+        remove_listener(self)
+
+    def __call__(self, event: Event) -> None:
+        """Record an instrumentation event (the hook interface)."""
+        with self._lock:
+            if isinstance(event, RequestEvent):
+                key = (event.api, endpoint_template(event.endpoint))
+                self._latencies.setdefault(key, []).append(event.total)
+                self._errors[key] = self._errors.get(key, 0) + (
+                    event.error is not None
+                )
+                self._bytes[key] = (
+                    self._bytes.get(key, 0) + event.bytes_received
+                )
+                self._limiter_wait += event.limiter_wait
+                self._stalls += event.limiter_wait > self.stall_threshold
+            elif isinstance(event, StageEvent):
+                self._stages.setdefault(event.stage, []).append(event.seconds)
+            elif isinstance(event, CacheEvent):
+                self._cache["hits" if event.hit else "misses"] += 1
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record one call of a profiled helper function."""
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    def summary(self) -> dict:
+        """Return the session summary as JSON-compatible data.
+
+        Returns:
+            A dict with "endpoints" (per-endpoint calls and latencies, in
+            milliseconds), "stages" (per-stage calls and time), "limiter"
+            (total wait and stalls), "cache" (hits and misses) and "time"
+            (the summed network, limiter and CPU seconds, and "bound",
+            the largest of the three).
+        """
+        with self._lock:
+            endpoints = []
+            for (api, endpoint), latencies in sorted(
+                self._latencies.items(),
+                key=lambda item: -sum(item[1]),
+            ):
+                ordered = sorted(latencies)
+                key = (api, endpoint)
+                endpoints.append(
+                    {
+                        "api": api,
+                        "endpoint": endpoint,
+                        "calls": len(ordered),
+                        "errors": self._errors[key],
+                        "total_s": sum(ordered),
+                        "p50_ms": _percentile(ordered, 50) * 1e3,
+                        "p95_ms": _percentile(ordered, 95) * 1e3,
+                        "p99_ms": _percentile(ordered, 99) * 1e3,
+                        "bytes_received": self._bytes[key],
+                    }
+                )
+            stages = [
+                {
+                    "stage": stage,
+                    "calls": len(seconds),
+                    "total_s": sum(seconds),
+                    "mean_ms": sum(seconds) / len(seconds) * 1e3,
+                }
+                for stage, seconds in sorted(
+                    self._stages.items(), key=lambda item: -sum(item[1])
+                )
+            ]
+            requests = sum(
+                sum(latencies) for latencies in self._latencies.values()
+            )
+            limiter = self._limiter_wait
+            cpu = sum(
+                sum(self._stages.get(stage, []))
+                for stage in (
+                    *RESOURCE_STAGES,
+                    "buffer_point",
+                    "parse_polygon",
+                )
+            )
+            totals = {
+                "network_s": max(requests - limiter, 0.0),
+                "limiter_s": limiter,
+                "cpu_s": cpu,
+            }
+            return {
+                "endpoints": endpoints,
+                "stages": stages,
+                "limiter": {"wait_s": limiter, "stalls": self._stalls},
+                "cache": dict(self._cache),
+                "time": {
+                    **totals,
+                    "bound": (
+                        max(totals, key=totals.get).removesuffix("_s")
+                        if any(totals.values())
+                        else None
+                    ),
+                },
+            }
+
+    def to_json(self, path: str | Path | None = None) -> str:
+        """Export the summary as JSON.
+
+        Args:
+            path: A file to write the JSON to.
+                Defaults to None, which only returns it.
+
+        Returns:
+            The JSON summary.
+        """
+        text = json.dumps(self.summary(), indent=2)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+    def report(self) -> str:
+        """Format the summary as a plain-text table.
+
+        Returns:
+            The report, ready to print.
+        """
+        summary = self.summary()
+        lines = [
+            f"{'endpoint':<40} {'calls':>6} {'errors':>6} {'total s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        ]
+        for row in summary["endpoints"]:
+            lines.append(
+                f"{row['endpoint'][:40]:<40} {row['calls']:6d} "
+                f"{row['errors']:6d} {row['total_s']:8.3f} "
+                f"{row['p50_ms']:8.1f} {row['p95_ms']:8.1f} "
+                f"{row['p99_ms']:8.1f}"
+            )
+        lines.append("")
+        lines.append(
+            f"{'stage':<40} {'calls':>6} {'total s':>15} {'mean ms':>8}"
+        )
+        for row in summary["stages"]:
+            lines.append(
+                f"{row['stage']:<40} {row['calls']:6d} "
+                f"{row['total_s']:15.3f} {row['mean_ms']:8.2f}"
+            )
+        limiter, cache, time = (
+            summary["limiter"],
+            summary["cache"],
+            summary["time"],
+        )
+        lines.append("")
+        lines.append(
+            f"limiter: {limiter['wait_s']:.3f} s waiting, "
+            f"{limiter['stalls']} stalled requests"
+        )
+        lines.append(f"cache: {cache['hits']} hits, {cache['misses']} misses")
+        lines.append(
+            f"time: network {time['network_s']:.3f} s, "
+            f"limiter {time['limiter_s']:.3f} s, "
+            f"cpu {time['cpu_s']:.3f} s"
+            + (f" -> {time['bound']}-bound" if time["bound"] else "")
+        )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Return the report."""
+        return self.report()
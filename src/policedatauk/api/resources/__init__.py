@@ -1,13 +1,16 @@
 """Initialisation file for the resources submodule."""
 
-from .base import BaseResource
+from .base import BaseResource, ModelBackend, ValidationMode
 from .crimes import AsyncCrimes, Crimes
 from .forces import AsyncForces, Forces
 from .neighbourhoods import AsyncNeighbourhoods, Neighbourhoods
 from .postcodes import AsyncPostcodes, Postcodes
+from .stops import AsyncStopsAndSearches, StopsAndSearches
 
 __all__ = [
     "BaseResource",
+    "ModelBackend",
+    "ValidationMode",
     "AsyncCrimes",
     "Crimes",
     "AsyncForces",
@@ -16,4 +19,6 @@ __all__ = [
     "Neighbourhoods",
     "AsyncPostcodes",
     "Postcodes",
+    "AsyncStopsAndSearches",
+    "StopsAndSearches",
 ]
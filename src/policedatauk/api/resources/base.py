@@ -1,35 +1,228 @@
 """Base module for the policedatauk resources / endpoints."""
 
-from typing import List, Type, TypeVar
+from __future__ import annotations
 
-import polars as pl
-from pydantic import BaseModel
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Literal, Type, TypeVar
 
-from ...utils import pydantic_to_df
+from httpx import Response
+from pydantic import BaseModel, TypeAdapter
+
+from ...models.location import CoordinateMode
+from ..transports import AsyncTransport, Transport
+
+if TYPE_CHECKING:
+    import msgspec
+    import polars as pl
 
 PydanticModel = TypeVar("PydanticModel", bound=BaseModel)
+ModelBackend = Literal["pydantic", "msgspec"]
+ValidationMode = Literal["full", "trusted"]
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_class: Type[BaseModel], many: bool) -> TypeAdapter:
+    """Return a cached TypeAdapter for a pydantic model (list)."""
+    return TypeAdapter(List[model_class] if many else model_class)
+
+
+@lru_cache(maxsize=None)
+def _struct_type(model_class: Type[BaseModel], many: bool) -> type:
+    """Return the msgspec Struct type mirroring a pydantic model."""
+    from ...models import structs
+
+    struct = getattr(structs, model_class.__name__)
+    return List[struct] if many else struct
+
+
+@lru_cache(maxsize=None)
+def _struct_decoder(
+    model_class: Type[BaseModel], many: bool
+) -> "msgspec.json.Decoder":
+    """Return a cached msgspec JSON decoder for a model (list)."""
+    import msgspec
+
+    return msgspec.json.Decoder(_struct_type(model_class, many), strict=False)
 
 
 class BaseResource:
-    """Base class for shared logic across all resources / endpoints."""
+    """Base class for shared logic across all resources / endpoints.
+
+    Args:
+        transport: The Transport Client
+        model_backend: The model family returned by the resource.
+            "pydantic" validates into the pydantic models, while "msgspec"
+            decodes straight from the response bytes into the lightweight
+            Structs in `policedatauk.models.structs` (same names and
+            fields), several times faster for large responses.
+            Defaults to "pydantic".
+        validate: How pydantic models are validated. "full" validates
+            each item separately, while "trusted" validates a whole
+            response in one call through a cached TypeAdapter, parsing
+            the raw bytes directly. Use "trusted" for data that has been
+            validated before, e.g. replayed from a response cache.
+            Defaults to "full".
+        coordinates: The type of latitude / longitude fields. "float"
+            parses them to floats, while "str" keeps the raw API strings
+            as in earlier versions (pydantic backend only).
+            Defaults to "float".
+
+    Raises:
+        ValueError: If an option is not recognised, or "str" coordinates
+            are combined with the msgspec backend.
+    """
+
+    def __init__(
+        self,
+        transport: Transport | AsyncTransport,
+        model_backend: ModelBackend = "pydantic",
+        validate: ValidationMode = "full",
+        coordinates: CoordinateMode = "float",
+    ) -> None:
+        """Initialise the BaseResource class."""
+        if model_backend not in ("pydantic", "msgspec"):
+            raise ValueError(f"Unknown model backend: {model_backend!r}")
+        if validate not in ("full", "trusted"):
+            raise ValueError(f"Unknown validation mode: {validate!r}")
+        if coordinates not in ("float", "str"):
+            raise ValueError(f"Unknown coordinate type: {coordinates!r}")
+        if model_backend == "msgspec" and coordinates == "str":
+            raise ValueError('coordinates="str" needs the pydantic backend')
+        if model_backend == "msgspec":
+            # Fail at construction rather than on the first request
+            from ...models import structs  # noqa: F401
+        self.transport = transport
+        self.model_backend = model_backend
+        self.validate = validate
+        self.context = {"coordinates": coordinates}
+
+    def _timed(self) -> float | None:
+        """Start timing a processing stage, if instrumentation is enabled."""
+        instrumentation = self.transport.instrumentation
+        if instrumentation is None or not instrumentation.enabled:
+            return None
+        return time.perf_counter()
+
+    def _record(
+        self, stage: str, target: str, items: int, started: float | None
+    ) -> None:
+        """Report a processing stage started by `_timed`."""
+        if started is not None:
+            self.transport.instrumentation.stage(stage, target, items, started)
+
+    def _record_cache(self, cache: str, hit: bool) -> None:
+        """Report a response cache lookup."""
+        instrumentation = self.transport.instrumentation
+        if instrumentation is not None:
+            instrumentation.cache(cache, hit)
 
     def _to_model(
         self, data: dict, model_class: Type[PydanticModel]
     ) -> PydanticModel:
         """Standardise single object / model parsing and valiation."""
-        return model_class.model_validate(data)
+        started = self._timed()
+        model = self._convert(data, model_class)
+        self._record("validate", model_class.__name__, 1, started)
+        return model
+
+    def _convert(
+        self, data: dict, model_class: Type[PydanticModel]
+    ) -> PydanticModel:
+        """Validate one object into a model of the configured backend."""
+        if self.model_backend == "msgspec":
+            import msgspec
+
+            return msgspec.convert(
+                data, _struct_type(model_class, False), strict=False
+            )
+        return model_class.model_validate(data, context=self.context)
 
     def _to_model_list(
         self, data: list, model_class: Type[PydanticModel]
     ) -> List[PydanticModel]:
         """Standardise lists of objects / models parsing and valiation."""
-        return [model_class.model_validate(item) for item in data]
+        started = self._timed()
+        models = self._convert_list(data, model_class)
+        self._record("validate", model_class.__name__, len(models), started)
+        return models
+
+    def _convert_list(
+        self, data: list, model_class: Type[PydanticModel]
+    ) -> List[PydanticModel]:
+        """Validate a list of objects into models of the configured backend."""
+        if self.model_backend == "msgspec":
+            import msgspec
+
+            return msgspec.convert(
+                data, _struct_type(model_class, True), strict=False
+            )
+        if self.validate == "trusted":
+            return _adapter(model_class, True).validate_python(
+                data, context=self.context
+            )
+        return [
+            model_class.model_validate(item, context=self.context)
+            for item in data
+        ]
+
+    def _parse(
+        self, response: Response, model_class: Type[PydanticModel]
+    ) -> PydanticModel:
+        """Parse a response body holding a single object."""
+        if self.model_backend == "pydantic" and self.validate == "full":
+            return self._to_model(self.transport.decode(response), model_class)
+        # Decoded and validated in one pass, so timed as one stage
+        started = self._timed()
+        if self.model_backend == "msgspec":
+            model = _struct_decoder(model_class, False).decode(
+                response.content
+            )
+        else:
+            model = model_class.model_validate_json(
+                response.content, context=self.context
+            )
+        self._record("validate", model_class.__name__, 1, started)
+        return model
+
+    def _parse_list(
+        self, response: Response, model_class: Type[PydanticModel]
+    ) -> List[PydanticModel]:
+        """Parse a response body holding a list of objects."""
+        if self.model_backend == "pydantic" and self.validate == "full":
+            return self._to_model_list(
+                self.transport.decode(response), model_class
+            )
+        # Decoded and validated in one pass, so timed as one stage
+        started = self._timed()
+        if self.model_backend == "msgspec":
+            models = _struct_decoder(model_class, True).decode(
+                response.content
+            )
+        else:
+            models = _adapter(model_class, True).validate_json(
+                response.content, context=self.context
+            )
+        self._record("validate", model_class.__name__, len(models), started)
+        return models
 
     def _format(
-        self, data: PydanticModel | List[PydanticModel], to_polars: bool
+        self,
+        data: PydanticModel | List[PydanticModel],
+        to_polars: bool,
+        rename_key: str | None = None,
+        columns: Dict[str, list] | None = None,
     ) -> PydanticModel | List[PydanticModel] | pl.DataFrame:
         """Conversion from model/s to Polars if requested."""
         if to_polars:
+            from ...utils.dataframe import pydantic_to_df
+
             items = data if isinstance(data, list) else [data]
-            return pydantic_to_df(items)
+            started = self._timed()
+            df = pydantic_to_df(items, rename_key=rename_key, columns=columns)
+            target = rename_key or (
+                type(items[0]).__name__ if items else "empty"
+            )
+            self._record("to_polars", target, len(items), started)
+            return df
         return data
@@ -1,20 +1,115 @@
 """Crimes module for the policedatauk package."""
 
-from typing import List, Literal, overload
+from __future__ import annotations
 
-import polars as pl
+import copy
+from collections import OrderedDict
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Type,
+    overload,
+)
 
-from ...models import CrimeCategory, CrimeReport, CrimeWithOutcomes
+from ...exceptions import NotFoundError
+from ...models import (
+    AvailableDate,
+    CrimeCategory,
+    CrimeReport,
+    CrimeWithOutcomes,
+    LastUpdated,
+    LocationOutcome,
+)
 from ...utils import (
     buffer_point,
+    gather_limited,
     get_last_month,
     parse_polygon,
     validate_date,
     validate_lat,
     validate_lon,
 )
+from ..availability import AvailabilityIndex
 from ..resources import BaseResource
-from ..transports import AsyncTransport, Transport
+from ..resources.base import PydanticModel
+from ..runner import BackgroundLoop, get_background_loop
+from ..streets import StreetIndex
+from ..transports import AsyncTransport, Priority, Transport
+from ..versioning import UpdateTracker, VersionedCache
+
+if TYPE_CHECKING:
+    import polars as pl
+    from shapely.geometry import Polygon
+
+# Outcomes after which a case can still move on
+OPEN_OUTCOMES = frozenset(
+    {
+        "under-investigation",
+        "awaiting-court-result",
+        "charged",
+        "sent-to-crown-court",
+        "court-result-unavailable",
+        "status-update-unavailable",
+    }
+)
+
+
+def location_params(
+    lat: float | None,
+    lon: float | None,
+    radius: int | None,
+    poly: str | Polygon | None,
+    date: str | None,
+) -> Dict[str, str]:
+    """Build the form data for the polygon-based location endpoints.
+
+    Args:
+        lat: Latitude of the location.
+        lon: Longitude of the location.
+        radius: The radius (in meters) to buffer the location by.
+            None buffers by 1000m.
+        poly: A polygon to search within, used if no lat / lon is given.
+        date: The month to search, or None for the latest month.
+
+    Returns:
+        The "date" and "poly" parameters.
+
+    Raises:
+        ValueError: If neither a polygon nor a lat / lon pair is given.
+    """
+    if not poly and not (lat and lon):
+        raise ValueError(
+            "Either 'poly' or both 'lat' and 'lon' must be provided."
+        )
+
+    if lat and lon:
+        validate_lat(lat)
+        validate_lon(lon)
+        if radius:
+            poly = buffer_point(lat, lon, radius)
+        else:
+            poly = buffer_point(lat, lon, 1000)  # Default 1000m buffer
+
+    if date:
+        validate_date(date)
+    else:
+        date = get_last_month()
+    return {"date": date, "poly": parse_polygon(poly)}
+
+
+def cache_key(endpoint: str, kwargs: Dict[str, dict]) -> Hashable:
+    """Build a hashable cache key from a request's endpoint and params."""
+    return endpoint, tuple(
+        (name, tuple(sorted(value.items())))
+        for name, value in sorted(kwargs.items())
+    )
 
 
 class AsyncCrimes(BaseResource):
@@ -22,11 +117,42 @@ class AsyncCrimes(BaseResource):
 
     Args:
         transport: The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        availability: The index of published months to check before each
+            request. Defaults to None, which sends requests unchecked.
+        updates: The tracker of /crime-last-updated, used for the default
+            month and to version cached responses.
+            Defaults to None, which defaults to the previous month.
+        cache: The cache for crime query results, invalidated when
+            `updates` reports new data. Defaults to None (no caching).
+        streets: The index of street IDs to coordinates, filled from
+            every fetched crime. Defaults to None (no indexing).
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: AsyncTransport) -> None:
+    # The most closed cases kept by get_outcomes_for_crimes
+    max_cached_cases = 100_000
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        max_workers: int = 10,
+        availability: AvailabilityIndex | None = None,
+        updates: UpdateTracker | None = None,
+        cache: VersionedCache | None = None,
+        streets: StreetIndex | None = None,
+        **options,
+    ) -> None:
         """Initialise the AsyncCrimes class."""
-        self.transport = transport
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
+        self._closed_cases: OrderedDict[str, CrimeWithOutcomes] = OrderedDict()
+        self.availability = availability
+        self.updates = updates
+        self.cache = cache
+        self.streets = streets
 
     @overload
     async def get_crimes_by_location(
@@ -38,6 +164,7 @@ class AsyncCrimes(BaseResource):
         poly: str | None = None,
         date: str | None = None,
         to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
@@ -50,6 +177,7 @@ class AsyncCrimes(BaseResource):
         poly: str | None = None,
         date: str | None = None,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[CrimeReport]: ...
 
     async def get_crimes_by_location(
@@ -61,6 +189,7 @@ class AsyncCrimes(BaseResource):
         poly: str | None = None,
         date: str | None = None,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[CrimeReport]:
         """Return a list of crimes at a specific location.
 
@@ -77,267 +206,396 @@ class AsyncCrimes(BaseResource):
                 Defaults to None, which retrieves the latest month.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A list of crime reports for the specified location.
         """
-        params = {}
-        if not poly and not (lat and lon):
-            raise ValueError(
-                "Either 'poly' or both 'lat' and 'lon' must be provided."
-            )
-
-        if lat and lon:
-            validate_lat(lat)
-            validate_lon(lon)
-            if radius:
-                poly = buffer_point(lat, lon, radius)
-            else:
-                poly = buffer_point(lat, lon, 1000)  # Default 1000m buffer
-
-        parsed_poly = parse_polygon(poly)
-
-        if date:
-            validate_date(date)
-        else:
-            date = get_last_month()
-        params["date"] = date
-        params["poly"] = parsed_poly
-        response = await self.transport.request(
-            "POST", "/crimes-street/all-crime", data=params
+        date = date or await self._default_date(priority)
+        params = location_params(lat, lon, radius, poly, date)
+        await self._check_available(params["date"], priority)
+        crimes = await self._query(
+            "/crimes-street/all-crime", CrimeReport, priority, data=params
         )
-        crimes = self._to_model_list(response.json(), CrimeReport)
         return self._format(crimes, to_polars)
 
     @overload
-    async def get_crimes_no_location(
-        force: str,
-        to_polars: Literal[True],
+    def stream_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
         date: str | None = None,
-        category: str | None = None,
-    ) -> pl.DataFrame: ...
+        batch_size: int = 1000,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> AsyncIterator[pl.DataFrame]: ...
 
     @overload
-    async def get_crimes_no_location(
-        force: str,
+    def stream_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
         date: str | None = None,
-        category: str | None = None,
+        batch_size: int = 1000,
         to_polars: Literal[False] = False,
-    ) -> List[CrimeReport]: ...
+        priority: Priority = "normal",
+    ) -> AsyncIterator[List[CrimeReport]]: ...
 
-    async def get_crimes_no_location(
+    async def stream_crimes_by_location(
         self,
-        force: str,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
         date: str | None = None,
-        category: str | None = None,
+        batch_size: int = 1000,
         to_polars: bool = False,
-    ) -> pl.DataFrame | List[CrimeReport]:
-        """Return a list of crimes without a specific location.
+        priority: Priority = "normal",
+    ) -> AsyncIterator[pl.DataFrame | List[CrimeReport]]:
+        """Yield the crimes at a location in batches as they download.
+
+        Like `get_crimes_by_location`, but the response is parsed while
+        it downloads, so memory stays flat for very large areas and each
+        batch can be processed before the rest has arrived. Results are
+        not cached. DataFrame batches only have the columns their crimes
+        fill: combine them with `pl.concat(how="diagonal_relaxed")`.
 
         Args:
-            force: The police force to filter crimes by.
-            category: The crime category to filter by.
-                Defaults to None, which retrieves all categories.
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter crimes by.
+                Defaults to None.
             date: The date for which to retrieve crimes.
-                Defaults to None, which retrieves all crimes.
-            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to None, which retrieves the latest month.
+            batch_size: The number of crimes per batch.
+                Defaults to 1000.
+            to_polars: Whether to yield Polars DataFrames.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
-        Returns:
-            A list of crime reports.
+        Yields:
+            Lists (or DataFrames) of up to `batch_size` crime reports.
         """
-        params = {"force": force}
-        if date:
-            validate_date(date)
-        else:
-            date = get_last_month()
-        params["date"] = date
-        if category:
-            params["category"] = category
-        else:
-            params["category"] = "all-crime"
-        response = await self.transport.request(
-            "POST", "/crimes-no-location", params=params
-        )
-        crimes = self._to_model_list(response.json(), CrimeReport)
+        date = date or await self._default_date(priority)
+        params = location_params(lat, lon, radius, poly, date)
+        await self._check_available(params["date"], priority)
+        batch = []
+        async for item in self.transport.stream(
+            "POST",
+            "/crimes-street/all-crime",
+            priority=priority,
+            data=params,
+        ):
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield self._crime_batch(batch, to_polars)
+                batch = []
+        if batch:
+            yield self._crime_batch(batch, to_polars)
+
+    def _crime_batch(
+        self, items: List[dict], to_polars: bool
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Validate and format one batch of streamed crimes."""
+        crimes = self._to_model_list(items, CrimeReport)
+        if self.streets is not None:
+            self.streets.add(crimes)
         return self._format(crimes, to_polars)
 
     @overload
-    async def get_crime_by_id(
-        crime_id: str | int,
+    async def get_outcomes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
         to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
-    async def get_crime_by_id(
-        crime_id: str | int,
+    async def get_outcomes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
         to_polars: Literal[False] = False,
-    ) -> CrimeWithOutcomes: ...
+        priority: Priority = "normal",
+    ) -> List[LocationOutcome]: ...
 
-    async def get_crime_by_id(
+    async def get_outcomes_by_location(
         self,
-        crime_id: str | int,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
         to_polars: bool = False,
-    ) -> pl.DataFrame | CrimeWithOutcomes:
-        """Return a specific crime report by ID.
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[LocationOutcome]:
+        """Return the outcomes recorded in an area in one request.
+
+        Each outcome carries the crime it belongs to, so this replaces one
+        `get_crime_by_id` lookup per crime with one request per area.
 
         Args:
-            crime_id: The ID of the crime report.
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter outcomes by.
+                Defaults to None.
+            date: The month in which the outcomes were recorded.
+                Defaults to None, which retrieves the latest month.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
-            A specific crime report.
+            A list of outcomes for the specified location.
         """
-        response = await self.transport.request(
-            "POST", f"/outcomes-for-crime/{crime_id}"
+        date = date or await self._default_date(priority)
+        params = location_params(lat, lon, radius, poly, date)
+        await self._check_available(params["date"], priority)
+        outcomes = await self._query(
+            "/outcomes-at-location", LocationOutcome, priority, data=params
         )
-        crimes = self._to_model(response.json(), CrimeWithOutcomes)
-        return self._format(crimes, to_polars)
+        return self._format(outcomes, to_polars, rename_key="outcomes")
 
     @overload
-    async def get_crime_categories(
+    async def get_crimes_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
         to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
-    async def get_crime_categories(
+    async def get_crimes_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
         to_polars: Literal[False] = False,
-    ) -> List[CrimeCategory]: ...
+        priority: Priority = "normal",
+    ) -> List[CrimeReport]: ...
 
-    async def get_crime_categories(
+    async def get_crimes_by_locations(
         self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
         to_polars: bool = False,
-    ) -> pl.DataFrame | List[CrimeCategory]:
-        """Return a list of all crime categories.
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return the crimes within many polygons in bulk.
 
         Args:
+            polys: The polygons to retrieve crimes for.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
 
         Returns:
-            A list of all crime categories.
+            The crime reports for all of the polygons, or none if the
+            availability index shows the month is not published.
         """
-        response = await self.transport.request("POST", "crime-categories")
-        categories = self._to_model_list(response.json(), CrimeCategory)
-        return self._format(categories, to_polars)
-
-
-class Crimes(BaseResource):
-    """Crime-related Synchronous API methods for the UK Police API.
-
-    Args:
-        transport (Transport): The Transport Client
-    """
+        if date:
+            validate_date(date)
+        # Poll the data version once, before the requests fan out
+        await self._data_version(priority)
+        date = date or await self._default_date(priority)
+        index = await self._refresh_availability(priority)
+        if index is not None and not index.has_crimes(date):
+            return self._format([], to_polars)
 
-    def __init__(self, transport: Transport, max_workers: int = 10) -> None:
-        """Initialise the Crimes class."""
-        self.transport = transport
-        self.max_workers = max_workers
+        tasks = [
+            self.get_crimes_by_location(
+                poly=poly, date=date, priority=priority
+            )
+            for poly in polys
+        ]
+        results = await gather_limited(tasks, self.max_workers)
+        crimes = list(chain.from_iterable(results))
+        return self._format(crimes, to_polars)
 
     @overload
-    def get_crimes_by_location(
+    async def get_crimes_at_location(
         self,
+        location_id: int,
         *,
-        lat: float | None = None,
-        lon: float | None = None,
-        radius: int | None = None,
-        poly: str | None = None,
         date: str | None = None,
         to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
-    def get_crimes_by_location(
+    async def get_crimes_at_location(
         self,
+        location_id: int,
         *,
-        lat: float | None = None,
-        lon: float | None = None,
-        radius: int | None = None,
-        poly: str | None = None,
         date: str | None = None,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[CrimeReport]: ...
 
-    def get_crimes_by_location(
+    async def get_crimes_at_location(
         self,
+        location_id: int,
         *,
-        lat: float | None = None,
-        lon: float | None = None,
-        radius: int | None = None,
-        poly: str | None = None,
         date: str | None = None,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[CrimeReport]:
-        """Return a list of crimes at a specific location.
+        """Return the crimes snapped to a specific street location.
+
+        Street IDs are the `location.street.id` of fetched crimes (the
+        `street_id` column of crime DataFrames).
 
         Args:
-            lat: Latitude of the location.
-                Defaults to None.
-            lon: Longitude of the location.
-                Defaults to None.
-            radius: The radius (in meters) to buffer the location.
-                Defaults to None.
-            poly: A polygon to filter crimes by.
-                Defaults to None.
+            location_id: The ID of the street location.
             date: The date for which to retrieve crimes.
                 Defaults to None, which retrieves the latest month.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
-            A list of crime reports for the specified location.
+            A list of crime reports for the street location.
         """
-        params = {}
-        if not poly and not (lat and lon):
-            raise ValueError(
-                "Either 'poly' or both 'lat' and 'lon' must be provided."
-            )
+        if date:
+            validate_date(date)
+        else:
+            date = await self._default_date(priority)
+        await self._check_available(date, priority)
+        crimes = await self._query(
+            "/crimes-at-location",
+            CrimeReport,
+            priority,
+            method="GET",
+            params={"location_id": str(location_id), "date": date},
+        )
+        return self._format(crimes, to_polars)
+
+    @overload
+    async def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[CrimeReport]: ...
+
+    async def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return the crimes at many street locations in bulk.
 
-        if lat and lon:
-            validate_lat(lat)
-            validate_lon(lon)
-            if radius:
-                poly = buffer_point(lat, lon, radius)
-            else:
-                poly = buffer_point(lat, lon, 1000)  # Default 1000m buffer
+        One request is sent per unique street ID, at most `max_workers` at
+        a time, so a watchlist only fetches the crimes it asks for rather
+        than everything in a buffered area around each street.
 
-        parsed_poly = parse_polygon(poly)
+        Args:
+            location_ids: The IDs of the street locations.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
 
+        Returns:
+            The crime reports for all of the street locations, or none if
+            the availability index shows the month is not published.
+        """
         if date:
             validate_date(date)
-        else:
-            date = get_last_month()
-        params["date"] = date
-        params["poly"] = parsed_poly
-        response = self.transport.request(
-            "POST", "/crimes-street/all-crime", data=params
-        )
-        crimes = self._to_model_list(response.json(), CrimeReport)
+        # Poll the data version once, before the requests fan out
+        await self._data_version(priority)
+        date = date or await self._default_date(priority)
+        index = await self._refresh_availability(priority)
+        if index is not None and not index.has_crimes(date):
+            return self._format([], to_polars)
+
+        tasks = [
+            self.get_crimes_at_location(
+                location_id, date=date, priority=priority
+            )
+            for location_id in dict.fromkeys(location_ids)
+        ]
+        results = await gather_limited(tasks, self.max_workers)
+        crimes = list(chain.from_iterable(results))
         return self._format(crimes, to_polars)
 
     @overload
-    def get_crimes_no_location(
+    async def get_crimes_no_location(
         force: str,
         to_polars: Literal[True],
         date: str | None = None,
         category: str | None = None,
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
-    def get_crimes_no_location(
+    async def get_crimes_no_location(
         force: str,
         date: str | None = None,
         category: str | None = None,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[CrimeReport]: ...
 
-    def get_crimes_no_location(
+    async def get_crimes_no_location(
         self,
         force: str,
         date: str | None = None,
         category: str | None = None,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[CrimeReport]:
         """Return a list of crimes without a specific location.
 
@@ -349,6 +607,8 @@ class Crimes(BaseResource):
                 Defaults to None, which retrieves all crimes.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A list of crime reports.
@@ -357,34 +617,37 @@ class Crimes(BaseResource):
         if date:
             validate_date(date)
         else:
-            date = get_last_month()
+            date = await self._default_date(priority)
         params["date"] = date
+        await self._check_available(params["date"], priority)
         if category:
             params["category"] = category
         else:
             params["category"] = "all-crime"
-        response = self.transport.request(
-            "POST", "/crimes-no-location", params=params
+        crimes = await self._query(
+            "/crimes-no-location", CrimeReport, priority, params=params
         )
-        crimes = self._to_model_list(response.json(), CrimeReport)
         return self._format(crimes, to_polars)
 
     @overload
-    def get_crime_by_id(
+    async def get_crime_by_id(
         crime_id: str | int,
         to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
-    def get_crime_by_id(
+    async def get_crime_by_id(
         crime_id: str | int,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> CrimeWithOutcomes: ...
 
-    def get_crime_by_id(
+    async def get_crime_by_id(
         self,
         crime_id: str | int,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | CrimeWithOutcomes:
         """Return a specific crime report by ID.
 
@@ -392,16 +655,912 @@ class Crimes(BaseResource):
             crime_id: The ID of the crime report.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A specific crime report.
         """
-        response = self.transport.request(
-            "POST", f"/outcomes-for-crime/{crime_id}"
+        response = await self.transport.request(
+            "POST", f"/outcomes-for-crime/{crime_id}", priority=priority
         )
-        crimes = self._to_model(response.json(), CrimeWithOutcomes)
+        crimes = self._parse(response, CrimeWithOutcomes)
         return self._format(crimes, to_polars)
 
+    @overload
+    async def get_outcomes_for_crimes(
+        self,
+        persistent_ids: Iterable[str],
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_outcomes_for_crimes(
+        self,
+        persistent_ids: Iterable[str],
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[CrimeWithOutcomes]: ...
+
+    async def get_outcomes_for_crimes(
+        self,
+        persistent_ids: Iterable[str],
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[CrimeWithOutcomes]:
+        """Return the outcome histories of many crimes in bulk.
+
+        Duplicate IDs are fetched once, and crimes the API does not know
+        about are skipped. Closed cases (see `is_closed_case`) are cached,
+        as their outcomes rarely change, so repeated enrichment of the same
+        month only refetches cases that were still open. The cache evicts
+        the least recently used cases, and hands out copies so callers
+        cannot modify the cached cases.
+
+        Args:
+            persistent_ids: The persistent IDs of the crimes.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with one row per outcome.
+                Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The crimes with their outcomes, in the order first requested.
+        """
+        unique_ids = list(dict.fromkeys(persistent_ids))
+        cached: Dict[str, CrimeWithOutcomes] = {}
+        for crime_id in unique_ids:
+            if crime_id in self._closed_cases:
+                self._closed_cases.move_to_end(crime_id)
+                cached[crime_id] = copy.deepcopy(self._closed_cases[crime_id])
+        missing = [i for i in unique_ids if i not in cached]
+        tasks = [
+            self._get_outcomes_or_none(crime_id, priority)
+            for crime_id in missing
+        ]
+        fetched = dict(
+            zip(missing, await gather_limited(tasks, self.max_workers))
+        )
+
+        for crime_id, case in fetched.items():
+            if case is not None and self.is_closed_case(case):
+                self._closed_cases[crime_id] = copy.deepcopy(case)
+        while len(self._closed_cases) > self.max_cached_cases:
+            self._closed_cases.popitem(last=False)
+
+        cases = [
+            cached[crime_id] if crime_id in cached else fetched[crime_id]
+            for crime_id in unique_ids
+        ]
+        cases = [case for case in cases if case is not None]
+        return self._format(cases, to_polars, rename_key="outcomes")
+
+    async def _get_outcomes_or_none(
+        self, crime_id: str, priority: Priority
+    ) -> CrimeWithOutcomes | None:
+        """Fetch the outcomes of a crime, or None if it is not found."""
+        try:
+            return await self.get_crime_by_id(crime_id, priority=priority)
+        except NotFoundError:
+            return None
+
+    @staticmethod
+    def is_closed_case(case: CrimeWithOutcomes) -> bool:
+        """Check whether a crime's latest outcome is final.
+
+        Args:
+            case: The crime with its outcomes.
+
+        Returns:
+            False if the crime has no outcomes yet, or its latest outcome is
+            one of OPEN_OUTCOMES (e.g. still under investigation).
+        """
+        if not case.outcomes:
+            return False
+        latest = max(case.outcomes, key=lambda outcome: outcome.date)
+        return latest.category.code not in OPEN_OUTCOMES
+
+    @overload
+    async def get_last_updated(
+        self, to_polars: Literal[True], priority: Priority = "normal"
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_last_updated(
+        self, to_polars: Literal[False] = False, priority: Priority = "normal"
+    ) -> LastUpdated: ...
+
+    async def get_last_updated(
+        self,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | LastUpdated:
+        """Return the date crime data was last published.
+
+        Args:
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            The last update date, e.g. "2024-02-01".
+        """
+        response = await self.transport.request(
+            "GET", "/crime-last-updated", priority=priority
+        )
+        model = self._parse(response, LastUpdated)
+        return self._format(model, to_polars)
+
+    async def _data_version(self, priority: Priority) -> str | None:
+        """Return the data version stamp, polling it first if stale."""
+        if self.updates is None:
+            return None
+
+        async def poll() -> str:
+            last_updated = await self.get_last_updated(priority=priority)
+            return last_updated.date
+
+        if await self.updates.refresh(poll) and self.availability:
+            self.availability.invalidate()
+        return self.updates.stamp
+
+    async def _default_date(self, priority: Priority) -> str:
+        """Return the newest published month, or last month if unknown."""
+        await self._data_version(priority)
+        if self.updates is not None and self.updates.latest_month:
+            return self.updates.latest_month
+        return get_last_month()
+
+    async def _query(
+        self,
+        endpoint: str,
+        model_class: Type[PydanticModel],
+        priority: Priority,
+        method: str = "POST",
+        **kwargs,
+    ) -> List[PydanticModel]:
+        """Send a crime query, reusing cached results of the same version."""
+        version = await self._data_version(priority)
+        cacheable = self.cache is not None and version is not None
+        key = cache_key(endpoint, kwargs)
+        if cacheable:
+            cached = self.cache.get(key, version)
+            self._record_cache("crimes", cached is not None)
+            if cached is not None:
+                return cached
+
+        response = await self.transport.request(
+            method, endpoint, priority=priority, **kwargs
+        )
+        models = self._parse_list(response, model_class)
+        if self.streets is not None and model_class is CrimeReport:
+            self.streets.add(models)
+        if cacheable:
+            self.cache.set(key, version, models)
+        return models
+
+    @overload
+    async def get_available_dates(
+        self,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_available_dates(
+        self,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[AvailableDate]: ...
+
+    async def get_available_dates(
+        self,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[AvailableDate]:
+        """Return the months of published street-level crime data.
+
+        Args:
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            The published months, with the forces that published stop and
+            search data for each.
+        """
+        response = await self.transport.request(
+            "GET", "/crimes-street-dates", priority=priority
+        )
+        dates = self._parse_list(response, AvailableDate)
+        return self._format(dates, to_polars)
+
+    async def _refresh_availability(
+        self, priority: Priority
+    ) -> AvailabilityIndex | None:
+        """Return the availability index, refreshing it first if stale."""
+        if self.availability is not None:
+            await self.availability.refresh(
+                lambda: self.get_available_dates(priority=priority)
+            )
+        return self.availability
+
+    async def _check_available(self, month: str, priority: Priority) -> None:
+        """Fail locally if the availability index lacks the month."""
+        index = await self._refresh_availability(priority)
+        if index is not None:
+            index.check(month)
+
+    @overload
+    async def get_crime_categories(
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_crime_categories(
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[CrimeCategory]: ...
+
+    async def get_crime_categories(
+        self,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[CrimeCategory]:
+        """Return a list of all crime categories.
+
+        Args:
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            A list of all crime categories.
+        """
+        response = await self.transport.request(
+            "POST", "crime-categories", priority=priority
+        )
+        categories = self._parse_list(response, CrimeCategory)
+        return self._format(categories, to_polars)
+
+
+class Crimes(BaseResource):
+    """Crime-related Synchronous API methods for the UK Police API.
+
+    Bulk methods run concurrently on the async engine, on a background
+    event loop.
+
+    Args:
+        transport (Transport): The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        async_transport: The async twin of `transport` used by bulk methods.
+            Defaults to None, which builds one with `transport.to_async()`.
+        runner: The background event loop for bulk methods.
+            Defaults to None, which uses the shared background loop.
+        availability: The index of published months to check before each
+            request. Defaults to None, which sends requests unchecked.
+        updates: The tracker of /crime-last-updated, used for the default
+            month and to version cached responses.
+            Defaults to None, which defaults to the previous month.
+        cache: The cache for crime query results, invalidated when
+            `updates` reports new data. Defaults to None (no caching).
+        streets: The index of street IDs to coordinates, filled from
+            every fetched crime. Defaults to None (no indexing).
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        max_workers: int = 10,
+        async_transport: AsyncTransport | None = None,
+        runner: BackgroundLoop | None = None,
+        availability: AvailabilityIndex | None = None,
+        updates: UpdateTracker | None = None,
+        cache: VersionedCache | None = None,
+        streets: StreetIndex | None = None,
+        **options,
+    ) -> None:
+        """Initialise the Crimes class."""
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
+        self.runner = runner or get_background_loop()
+        self.availability = availability
+        self.updates = updates
+        self.cache = cache
+        self.streets = streets
+        self._bulk = AsyncCrimes(
+            async_transport or transport.to_async(),
+            max_workers,
+            availability,
+            updates,
+            cache,
+            streets,
+            **options,
+        )
+
+    @overload
+    def get_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeReport]: ...
+
+    def get_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return a list of crimes at a specific location.
+
+        Args:
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter crimes by.
+                Defaults to None.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of crime reports for the specified location.
+        """
+        date = date or self._default_date()
+        params = location_params(lat, lon, radius, poly, date)
+        self._check_available(params["date"])
+        crimes = self._query(
+            "/crimes-street/all-crime", CrimeReport, data=params
+        )
+        return self._format(crimes, to_polars)
+
+    @overload
+    def stream_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        batch_size: int = 1000,
+        to_polars: Literal[True],
+    ) -> Iterator[pl.DataFrame]: ...
+
+    @overload
+    def stream_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        batch_size: int = 1000,
+        to_polars: Literal[False] = False,
+    ) -> Iterator[List[CrimeReport]]: ...
+
+    def stream_crimes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | None = None,
+        date: str | None = None,
+        batch_size: int = 1000,
+        to_polars: bool = False,
+    ) -> Iterator[pl.DataFrame | List[CrimeReport]]:
+        """Yield the crimes at a location in batches as they download.
+
+        Like `get_crimes_by_location`, but the response is parsed while
+        it downloads, so memory stays flat for very large areas and each
+        batch can be processed before the rest has arrived. Results are
+        not cached. DataFrame batches only have the columns their crimes
+        fill: combine them with `pl.concat(how="diagonal_relaxed")`.
+
+        Args:
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter crimes by.
+                Defaults to None.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            batch_size: The number of crimes per batch.
+                Defaults to 1000.
+            to_polars: Whether to yield Polars DataFrames.
+                Defaults to False.
+
+        Yields:
+            Lists (or DataFrames) of up to `batch_size` crime reports.
+        """
+        date = date or self._default_date()
+        params = location_params(lat, lon, radius, poly, date)
+        self._check_available(params["date"])
+        batch = []
+        for item in self.transport.stream(
+            "POST", "/crimes-street/all-crime", data=params
+        ):
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield self._crime_batch(batch, to_polars)
+                batch = []
+        if batch:
+            yield self._crime_batch(batch, to_polars)
+
+    def _crime_batch(
+        self, items: List[dict], to_polars: bool
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Validate and format one batch of streamed crimes."""
+        crimes = self._to_model_list(items, CrimeReport)
+        if self.streets is not None:
+            self.streets.add(crimes)
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_outcomes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_outcomes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[LocationOutcome]: ...
+
+    def get_outcomes_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[LocationOutcome]:
+        """Return the outcomes recorded in an area in one request.
+
+        Each outcome carries the crime it belongs to, so this replaces one
+        `get_crime_by_id` lookup per crime with one request per area.
+
+        Args:
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter outcomes by.
+                Defaults to None.
+            date: The month in which the outcomes were recorded.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of outcomes for the specified location.
+        """
+        date = date or self._default_date()
+        params = location_params(lat, lon, radius, poly, date)
+        self._check_available(params["date"])
+        outcomes = self._query(
+            "/outcomes-at-location", LocationOutcome, data=params
+        )
+        return self._format(outcomes, to_polars, rename_key="outcomes")
+
+    @overload
+    def get_crimes_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crimes_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeReport]: ...
+
+    def get_crimes_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return the crimes within many polygons in bulk.
+
+        Args:
+            polys: The polygons to retrieve crimes for.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The crime reports for all of the polygons.
+        """
+        crimes = self.runner.run(
+            self._bulk.get_crimes_by_locations(polys, date=date)
+        )
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_crimes_at_location(
+        self,
+        location_id: int,
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crimes_at_location(
+        self,
+        location_id: int,
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeReport]: ...
+
+    def get_crimes_at_location(
+        self,
+        location_id: int,
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return the crimes snapped to a specific street location.
+
+        Street IDs are the `location.street.id` of fetched crimes (the
+        `street_id` column of crime DataFrames).
+
+        Args:
+            location_id: The ID of the street location.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of crime reports for the street location.
+        """
+        if date:
+            validate_date(date)
+        else:
+            date = self._default_date()
+        self._check_available(date)
+        crimes = self._query(
+            "/crimes-at-location",
+            CrimeReport,
+            method="GET",
+            params={"location_id": str(location_id), "date": date},
+        )
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeReport]: ...
+
+    def get_crimes_at_locations(
+        self,
+        location_ids: Iterable[int],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return the crimes at many street locations in bulk.
+
+        One request is sent per unique street ID, at most `max_workers` at
+        a time, so a watchlist only fetches the crimes it asks for rather
+        than everything in a buffered area around each street.
+
+        Args:
+            location_ids: The IDs of the street locations.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The crime reports for all of the street locations.
+        """
+        crimes = self.runner.run(
+            self._bulk.get_crimes_at_locations(location_ids, date=date)
+        )
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_crimes_no_location(
+        force: str,
+        to_polars: Literal[True],
+        date: str | None = None,
+        category: str | None = None,
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crimes_no_location(
+        force: str,
+        date: str | None = None,
+        category: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeReport]: ...
+
+    def get_crimes_no_location(
+        self,
+        force: str,
+        date: str | None = None,
+        category: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[CrimeReport]:
+        """Return a list of crimes without a specific location.
+
+        Args:
+            force: The police force to filter crimes by.
+            category: The crime category to filter by.
+                Defaults to None, which retrieves all categories.
+            date: The date for which to retrieve crimes.
+                Defaults to None, which retrieves all crimes.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of crime reports.
+        """
+        params = {"force": force}
+        if date:
+            validate_date(date)
+        else:
+            date = self._default_date()
+        params["date"] = date
+        self._check_available(params["date"])
+        if category:
+            params["category"] = category
+        else:
+            params["category"] = "all-crime"
+        crimes = self._query("/crimes-no-location", CrimeReport, params=params)
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_crime_by_id(
+        crime_id: str | int,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_crime_by_id(
+        crime_id: str | int,
+        to_polars: Literal[False] = False,
+    ) -> CrimeWithOutcomes: ...
+
+    def get_crime_by_id(
+        self,
+        crime_id: str | int,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | CrimeWithOutcomes:
+        """Return a specific crime report by ID.
+
+        Args:
+            crime_id: The ID of the crime report.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A specific crime report.
+        """
+        response = self.transport.request(
+            "POST", f"/outcomes-for-crime/{crime_id}"
+        )
+        crimes = self._parse(response, CrimeWithOutcomes)
+        return self._format(crimes, to_polars)
+
+    @overload
+    def get_outcomes_for_crimes(
+        self, persistent_ids: Iterable[str], to_polars: Literal[True]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_outcomes_for_crimes(
+        self,
+        persistent_ids: Iterable[str],
+        to_polars: Literal[False] = False,
+    ) -> List[CrimeWithOutcomes]: ...
+
+    def get_outcomes_for_crimes(
+        self, persistent_ids: Iterable[str], to_polars: bool = False
+    ) -> pl.DataFrame | List[CrimeWithOutcomes]:
+        """Return the outcome histories of many crimes in bulk.
+
+        Duplicate IDs are fetched once, and crimes the API does not know
+        about are skipped. Closed cases are cached, as their outcomes rarely
+        change, so repeated enrichment of the same month only refetches
+        cases that were still open.
+
+        Args:
+            persistent_ids: The persistent IDs of the crimes.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with one row per outcome.
+                Defaults to False.
+
+        Returns:
+            The crimes with their outcomes, in the order first requested.
+        """
+        cases = self.runner.run(
+            self._bulk.get_outcomes_for_crimes(persistent_ids)
+        )
+        return self._format(cases, to_polars, rename_key="outcomes")
+
+    @overload
+    def get_last_updated(self, to_polars: Literal[True]) -> pl.DataFrame: ...
+
+    @overload
+    def get_last_updated(
+        self, to_polars: Literal[False] = False
+    ) -> LastUpdated: ...
+
+    def get_last_updated(
+        self, to_polars: bool = False
+    ) -> pl.DataFrame | LastUpdated:
+        """Return the date crime data was last published.
+
+        Args:
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The last update date, e.g. "2024-02-01".
+        """
+        response = self.transport.request("GET", "/crime-last-updated")
+        model = self._parse(response, LastUpdated)
+        return self._format(model, to_polars)
+
+    def _data_version(self) -> str | None:
+        """Return the data version stamp, polling it first if stale."""
+        if self.updates is None:
+            return None
+        if self.updates.stale:
+            last_updated = self.get_last_updated()
+            if self.updates.update(last_updated.date) and self.availability:
+                self.availability.invalidate()
+        return self.updates.stamp
+
+    def _default_date(self) -> str:
+        """Return the newest published month, or last month if unknown."""
+        self._data_version()
+        if self.updates is not None and self.updates.latest_month:
+            return self.updates.latest_month
+        return get_last_month()
+
+    def _query(
+        self,
+        endpoint: str,
+        model_class: Type[PydanticModel],
+        method: str = "POST",
+        **kwargs,
+    ) -> List[PydanticModel]:
+        """Send a crime query, reusing cached results of the same version."""
+        version = self._data_version()
+        cacheable = self.cache is not None and version is not None
+        key = cache_key(endpoint, kwargs)
+        if cacheable:
+            cached = self.cache.get(key, version)
+            self._record_cache("crimes", cached is not None)
+            if cached is not None:
+                return cached
+
+        response = self.transport.request(method, endpoint, **kwargs)
+        models = self._parse_list(response, model_class)
+        if self.streets is not None and model_class is CrimeReport:
+            self.streets.add(models)
+        if cacheable:
+            self.cache.set(key, version, models)
+        return models
+
+    @overload
+    def get_available_dates(
+        self, to_polars: Literal[True]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_available_dates(
+        self, to_polars: Literal[False] = False
+    ) -> List[AvailableDate]: ...
+
+    def get_available_dates(
+        self, to_polars: bool = False
+    ) -> pl.DataFrame | List[AvailableDate]:
+        """Return the months of published street-level crime data.
+
+        Args:
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The published months, with the forces that published stop and
+            search data for each.
+        """
+        response = self.transport.request("GET", "/crimes-street-dates")
+        dates = self._parse_list(response, AvailableDate)
+        return self._format(dates, to_polars)
+
+    def _check_available(self, month: str) -> None:
+        """Fail locally if the availability index lacks the month."""
+        if self.availability is None:
+            return
+        if self.availability.stale:
+            self.availability.update(self.get_available_dates())
+        self.availability.check(month)
+
     @overload
     def get_crime_categories(
         to_polars: Literal[True],
@@ -426,5 +1585,5 @@ class Crimes(BaseResource):
             A list of all crime categories.
         """
         response = self.transport.request("POST", "crime-categories")
-        categories = self._to_model_list(response.json(), CrimeCategory)
+        categories = self._parse_list(response, CrimeCategory)
         return self._format(categories, to_polars)
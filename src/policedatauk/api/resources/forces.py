@@ -1,14 +1,17 @@
 """Forces module for the policedatauk package."""
 
-import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, List, Literal, overload
+from __future__ import annotations
 
-import polars as pl
+from typing import TYPE_CHECKING, Any, List, Literal, overload
 
 from ...models import Force, ForceSummary, Person
+from ...utils import gather_limited
 from ..resources import BaseResource
-from ..transports import AsyncTransport, Transport
+from ..runner import BackgroundLoop, get_background_loop
+from ..transports import AsyncTransport, Priority, Transport
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class AsyncForces(BaseResource):
@@ -16,50 +19,76 @@ class AsyncForces(BaseResource):
 
     Args:
         transport: The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: AsyncTransport) -> None:
+    def __init__(
+        self, transport: AsyncTransport, max_workers: int = 10, **options
+    ) -> None:
         """Initialise the AsyncForces class."""
-        self.transport = transport
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
 
     @overload
     async def get_all_forces(
-        self, to_polars: Literal[True]
+        self,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_all_forces(
-        self, to_polars: Literal[False] = False
+        self,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[ForceSummary]: ...
 
     async def get_all_forces(
-        self, to_polars: bool = False
+        self,
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[ForceSummary]:
         """Return a list of all police forces (basic summary only).
 
         Args:
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             All police forces (basic summary only).
         """
-        response = await self.transport.request("GET", "/forces")
-        forces = self._to_model_list(response.json(), ForceSummary)
+        response = await self.transport.request(
+            "GET", "/forces", priority=priority
+        )
+        forces = self._parse_list(response, ForceSummary)
         return self._format(forces, to_polars)
 
     @overload
     async def get_specific_force(
-        self, force_id: str, to_polars: Literal[True]
+        self,
+        force_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_specific_force(
-        self, force_id: str, to_polars: Literal[False] = False
+        self,
+        force_id: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> Force: ...
 
     async def get_specific_force(
-        self, force_id: str, to_polars: bool = False
+        self,
+        force_id: str,
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | Force:
         """Return a specific police force by ID.
 
@@ -67,27 +96,40 @@ class AsyncForces(BaseResource):
             force_id: The ID of the police force.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A specific police force.
         """
 
-        response = await self.transport.request("GET", f"/forces/{force_id}")
-        model = self._to_model(response.json(), Force)
+        response = await self.transport.request(
+            "GET", f"/forces/{force_id}", priority=priority
+        )
+        model = self._parse(response, Force)
         return self._format(model, to_polars)
 
     @overload
     async def get_specific_forces(
-        self, force_ids: List[str], to_polars: Literal[True]
+        self,
+        force_ids: List[str],
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_specific_forces(
-        self, force_id: str, to_polars: Literal[False] = False
+        self,
+        force_id: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[Force]: ...
 
     async def get_specific_forces(
-        self, force_ids: List[str], to_polars: bool = False
+        self,
+        force_ids: List[str],
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[Force]:
         """Return a list of police forces by ID in bulk.
 
@@ -95,27 +137,43 @@ class AsyncForces(BaseResource):
             force_ids: A list of police force IDs.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             Specific police forces.
         """
-        tasks = [self.get_specific_force(force_id) for force_id in force_ids]
-        forces = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            self.get_specific_force(force_id, priority=priority)
+            for force_id in force_ids
+        ]
+        forces = await gather_limited(
+            tasks, self.max_workers, return_exceptions=True
+        )
         valid_forces = [force for force in forces if isinstance(force, Force)]
         return self._format(valid_forces, to_polars)
 
     @overload
     async def get_people(
-        self, force_id: str, to_polars: Literal[True]
+        self,
+        force_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_people(
-        self, force_id: str, to_polars: Literal[False] = False
+        self,
+        force_id: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[Person]: ...
 
     async def get_people(
-        self, force_id: str, to_polars: bool = False
+        self,
+        force_id: str,
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[Person]:
         """Return a list of people (officers) in a specific police force.
 
@@ -123,28 +181,52 @@ class AsyncForces(BaseResource):
             force_id: The ID of the police force.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             People (officers) in a specific police force.
         """
         response = await self.transport.request(
-            "GET", f"/forces/{force_id}/people"
+            "GET", f"/forces/{force_id}/people", priority=priority
         )
-        models = self._to_model_list(response.json(), Person)
+        models = self._parse_list(response, Person)
         return self._format(models, to_polars)
 
 
 class Forces(BaseResource):
     """Force-related Synchronous API methods for the UK Police API.
 
+    Bulk methods run concurrently on the async engine, on a background
+    event loop.
+
     Args:
         transport (Transport): The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        async_transport: The async twin of `transport` used by bulk methods.
+            Defaults to None, which builds one with `transport.to_async()`.
+        runner: The background event loop for bulk methods.
+            Defaults to None, which uses the shared background loop.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: Transport, max_workers: int = 10) -> None:
+    def __init__(
+        self,
+        transport: Transport,
+        max_workers: int = 10,
+        async_transport: AsyncTransport | None = None,
+        runner: BackgroundLoop | None = None,
+        **options,
+    ) -> None:
         """Initialise the Forces class."""
-        self.transport = transport
+        super().__init__(transport, **options)
         self.max_workers = max_workers
+        self.runner = runner or get_background_loop()
+        self._bulk = AsyncForces(
+            async_transport or transport.to_async(), max_workers, **options
+        )
 
     @overload
     def get_all_forces(self, to_polars: Literal[True]) -> pl.DataFrame: ...
@@ -167,7 +249,7 @@ class Forces(BaseResource):
             All police forces (basic summary only).
         """
         response = self.transport.request("GET", "/forces")
-        forces = self._to_model_list(response.json(), ForceSummary)
+        forces = self._parse_list(response, ForceSummary)
         return self._format(forces, to_polars)
 
     @overload
@@ -195,7 +277,7 @@ class Forces(BaseResource):
         """
 
         response = self.transport.request("GET", f"/forces/{force_id}")
-        model = self._to_model(response.json(), Force)
+        model = self._parse(response, Force)
         return self._format(model, to_polars)
 
     @overload
@@ -221,23 +303,9 @@ class Forces(BaseResource):
         Returns:
             Specific police forces.
         """
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self.get_specific_force, force_id, False
-                ): force_id
-                for force_id in force_ids
-            }
-            valid_forces = []
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if isinstance(result, Force):
-                        valid_forces.append(result)
-                except Exception as e:
-                    # Eventually log failure for specific IDs
-                    pass
-
+        valid_forces = self.runner.run(
+            self._bulk.get_specific_forces(force_ids)
+        )
         return self._format(valid_forces, to_polars)
 
     @overload
@@ -264,5 +332,5 @@ class Forces(BaseResource):
             People (officers) in a specific police force.
         """
         response = self.transport.request("GET", f"/forces/{force_id}/people")
-        models = self._to_model_list(response.json(), Person)
+        models = self._parse_list(response, Person)
         return self._format(models, to_polars)
@@ -1,20 +1,142 @@
 """Neighbourhood module for the policedatauk package."""
 
-import json
-from typing import Any, List, Literal, Tuple, overload
+from __future__ import annotations
 
-import polars as pl
-from shapely.geometry import Polygon, mapping
+import asyncio
+import json
+from itertools import chain
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    overload,
+)
 
+from ...exceptions import NotFoundError, PoliceDataError
 from ...models import (
     Neighbourhood,
+    NeighbourhoodEvent,
+    NeighbourhoodPriority,
     NeighbourhoodResult,
     NeighbourhoodSummary,
     Person,
 )
-from ...utils import pydantic_to_df, validate_lat, validate_lon
+from ...utils import gather_limited, validate_lat, validate_lon
 from ..resources import BaseResource
-from ..transports import AsyncTransport, Transport
+from ..runner import BackgroundLoop, get_background_loop
+from ..transports import AsyncTransport, Priority, Transport
+
+if TYPE_CHECKING:
+    import polars as pl
+    from shapely.geometry import Polygon
+
+# Results of a per-neighbourhood method, keyed by (force, neighbourhood ID)
+ByNeighbourhood = Dict[Tuple[str, str], list]
+
+# Grid cell key of a snapped (lat, lon) pair, or None for missing values
+GridKey = Tuple[float, float] | None
+
+
+def snap_points(
+    lats: Sequence[float | None],
+    lons: Sequence[float | None],
+    precision: int,
+) -> List[GridKey]:
+    """Snap coordinates to a grid of `precision` decimal places.
+
+    Args:
+        lats: The latitudes.
+        lons: The longitudes.
+        precision: The decimal places kept, e.g. 4 for a ~11m grid.
+
+    Returns:
+        The grid cell of each point, or None if a coordinate is missing.
+    """
+    return [
+        None
+        if lat is None or lon is None
+        else (round(lat, precision), round(lon, precision))
+        for lat, lon in zip(lats, lons)
+    ]
+
+
+def join_neighbourhoods(
+    points: pl.DataFrame | Iterable[Tuple[float, float]],
+    results: List[NeighbourhoodResult | None],
+) -> pl.DataFrame | List[NeighbourhoodResult | None]:
+    """Attach located neighbourhoods to the input points.
+
+    Args:
+        points: The input DataFrame or coordinate pairs.
+        results: The neighbourhood of each point, in order.
+
+    Returns:
+        The DataFrame with force and neighbourhood columns added, or the
+        results themselves for coordinate pair input.
+    """
+    import polars as pl
+
+    if not isinstance(points, pl.DataFrame):
+        return results
+    return points.with_columns(
+        pl.Series(
+            "force",
+            [result.force if result else None for result in results],
+            dtype=pl.Utf8,
+        ),
+        pl.Series(
+            "neighbourhood",
+            [result.neighbourhood if result else None for result in results],
+            dtype=pl.Utf8,
+        ),
+    )
+
+
+def by_neighbourhood_columns(
+    results: ByNeighbourhood,
+) -> Tuple[list, Dict[str, list]]:
+    """Flatten per-neighbourhood results into models and key columns.
+
+    Args:
+        results: The results, keyed by (force, neighbourhood ID).
+
+    Returns:
+        The models, and the force / neighbourhood_id column of each.
+    """
+    keys = [key for key, models in results.items() for _ in models]
+    models = list(chain.from_iterable(results.values()))
+    columns = {
+        "force": [force for force, _ in keys],
+        "neighbourhood_id": [neighbourhood for _, neighbourhood in keys],
+    }
+    return models, columns
+
+
+def _succeeded(pairs: Iterable[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]:
+    """Drop the (key, result) pairs whose request failed.
+
+    Raises:
+        BaseException: The first result that is not a PoliceDataError.
+    """
+    pairs = list(pairs)
+    for _, result in pairs:
+        if isinstance(result, BaseException) and not isinstance(
+            result, PoliceDataError
+        ):
+            raise result
+    return [
+        (key, result)
+        for key, result in pairs
+        if not isinstance(result, BaseException)
+    ]
 
 
 class AsyncNeighbourhoods(BaseResource):
@@ -22,45 +144,66 @@ class AsyncNeighbourhoods(BaseResource):
 
     Args:
         transport: The Transport Client
+        max_workers: The maximum concurrent neighbourhoods fetched by bulk
+            methods. Defaults to 10.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: AsyncTransport) -> None:
+    def __init__(
+        self, transport: AsyncTransport, max_workers: int = 10, **options
+    ) -> None:
         """Initialise the AsyncNeighbourhoods class."""
-        self.transport = transport
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
 
     @overload
     async def get_all_neighbourhoods(
-        self, force: str, to_polars: Literal[True]
+        self,
+        force: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_all_neighbourhoods(
-        self, force: str, to_polars: Literal[False] = False
+        self,
+        force: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[NeighbourhoodSummary]: ...
 
     async def get_all_neighbourhoods(
         self,
         force: str,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[NeighbourhoodSummary]:
         """Return a list of all neighbourhoods (basic summary only).
         Args:
             force: The ID of the police force.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             All neighbourhoods for a force (basic summary only).
         """
         response = await self.transport.request(
-            "GET", f"/{force}/neighbourhoods"
+            "GET", f"/{force}/neighbourhoods", priority=priority
         )
-        models = self._to_model_list(response.json(), NeighbourhoodSummary)
+        models = self._parse_list(response, NeighbourhoodSummary)
         return self._format(models, to_polars)
 
     @overload
     async def get_neighbourhood(
-        self, *, force: str, neighbourhood_id: str, to_polars: Literal[True]
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
@@ -70,6 +213,7 @@ class AsyncNeighbourhoods(BaseResource):
         force: str,
         neighbourhood_id: str,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> Neighbourhood: ...
 
     async def get_neighbourhood(
@@ -78,6 +222,7 @@ class AsyncNeighbourhoods(BaseResource):
         force: str,
         neighbourhood_id: str,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | Neighbourhood:
         """Return a specific neighbourhood by ID.
 
@@ -86,32 +231,39 @@ class AsyncNeighbourhoods(BaseResource):
             neighbourhood_id: The ID of the neighbourhood.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A specific neighbourhood.
         """
         response = await self.transport.request(
-            "GET", f"/{force}/{neighbourhood_id}"
+            "GET", f"/{force}/{neighbourhood_id}", priority=priority
         )
-        model = self._to_model(response.json(), Neighbourhood)
+        model = self._parse(response, Neighbourhood)
         return self._format(model, to_polars)
 
     async def get_boundary(
-        self, force: str, neighbourhood_id: str
+        self,
+        force: str,
+        neighbourhood_id: str,
+        priority: Priority = "normal",
     ) -> Tuple[str, Polygon]:
         """Returns the boundary of a specific neighbourhood by ID.
 
         Args:
             force: The ID of the police force.
             neighbourhood_id: The ID of the neighbourhood.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             A tuple containing the GeoJSON string and Shapely Polygon.
         """
         response = await self.transport.request(
-            "GET", f"/{force}/{neighbourhood_id}/boundary"
+            "GET", f"/{force}/{neighbourhood_id}/boundary", priority=priority
         )
-        boundary_data = response.json()
+        boundary_data = self.transport.decode(response)
 
         coords = [
             (float(point["longitude"]), float(point["latitude"]))
@@ -122,6 +274,8 @@ class AsyncNeighbourhoods(BaseResource):
         if coords and coords[0] != coords[-1]:
             coords.append(coords[0])
 
+        from shapely.geometry import Polygon, mapping
+
         polygon = Polygon(coords)
 
         geojson = {
@@ -140,12 +294,22 @@ class AsyncNeighbourhoods(BaseResource):
 
     @overload
     async def locate_neighbourhood(
-        self, *, lat: float, lon: float, to_polars: Literal[True]
+        self,
+        *,
+        lat: float,
+        lon: float,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def locate_neighbourhood(
-        self, *, lat: float, lon: float, to_polars: Literal[False] = False
+        self,
+        *,
+        lat: float,
+        lon: float,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> NeighbourhoodResult: ...
 
     async def locate_neighbourhood(
@@ -154,6 +318,7 @@ class AsyncNeighbourhoods(BaseResource):
         lat: float,
         lon: float,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | NeighbourhoodResult:
         """Return the neighbourhood for a specific latitude and longitude.
 
@@ -162,6 +327,8 @@ class AsyncNeighbourhoods(BaseResource):
             lon: The longitude of the location.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             The neighbourhood for the specific latitude and longitude.
@@ -172,16 +339,102 @@ class AsyncNeighbourhoods(BaseResource):
         params = {"q": f"{lat},{lon}"}
 
         response = await self.transport.request(
-            "GET",
-            "/locate-neighbourhood",
-            params=params,
+            "GET", "/locate-neighbourhood", params=params, priority=priority
         )
-        model = self._to_model(response.json(), NeighbourhoodResult)
+        model = self._parse(response, NeighbourhoodResult)
         return self._format(model, to_polars)
 
+    @overload
+    async def locate_neighbourhoods(
+        self,
+        points: pl.DataFrame,
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def locate_neighbourhoods(
+        self,
+        points: Iterable[Tuple[float, float]],
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+        priority: Priority = "normal",
+    ) -> List[NeighbourhoodResult | None]: ...
+
+    async def locate_neighbourhoods(
+        self,
+        points: pl.DataFrame | Iterable[Tuple[float, float]],
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[NeighbourhoodResult | None]:
+        """Return the neighbourhoods of many points in bulk.
+
+        Points are snapped to a grid of `precision` decimal places, so
+        near-duplicates share one lookup (sent from the snapped point), and
+        the unique lookups run with at most `max_workers` in flight.
+
+        Args:
+            points: A DataFrame with latitude / longitude columns, or
+                (lat, lon) pairs.
+            precision: The decimal places of the grid. 4 (~11m) is well
+                below neighbourhood sizes. Defaults to 4.
+            lat_col: The latitude column of a DataFrame.
+                Defaults to "latitude".
+            lon_col: The longitude column of a DataFrame.
+                Defaults to "longitude".
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The DataFrame with force and neighbourhood columns added, or
+            the neighbourhood of each pair. Points outside every
+            neighbourhood, or with missing coordinates, get None.
+        """
+        import polars as pl
+
+        if isinstance(points, pl.DataFrame):
+            lats, lons = points[lat_col].to_list(), points[lon_col].to_list()
+        else:
+            points = list(points)
+            lats = [lat for lat, _ in points]
+            lons = [lon for _, lon in points]
+        keys = snap_points(lats, lons, precision)
+        cells = [key for key in dict.fromkeys(keys) if key is not None]
+        located = await gather_limited(
+            [self._locate_or_none(lat, lon, priority) for lat, lon in cells],
+            self.max_workers,
+        )
+        by_cell = dict(zip(cells, located))
+        results = [by_cell.get(key) if key else None for key in keys]
+        return join_neighbourhoods(points, results)
+
+    async def _locate_or_none(
+        self, lat: float, lon: float, priority: Priority
+    ) -> NeighbourhoodResult | None:
+        """Locate a point, or return None if no neighbourhood covers it."""
+        try:
+            return await self.locate_neighbourhood(
+                lat=lat, lon=lon, priority=priority
+            )
+        except NotFoundError:
+            return None
+
     @overload
     async def get_people(
-        self, *, force_id: str, neighbourhood_id: str, to_polars: Literal[True]
+        self,
+        *,
+        force_id: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
@@ -191,6 +444,7 @@ class AsyncNeighbourhoods(BaseResource):
         force_id: str,
         neighbourhood_id: str,
         to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[Person]: ...
 
     async def get_people(
@@ -199,6 +453,7 @@ class AsyncNeighbourhoods(BaseResource):
         force_id: str,
         neighbourhood_id: str,
         to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[Person]:
         """Return a list of people (officers) in a specific police force.
 
@@ -207,27 +462,379 @@ class AsyncNeighbourhoods(BaseResource):
             neighbourhood_id: The ID of the neighbourhood.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             People (officers) in a specific neighbourhood.
         """
         response = await self.transport.request(
-            "GET", f"/{force_id}/{neighbourhood_id}/people"
+            "GET", f"/{force_id}/{neighbourhood_id}/people", priority=priority
         )
-        models = self._to_model_list(response.json(), Person)
+        models = self._parse_list(response, Person)
         return self._format(models, to_polars)
 
+    async def build_catalogue(
+        self,
+        force: str,
+        path: str | Path | None = None,
+        refresh: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame:
+        """Return the details, people and boundary of every neighbourhood.
+
+        The three requests for each neighbourhood are sent concurrently,
+        for up to `max_workers` neighbourhoods at a time. A neighbourhood
+        whose requests fail keeps its row, with the missing data left null
+        and the reason in the "error" column. With a `path`, the catalogue
+        is saved as a Parquet snapshot (boundaries as WKB) and reloaded
+        from it on later calls, without any requests.
+
+        Args:
+            force: The ID of the police force.
+            path: The Parquet snapshot to reuse or write.
+                Defaults to None, which always fetches.
+            refresh: Whether to refetch even if the snapshot exists.
+                Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            One row per neighbourhood, with the nested details and people
+            as JSON strings and the boundary as WKB (see
+            `utils.catalogue_boundaries`).
+
+        Raises:
+            ValueError: If the snapshot at `path` is of another force.
+        """
+        import polars as pl
+
+        from ...utils.catalogue import (
+            CATALOGUE_SCHEMA,
+            load_catalogue,
+            save_catalogue,
+        )
+
+        if path is not None and not refresh and Path(path).exists():
+            catalogue = load_catalogue(path)
+            others = set(catalogue["force"].unique()) - {force}
+            if others:
+                raise ValueError(
+                    f"The catalogue snapshot {str(path)!r} is of "
+                    f"{', '.join(sorted(others))}, not {force}. Pass "
+                    "refresh=True to overwrite it."
+                )
+            return catalogue
+
+        summaries = await self.get_all_neighbourhoods(force, priority=priority)
+        tasks = [
+            self._catalogue_row(force, summary, priority)
+            for summary in summaries
+        ]
+        rows = await gather_limited(tasks, self.max_workers)
+        catalogue = pl.DataFrame(rows, schema=CATALOGUE_SCHEMA)
+        if path is not None:
+            save_catalogue(catalogue, path)
+        return catalogue
+
+    async def _catalogue_row(
+        self, force: str, summary: NeighbourhoodSummary, priority: Priority
+    ) -> dict:
+        """Fetch one neighbourhood's catalogue data concurrently.
+
+        API and network errors leave the data they affect null, with the
+        first error recorded in the row, rather than failing the catalogue.
+        """
+        results = await asyncio.gather(
+            self.get_neighbourhood(
+                force=force, neighbourhood_id=summary.id, priority=priority
+            ),
+            self.get_people(
+                force_id=force, neighbourhood_id=summary.id, priority=priority
+            ),
+            self.get_boundary(force, summary.id, priority=priority),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for e in errors:
+            if not isinstance(e, PoliceDataError):
+                raise e
+        neighbourhood, people, boundary = (
+            None if isinstance(r, BaseException) else r for r in results
+        )
+        error = f"{type(errors[0]).__name__}: {errors[0]}" if errors else None
+        from ...utils.catalogue import catalogue_row
+
+        # Without its details, a neighbourhood keeps the listed ID and name
+        return catalogue_row(
+            force,
+            summary if neighbourhood is None else neighbourhood,
+            people,
+            None if boundary is None else boundary[1],
+            error=error,
+        )
+
+    @overload
+    async def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[NeighbourhoodEvent]: ...
+
+    async def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[NeighbourhoodEvent]:
+        """Return the upcoming events (e.g. beat meetings) of a neighbourhood.
+
+        Args:
+            force: The ID of the police force.
+            neighbourhood_id: The ID of the neighbourhood.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with the dates parsed to datetimes. Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            The events of the neighbourhood.
+        """
+        response = await self.transport.request(
+            "GET", f"/{force}/{neighbourhood_id}/events", priority=priority
+        )
+        models = self._parse_list(response, NeighbourhoodEvent)
+        return self._format(models, to_polars, rename_key="events")
+
+    @overload
+    async def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> Dict[Tuple[str, str], List[NeighbourhoodEvent]]: ...
+
+    async def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | Dict[Tuple[str, str], List[NeighbourhoodEvent]]:
+        """Return the events of every neighbourhood of one or more forces.
+
+        The neighbourhoods are listed for each force, then fetched with at
+        most `max_workers` requests in flight. Forces and neighbourhoods
+        whose requests fail are left out, rather than failing the rest.
+
+        Args:
+            forces: The ID(s) of the police force(s).
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with force and neighbourhood_id columns and the dates
+                parsed to datetimes. Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The events, keyed by (force, neighbourhood ID).
+        """
+        results = await self._fetch_each_neighbourhood(
+            forces, self.get_events, priority
+        )
+        if not to_polars:
+            return results
+        models, columns = by_neighbourhood_columns(results)
+        return self._format(
+            models, to_polars, rename_key="events", columns=columns
+        )
+
+    @overload
+    async def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[NeighbourhoodPriority]: ...
+
+    async def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[NeighbourhoodPriority]:
+        """Return the policing priorities set for a neighbourhood.
+
+        Args:
+            force: The ID of the police force.
+            neighbourhood_id: The ID of the neighbourhood.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with the dates parsed to datetimes. Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            The priorities of the neighbourhood.
+        """
+        response = await self.transport.request(
+            "GET", f"/{force}/{neighbourhood_id}/priorities", priority=priority
+        )
+        models = self._parse_list(response, NeighbourhoodPriority)
+        return self._format(models, to_polars, rename_key="priorities")
+
+    @overload
+    async def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> Dict[Tuple[str, str], List[NeighbourhoodPriority]]: ...
+
+    async def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | Dict[Tuple[str, str], List[NeighbourhoodPriority]]:
+        """Return the priorities of every neighbourhood of one or more forces.
+
+        The neighbourhoods are listed for each force, then fetched with at
+        most `max_workers` requests in flight. Forces and neighbourhoods
+        whose requests fail are left out, rather than failing the rest.
+
+        Args:
+            forces: The ID(s) of the police force(s).
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with force and neighbourhood_id columns and the dates
+                parsed to datetimes. Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The priorities, keyed by (force, neighbourhood ID).
+        """
+        results = await self._fetch_each_neighbourhood(
+            forces, self.get_priorities, priority
+        )
+        if not to_polars:
+            return results
+        models, columns = by_neighbourhood_columns(results)
+        return self._format(
+            models, to_polars, rename_key="priorities", columns=columns
+        )
+
+    async def _fetch_each_neighbourhood(
+        self,
+        forces: str | Iterable[str],
+        fetch: Callable[..., Awaitable[list]],
+        priority: Priority,
+    ) -> ByNeighbourhood:
+        """Run a per-neighbourhood method for every neighbourhood.
+
+        API and network errors skip the force or neighbourhood they affect,
+        while any other exception is raised once every request has ended.
+        """
+        forces = [forces] if isinstance(forces, str) else list(forces)
+        summaries = await gather_limited(
+            [
+                self.get_all_neighbourhoods(force, priority=priority)
+                for force in forces
+            ],
+            self.max_workers,
+            return_exceptions=True,
+        )
+        keys = [
+            (force, summary.id)
+            for force, neighbourhoods in _succeeded(zip(forces, summaries))
+            for summary in neighbourhoods
+        ]
+        results = await gather_limited(
+            [
+                fetch(force=force, neighbourhood_id=key, priority=priority)
+                for force, key in keys
+            ],
+            self.max_workers,
+            return_exceptions=True,
+        )
+        return dict(_succeeded(zip(keys, results)))
+
 
 class Neighbourhoods(BaseResource):
     """Neighbourhood-related Synchronous API methods for the UK Police API.
 
+    Bulk methods run concurrently on the async engine, on a background
+    event loop.
+
     Args:
         transport: The Transport Client
+        max_workers: The maximum concurrent neighbourhoods fetched by bulk
+            methods. Defaults to 10.
+        async_transport: The async twin of `transport` used by bulk methods.
+            Defaults to None, which builds one with `transport.to_async()`.
+        runner: The background event loop for bulk methods.
+            Defaults to None, which uses the shared background loop.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: Transport) -> None:
+    def __init__(
+        self,
+        transport: Transport,
+        max_workers: int = 10,
+        async_transport: AsyncTransport | None = None,
+        runner: BackgroundLoop | None = None,
+        **options,
+    ) -> None:
         """Initialise the AsyncNeighbourhoods class."""
-        self.transport = transport
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
+        self.runner = runner or get_background_loop()
+        self._bulk = AsyncNeighbourhoods(
+            async_transport or transport.to_async(), max_workers, **options
+        )
 
     @overload
     def get_all_neighbourhoods(
@@ -254,7 +861,7 @@ class Neighbourhoods(BaseResource):
             A list of all neighbourhoods for a force (basic summary only).
         """
         response = self.transport.request("GET", f"/{force}/neighbourhoods")
-        models = self._to_model_list(response.json(), NeighbourhoodSummary)
+        models = self._parse_list(response, NeighbourhoodSummary)
         return self._format(models, to_polars)
 
     @overload
@@ -292,7 +899,7 @@ class Neighbourhoods(BaseResource):
         response = self.transport.request(
             "GET", f"/{force}/{neighbourhood_id}"
         )
-        model = self._to_model(response.json(), Neighbourhood)
+        model = self._parse(response, Neighbourhood)
         return self._format(model, to_polars)
 
     def get_boundary(
@@ -310,7 +917,7 @@ class Neighbourhoods(BaseResource):
         response = self.transport.request(
             "GET", f"/{force}/{neighbourhood_id}/boundary"
         )
-        boundary_data = response.json()
+        boundary_data = self.transport.decode(response)
 
         coords = [
             (float(point["longitude"]), float(point["latitude"]))
@@ -321,6 +928,8 @@ class Neighbourhoods(BaseResource):
         if coords and coords[0] != coords[-1]:
             coords.append(coords[0])
 
+        from shapely.geometry import Polygon, mapping
+
         polygon = Polygon(coords)
 
         geojson = {
@@ -375,9 +984,64 @@ class Neighbourhoods(BaseResource):
             "/locate-neighbourhood",
             params=params,
         )
-        model = self._to_model(response.json(), NeighbourhoodResult)
+        model = self._parse(response, NeighbourhoodResult)
         return self._format(model, to_polars)
 
+    @overload
+    def locate_neighbourhoods(
+        self,
+        points: pl.DataFrame,
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def locate_neighbourhoods(
+        self,
+        points: Iterable[Tuple[float, float]],
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+    ) -> List[NeighbourhoodResult | None]: ...
+
+    def locate_neighbourhoods(
+        self,
+        points: pl.DataFrame | Iterable[Tuple[float, float]],
+        *,
+        precision: int = 4,
+        lat_col: str = "latitude",
+        lon_col: str = "longitude",
+    ) -> pl.DataFrame | List[NeighbourhoodResult | None]:
+        """Return the neighbourhoods of many points in bulk.
+
+        Points are snapped to a grid of `precision` decimal places, so
+        near-duplicates share one lookup (sent from the snapped point), and
+        the unique lookups run concurrently on the async engine.
+
+        Args:
+            points: A DataFrame with latitude / longitude columns, or
+                (lat, lon) pairs.
+            precision: The decimal places of the grid. 4 (~11m) is well
+                below neighbourhood sizes. Defaults to 4.
+            lat_col: The latitude column of a DataFrame.
+                Defaults to "latitude".
+            lon_col: The longitude column of a DataFrame.
+                Defaults to "longitude".
+
+        Returns:
+            The DataFrame with force and neighbourhood columns added, or
+            the neighbourhood of each pair. Points outside every
+            neighbourhood, or with missing coordinates, get None.
+        """
+        return self.runner.run(
+            self._bulk.locate_neighbourhoods(
+                points, precision=precision, lat_col=lat_col, lon_col=lon_col
+            )
+        )
+
     @overload
     def get_people(
         self, *, force_id: str, neighbourhood_id: str, to_polars: Literal[True]
@@ -413,5 +1077,207 @@ class Neighbourhoods(BaseResource):
         response = self.transport.request(
             "GET", f"/{force_id}/{neighbourhood_id}/people"
         )
-        models = self._to_model_list(response.json(), Person)
+        models = self._parse_list(response, Person)
         return self._format(models, to_polars)
+
+    def build_catalogue(
+        self,
+        force: str,
+        path: str | Path | None = None,
+        refresh: bool = False,
+    ) -> pl.DataFrame:
+        """Return the details, people and boundary of every neighbourhood.
+
+        The three requests for each neighbourhood are sent concurrently,
+        for up to `max_workers` neighbourhoods at a time. A neighbourhood
+        whose requests fail keeps its row, with the missing data left null
+        and the reason in the "error" column. With a `path`, the catalogue
+        is saved as a Parquet snapshot (boundaries as WKB) and reloaded
+        from it on later calls, without any requests.
+
+        Args:
+            force: The ID of the police force.
+            path: The Parquet snapshot to reuse or write.
+                Defaults to None, which always fetches.
+            refresh: Whether to refetch even if the snapshot exists.
+                Defaults to False.
+
+        Returns:
+            One row per neighbourhood, with the nested details and people
+            as JSON strings and the boundary as WKB (see
+            `utils.catalogue_boundaries`).
+
+        Raises:
+            ValueError: If the snapshot at `path` is of another force.
+        """
+        return self.runner.run(
+            self._bulk.build_catalogue(force, path=path, refresh=refresh)
+        )
+
+    @overload
+    def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[False] = False,
+    ) -> List[NeighbourhoodEvent]: ...
+
+    def get_events(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[NeighbourhoodEvent]:
+        """Return the upcoming events (e.g. beat meetings) of a neighbourhood.
+
+        Args:
+            force: The ID of the police force.
+            neighbourhood_id: The ID of the neighbourhood.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with the dates parsed to datetimes. Defaults to False.
+
+        Returns:
+            The events of the neighbourhood.
+        """
+        response = self.transport.request(
+            "GET", f"/{force}/{neighbourhood_id}/events"
+        )
+        models = self._parse_list(response, NeighbourhoodEvent)
+        return self._format(models, to_polars, rename_key="events")
+
+    @overload
+    def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[False] = False,
+    ) -> Dict[Tuple[str, str], List[NeighbourhoodEvent]]: ...
+
+    def get_all_events(
+        self,
+        forces: str | Iterable[str],
+        to_polars: bool = False,
+    ) -> pl.DataFrame | Dict[Tuple[str, str], List[NeighbourhoodEvent]]:
+        """Return the events of every neighbourhood of one or more forces.
+
+        The neighbourhoods are listed for each force, then fetched with at
+        most `max_workers` requests in flight. Forces and neighbourhoods
+        whose requests fail are left out, rather than failing the rest.
+
+        Args:
+            forces: The ID(s) of the police force(s).
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with force and neighbourhood_id columns and the dates
+                parsed to datetimes. Defaults to False.
+
+        Returns:
+            The events, keyed by (force, neighbourhood ID).
+        """
+        results = self.runner.run(self._bulk.get_all_events(forces))
+        if not to_polars:
+            return results
+        models, columns = by_neighbourhood_columns(results)
+        return self._format(
+            models, to_polars, rename_key="events", columns=columns
+        )
+
+    @overload
+    def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: Literal[False] = False,
+    ) -> List[NeighbourhoodPriority]: ...
+
+    def get_priorities(
+        self,
+        *,
+        force: str,
+        neighbourhood_id: str,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[NeighbourhoodPriority]:
+        """Return the policing priorities set for a neighbourhood.
+
+        Args:
+            force: The ID of the police force.
+            neighbourhood_id: The ID of the neighbourhood.
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with the dates parsed to datetimes. Defaults to False.
+
+        Returns:
+            The priorities of the neighbourhood.
+        """
+        response = self.transport.request(
+            "GET", f"/{force}/{neighbourhood_id}/priorities"
+        )
+        models = self._parse_list(response, NeighbourhoodPriority)
+        return self._format(models, to_polars, rename_key="priorities")
+
+    @overload
+    def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: Literal[False] = False,
+    ) -> Dict[Tuple[str, str], List[NeighbourhoodPriority]]: ...
+
+    def get_all_priorities(
+        self,
+        forces: str | Iterable[str],
+        to_polars: bool = False,
+    ) -> pl.DataFrame | Dict[Tuple[str, str], List[NeighbourhoodPriority]]:
+        """Return the priorities of every neighbourhood of one or more forces.
+
+        The neighbourhoods are listed for each force, then fetched with at
+        most `max_workers` requests in flight. Forces and neighbourhoods
+        whose requests fail are left out, rather than failing the rest.
+
+        Args:
+            forces: The ID(s) of the police force(s).
+            to_polars: Whether to return the data as a Polars DataFrame,
+                with force and neighbourhood_id columns and the dates
+                parsed to datetimes. Defaults to False.
+
+        Returns:
+            The priorities, keyed by (force, neighbourhood ID).
+        """
+        results = self.runner.run(self._bulk.get_all_priorities(forces))
+        if not to_polars:
+            return results
+        models, columns = by_neighbourhood_columns(results)
+        return self._format(
+            models, to_polars, rename_key="priorities", columns=columns
+        )
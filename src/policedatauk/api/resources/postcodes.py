@@ -1,14 +1,18 @@
 """Postcode module for the policedatauk package."""
 
-from typing import Any, List, Literal, overload
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Literal, overload
 
-import polars as pl
 from httpx import HTTPStatusError
 
 from ...models import PostCode
-from ...utils import pydantic_to_df, validate_lat, validate_lon
+from ...utils import validate_lat, validate_lon
 from ..resources import BaseResource
-from ..transports import AsyncTransport, Transport
+from ..transports import AsyncTransport, Priority, Transport
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class AsyncPostcodes(BaseResource):
@@ -16,38 +20,59 @@ class AsyncPostcodes(BaseResource):
 
     Args:
         transport: The Transport Client
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: AsyncTransport) -> None:
+    def __init__(self, transport: AsyncTransport, **options) -> None:
         """Initialise the AsyncPostcodes class."""
-        self.transport = transport
+        super().__init__(transport, **options)
 
-    async def is_valid_postcode(self, postcode: str) -> bool:
+    async def is_valid_postcode(
+        self,
+        postcode: str,
+        priority: Priority = "normal",
+    ) -> bool:
         """Check if a postcode is valid.
 
         Args:
             postcode: The postcode to check.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             True if the postcode is valid, False otherwise.
         """
         postcode = postcode.replace(" ", "").upper()
-        response = await self.transport.request("GET", f"/{postcode}/validate")
-        data = response.json()
+        response = await self.transport.request(
+            "GET", f"/{postcode}/validate", priority=priority
+        )
+        data = self.transport.decode(response)
         return data.get("result", False)
 
     @overload
     async def get_postcode_info(
-        self, postcode: str, *, to_polars: Literal[True]
+        self,
+        postcode: str,
+        *,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_postcode_info(
-        self, postcode: str, *, to_polars: Literal[False] = False
+        self,
+        postcode: str,
+        *,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> PostCode: ...
 
     async def get_postcode_info(
-        self, postcode: str, to_polars: bool = False
+        self,
+        postcode: str,
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | PostCode:
         """Return detailed information about a postcode.
 
@@ -55,37 +80,56 @@ class AsyncPostcodes(BaseResource):
             postcode: The postcode to get information for.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             The detailed information of the postcode.
         """
         postcode = postcode.replace(" ", "").upper()
-        if not await self.is_valid_postcode(postcode):
+        if not await self.is_valid_postcode(postcode, priority):
             raise ValueError(f"Invalid postcode provided: '{postcode}'")
 
         try:
-            response = await self.transport.request("GET", f"/{postcode}")
+            response = await self.transport.request(
+                "GET", f"/{postcode}", priority=priority
+            )
         except HTTPStatusError as e:
             raise ValueError(
                 f"Postcodes.io API error: {e.response.text}"
             ) from e
 
-        data = response.json().get("result")
+        data = self.transport.decode(response).get("result")
         model = self._to_model(data, PostCode)
         return self._format(model, to_polars)
 
     @overload
     async def get_postcode(
-        self, *, lat: float, lon: float, to_polars: Literal[True]
+        self,
+        *,
+        lat: float,
+        lon: float,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
     ) -> pl.DataFrame: ...
 
     @overload
     async def get_postcode(
-        self, *, lat: float, lon: float, to_polars: Literal[False] = False
+        self,
+        *,
+        lat: float,
+        lon: float,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
     ) -> List[PostCode]: ...
 
     async def get_postcode(
-        self, *, lat: float, lon: float, to_polars: bool = False
+        self,
+        *,
+        lat: float,
+        lon: float,
+        to_polars: bool = False,
+        priority: Priority = "normal",
     ) -> pl.DataFrame | List[PostCode]:
         """Get the postcode for a specific lat/lon.
 
@@ -94,6 +138,8 @@ class AsyncPostcodes(BaseResource):
             lon: The longitude.
             to_polars: Whether to return the data as a Polars DataFrame.
                 Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
 
         Returns:
             PostCode: The postcode.
@@ -104,14 +150,16 @@ class AsyncPostcodes(BaseResource):
         params = {"lat": lat, "lon": lon}
 
         try:
-            response = await self.transport.request("GET", params=params)
+            response = await self.transport.request(
+                "GET", params=params, priority=priority
+            )
         except HTTPStatusError as e:
             raise ValueError(
                 f"Postcodes.io API error: {e.response.text}"
             ) from e
 
         # The API returns null or a list inside 'result'
-        data = response.json().get("result") or []
+        data = self.transport.decode(response).get("result") or []
 
         models = self._to_model_list(data, PostCode)
         return self._format(models, to_polars)
@@ -122,11 +170,13 @@ class Postcodes(BaseResource):
 
     Args:
         transport: The Transport Client
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
     """
 
-    def __init__(self, transport: Transport) -> None:
+    def __init__(self, transport: Transport, **options) -> None:
         """Initialise the Postcodes class."""
-        self.transport = transport
+        super().__init__(transport, **options)
 
     def is_valid_postcode(self, postcode: str) -> bool:
         """Check if a postcode is valid.
@@ -139,7 +189,7 @@ class Postcodes(BaseResource):
         """
         postcode = postcode.replace(" ", "").upper()
         response = self.transport.request("GET", f"/{postcode}/validate")
-        data = response.json()
+        data = self.transport.decode(response)
         return data.get("result", False)
 
     @overload
@@ -176,7 +226,7 @@ class Postcodes(BaseResource):
                 f"Postcodes.io API error: {e.response.text}"
             ) from e
 
-        data = response.json().get("result")
+        data = self.transport.decode(response).get("result")
         model = self._to_model(data, PostCode)
         return self._format(model, to_polars)
 
@@ -217,7 +267,7 @@ class Postcodes(BaseResource):
             ) from e
 
         # The API returns null or a list inside 'result'
-        data = response.json().get("result") or []
+        data = self.transport.decode(response).get("result") or []
 
         models = self._to_model_list(data, PostCode)
         return self._format(models, to_polars)
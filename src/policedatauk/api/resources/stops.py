@@ -0,0 +1,600 @@
+"""Stop and search module for the policedatauk package."""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, List, Literal, overload
+
+from ...models import AvailableDate, StopAndSearch
+from ...utils import gather_limited, validate_date
+from ..availability import AvailabilityIndex
+from ..resources import BaseResource
+from ..runner import BackgroundLoop, get_background_loop
+from ..transports import AsyncTransport, Priority, Transport
+from .crimes import location_params
+
+if TYPE_CHECKING:
+    import polars as pl
+    from shapely.geometry import Polygon
+
+
+class AsyncStopsAndSearches(BaseResource):
+    """Stop and search Asynchronous API methods for the UK Police API.
+
+    Args:
+        transport: The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        availability: The index of published months, used by bulk methods
+            to skip forces without stop and search data for a month.
+            Defaults to None, which requests every force.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport,
+        max_workers: int = 10,
+        availability: AvailabilityIndex | None = None,
+        **options,
+    ) -> None:
+        """Initialise the AsyncStopsAndSearches class."""
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
+        self.availability = availability
+
+    @overload
+    async def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[StopAndSearch]: ...
+
+    async def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches within an area.
+
+        Args:
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter stop and searches by.
+                Defaults to None.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            A list of stop and searches for the specified location.
+        """
+        params = location_params(lat, lon, radius, poly, date)
+        response = await self.transport.request(
+            "POST", "/stops-street", data=params, priority=priority
+        )
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    async def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[StopAndSearch]: ...
+
+    async def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches within many polygons in bulk.
+
+        Args:
+            polys: The polygons to retrieve stop and searches for.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The stop and searches for all of the polygons.
+        """
+        tasks = [
+            self.get_stops_by_location(poly=poly, date=date, priority=priority)
+            for poly in polys
+        ]
+        results = await gather_limited(tasks, self.max_workers)
+        stops = list(chain.from_iterable(results))
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    async def get_stops_by_force(
+        self,
+        force: str,
+        to_polars: Literal[True],
+        date: str | None = None,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_stops_by_force(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[StopAndSearch]: ...
+
+    async def get_stops_by_force(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches reported by a police force.
+
+        Args:
+            force: The ID of the police force.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            A list of stop and searches.
+        """
+        params = {"force": force}
+        if date:
+            validate_date(date)
+            params["date"] = date
+        response = await self.transport.request(
+            "GET", "/stops-force", params=params, priority=priority
+        )
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    async def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[StopAndSearch]: ...
+
+    async def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches reported by many forces in bulk.
+
+        With an availability index, forces that have not published stop
+        and search data for the month are skipped without a request.
+
+        Args:
+            forces: The IDs of the police forces.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the requests.
+                Defaults to "normal".
+
+        Returns:
+            The stop and searches for all of the forces.
+        """
+        if date:
+            validate_date(date)
+        index = await self._refresh_availability(priority)
+        if index is not None:
+            date = date or index.latest_month
+            forces = [
+                force
+                for force in forces
+                if index.has_stop_and_search(force, date)
+            ]
+
+        tasks = [
+            self.get_stops_by_force(force, date=date, priority=priority)
+            for force in forces
+        ]
+        results = await gather_limited(tasks, self.max_workers)
+        stops = list(chain.from_iterable(results))
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    async def get_stops_no_location(
+        self,
+        force: str,
+        to_polars: Literal[True],
+        date: str | None = None,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame: ...
+
+    @overload
+    async def get_stops_no_location(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+        priority: Priority = "normal",
+    ) -> List[StopAndSearch]: ...
+
+    async def get_stops_no_location(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: bool = False,
+        priority: Priority = "normal",
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches of a force without a location.
+
+        Args:
+            force: The ID of the police force.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            A list of stop and searches.
+        """
+        params = {"force": force}
+        if date:
+            validate_date(date)
+            params["date"] = date
+        response = await self.transport.request(
+            "GET", "/stops-no-location", params=params, priority=priority
+        )
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
+
+    async def _refresh_availability(
+        self, priority: Priority
+    ) -> AvailabilityIndex | None:
+        """Return the availability index, refreshing it first if stale."""
+        if self.availability is None:
+            return None
+
+        async def fetch() -> List[AvailableDate]:
+            response = await self.transport.request(
+                "GET", "/crimes-street-dates", priority=priority
+            )
+            return self._parse_list(response, AvailableDate)
+
+        await self.availability.refresh(fetch)
+        return self.availability
+
+
+class StopsAndSearches(BaseResource):
+    """Stop and search Synchronous API methods for the UK Police API.
+
+    Bulk methods run concurrently on the async engine, on a background
+    event loop.
+
+    Args:
+        transport (Transport): The Transport Client
+        max_workers: The maximum concurrent requests for bulk methods.
+            Defaults to 10.
+        async_transport: The async twin of `transport` used by bulk methods.
+            Defaults to None, which builds one with `transport.to_async()`.
+        runner: The background event loop for bulk methods.
+            Defaults to None, which uses the shared background loop.
+        availability: The index of published months, used by bulk methods
+            to skip forces without stop and search data for a month.
+            Defaults to None, which requests every force.
+        **options: Model options passed to BaseResource, e.g.
+            model_backend.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        max_workers: int = 10,
+        async_transport: AsyncTransport | None = None,
+        runner: BackgroundLoop | None = None,
+        availability: AvailabilityIndex | None = None,
+        **options,
+    ) -> None:
+        """Initialise the StopsAndSearches class."""
+        super().__init__(transport, **options)
+        self.max_workers = max_workers
+        self.runner = runner or get_background_loop()
+        self.availability = availability
+        self._bulk = AsyncStopsAndSearches(
+            async_transport or transport.to_async(),
+            max_workers,
+            availability,
+            **options,
+        )
+
+    @overload
+    def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[StopAndSearch]: ...
+
+    def get_stops_by_location(
+        self,
+        *,
+        lat: float | None = None,
+        lon: float | None = None,
+        radius: int | None = None,
+        poly: str | Polygon | None = None,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches within an area.
+
+        Args:
+            lat: Latitude of the location.
+                Defaults to None.
+            lon: Longitude of the location.
+                Defaults to None.
+            radius: The radius (in meters) to buffer the location.
+                Defaults to None.
+            poly: A polygon to filter stop and searches by.
+                Defaults to None.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of stop and searches for the specified location.
+        """
+        params = location_params(lat, lon, radius, poly, date)
+        response = self.transport.request("POST", "/stops-street", data=params)
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[StopAndSearch]: ...
+
+    def get_stops_by_locations(
+        self,
+        polys: List[str | Polygon],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches within many polygons in bulk.
+
+        Args:
+            polys: The polygons to retrieve stop and searches for.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The stop and searches for all of the polygons.
+        """
+        stops = self.runner.run(
+            self._bulk.get_stops_by_locations(polys, date=date)
+        )
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    def get_stops_by_force(
+        self, force: str, to_polars: Literal[True], date: str | None = None
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_stops_by_force(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[StopAndSearch]: ...
+
+    def get_stops_by_force(
+        self, force: str, date: str | None = None, to_polars: bool = False
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches reported by a police force.
+
+        Args:
+            force: The ID of the police force.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of stop and searches.
+        """
+        params = {"force": force}
+        if date:
+            validate_date(date)
+            params["date"] = date
+        response = self.transport.request("GET", "/stops-force", params=params)
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: Literal[True],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[StopAndSearch]: ...
+
+    def get_stops_by_forces(
+        self,
+        forces: List[str],
+        *,
+        date: str | None = None,
+        to_polars: bool = False,
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches reported by many forces in bulk.
+
+        With an availability index, forces that have not published stop
+        and search data for the month are skipped without a request.
+
+        Args:
+            forces: The IDs of the police forces.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            The stop and searches for all of the forces.
+        """
+        stops = self.runner.run(
+            self._bulk.get_stops_by_forces(forces, date=date)
+        )
+        return self._format(stops, to_polars, rename_key="stops")
+
+    @overload
+    def get_stops_no_location(
+        self, force: str, to_polars: Literal[True], date: str | None = None
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_stops_no_location(
+        self,
+        force: str,
+        date: str | None = None,
+        to_polars: Literal[False] = False,
+    ) -> List[StopAndSearch]: ...
+
+    def get_stops_no_location(
+        self, force: str, date: str | None = None, to_polars: bool = False
+    ) -> pl.DataFrame | List[StopAndSearch]:
+        """Return the stop and searches of a force without a location.
+
+        Args:
+            force: The ID of the police force.
+            date: The month for which to retrieve stop and searches.
+                Defaults to None, which retrieves the latest month.
+            to_polars: Whether to return the data as a Polars DataFrame.
+                Defaults to False.
+
+        Returns:
+            A list of stop and searches.
+        """
+        params = {"force": force}
+        if date:
+            validate_date(date)
+            params["date"] = date
+        response = self.transport.request(
+            "GET", "/stops-no-location", params=params
+        )
+        stops = self._parse_list(response, StopAndSearch)
+        return self._format(stops, to_polars, rename_key="stops")
@@ -0,0 +1,145 @@
+"""Street index module for the policedatauk package."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    import polars as pl
+    from shapely.geometry import Polygon
+
+
+class StreetIndex:
+    """Local index of street IDs to their (anonymised) coordinates.
+
+    Crimes are snapped by the API to a fixed set of anonymised street
+    locations, each with an ID usable with `/crimes-at-location`. The index
+    is filled from the crimes fetched by the crime resources, so a watchlist
+    of street IDs can be mapped to coordinates (or an area to street IDs)
+    without further requests.
+
+    The index is thread-safe, so the sync resources and their async bulk
+    engine can share one instance.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the StreetIndex class."""
+        self._streets: Dict[int, Tuple[float, float, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of indexed streets."""
+        with self._lock:
+            return len(self._streets)
+
+    def __contains__(self, street_id: object) -> bool:
+        """Return whether a street ID is indexed."""
+        with self._lock:
+            return street_id in self._streets
+
+    def add(self, crimes: Iterable[object]) -> int:
+        """Index the street locations of fetched crimes.
+
+        Args:
+            crimes: Crime reports (pydantic models or msgspec Structs).
+                Crimes without a location are ignored.
+
+        Returns:
+            The number of newly indexed streets.
+        """
+        streets = {}
+        for crime in crimes:
+            location = crime.location
+            if location is None or "id" not in location.street:
+                continue
+            streets[int(location.street["id"])] = (
+                float(location.latitude),
+                float(location.longitude),
+                location.street.get("name"),
+            )
+        with self._lock:
+            before = len(self._streets)
+            self._streets.update(streets)
+            return len(self._streets) - before
+
+    def get(self, street_id: int) -> Tuple[float, float] | None:
+        """Return the coordinates of a street.
+
+        Args:
+            street_id: The street (location) ID.
+
+        Returns:
+            The (latitude, longitude) of the street, or None if unknown.
+        """
+        with self._lock:
+            street = self._streets.get(street_id)
+        return street[:2] if street else None
+
+    def missing(self, street_ids: Iterable[int]) -> List[int]:
+        """Return the street IDs of a watchlist not in the index.
+
+        Args:
+            street_ids: The street (location) IDs.
+
+        Returns:
+            The unknown street IDs, in the given order.
+        """
+        with self._lock:
+            return [sid for sid in street_ids if sid not in self._streets]
+
+    def within(self, poly: str | Polygon) -> List[int]:
+        """Return the indexed street IDs inside a polygon.
+
+        Args:
+            poly: The polygon, as a shapely Polygon, WKT, or an API
+                "lat,lng:lat,lng" string.
+
+        Returns:
+            The street IDs inside the polygon, sorted.
+        """
+        from shapely import contains_xy, wkt
+        from shapely.geometry import Polygon
+
+        if isinstance(poly, str) and poly.lstrip()[:1].isalpha():
+            poly = wkt.loads(poly)  # e.g. "POLYGON ((lon lat, ...))"
+        elif isinstance(poly, str):
+            points = [
+                tuple(map(float, point.split(",")))
+                for point in poly.strip().split(":")
+            ]
+            poly = Polygon([(lon, lat) for lat, lon in points])
+        with self._lock:
+            ids = list(self._streets)
+            coords = list(self._streets.values())
+        if not ids:
+            return []
+        lats, lons, _ = zip(*coords)
+        inside = contains_xy(poly, lons, lats)
+        return sorted(sid for sid, hit in zip(ids, inside) if hit)
+
+    def to_polars(self) -> pl.DataFrame:
+        """Return the index as a DataFrame.
+
+        Returns:
+            One row per street, with street_id, street_name, latitude and
+            longitude columns.
+        """
+        import polars as pl
+
+        with self._lock:
+            items = list(self._streets.items())
+        return pl.DataFrame(
+            {
+                "street_id": [sid for sid, _ in items],
+                "street_name": [street[2] for _, street in items],
+                "latitude": [street[0] for _, street in items],
+                "longitude": [street[1] for _, street in items],
+            },
+            schema={
+                "street_id": pl.Int64,
+                "street_name": pl.Utf8,
+                "latitude": pl.Float64,
+                "longitude": pl.Float64,
+            },
+        )
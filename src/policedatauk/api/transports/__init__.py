@@ -1,8 +1,27 @@
 """Initialisation file for the resources submodule."""
 
+from .breaker import BreakerState, CircuitBreaker
+from .hedging import Hedger
+from .replay import (
+    AsyncReplayTransport,
+    Cassette,
+    ReplayMode,
+    ReplayTransport,
+)
+from .scheduler import Priority, PriorityScheduler, caller_tag
 from .transports import AsyncTransport, Transport
 
 __all__ = [
+    "BreakerState",
+    "CircuitBreaker",
+    "Hedger",
+    "Priority",
+    "PriorityScheduler",
+    "caller_tag",
+    "AsyncReplayTransport",
+    "Cassette",
+    "ReplayMode",
+    "ReplayTransport",
     "AsyncTransport",
     "Transport",
 ]
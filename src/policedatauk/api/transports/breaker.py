@@ -0,0 +1,201 @@
+"""Circuit breaker module for the policedatauk transports."""
+
+import threading
+import time
+from typing import Callable, List, Literal
+
+from ...exceptions import (
+    CircuitOpenError,
+    NetworkError,
+    PoliceAPIError,
+    ServerError,
+    TooManyCrimesError,
+)
+
+BreakerState = Literal["closed", "open", "half_open"]
+StateListener = Callable[[BreakerState, BreakerState], None]
+
+
+class CircuitBreaker:
+    """Circuit breaker that fails fast while an upstream API is down.
+
+    After `failure_threshold` consecutive server or network failures the
+    breaker opens, and requests raise CircuitOpenError without touching the
+    network or the rate limiter. Once `reset_timeout` has passed it half-opens
+    and lets up to `half_open_max_calls` probe requests through: a probe
+    success closes the breaker, a probe failure re-opens it.
+
+    The breaker is thread-safe, so one instance can guard both the sync and
+    async transports for the same upstream.
+
+    Args:
+        failure_threshold: Consecutive failures before the breaker opens.
+            Defaults to 5.
+        reset_timeout: The cool-down (in seconds) before probing again.
+            Defaults to 30.
+        half_open_max_calls: Concurrent probe requests while half-open.
+            Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """Initialise the CircuitBreaker class."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._listeners: List[StateListener] = []
+
+    @property
+    def state(self) -> BreakerState:
+        """The current breaker state: "closed", "open" or "half_open"."""
+        with self._lock:
+            changed = self._refresh()
+            state = self._state
+        self._notify(changed)
+        return state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets probe requests through."""
+        with self._lock:
+            if self._state != "open":
+                return 0.0
+            elapsed = time.monotonic() - self._opened_at
+            return max(0.0, self.reset_timeout - elapsed)
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Register a hook called as listener(old_state, new_state).
+
+        Hooks run on whichever thread triggered the change, so they should
+        be quick and must not make requests through the guarded transport.
+
+        Args:
+            listener: The callable to notify on every state change.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StateListener) -> None:
+        """Unregister a state change hook.
+
+        Args:
+            listener: The callable previously passed to add_listener.
+        """
+        self._listeners.remove(listener)
+
+    @staticmethod
+    def is_failure(exc: BaseException) -> bool:
+        """Check whether an exception counts towards opening the breaker.
+
+        Every server error counts, 503s included, except the Police API's
+        503 "too many crimes" answer, which is about the query rather than
+        upstream health.
+
+        Args:
+            exc: The exception raised by a request attempt.
+
+        Returns:
+            True for network failures and upstream server errors.
+        """
+        if isinstance(exc, TooManyCrimesError):
+            return False
+        return isinstance(exc, (ServerError, NetworkError))
+
+    def before_request(self) -> None:
+        """Admit a request, or refuse it while the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all
+                probe slots already taken.
+        """
+        with self._lock:
+            changed = self._refresh()
+            refused = self._state == "open" or (
+                self._state == "half_open"
+                and self._probes >= self.half_open_max_calls
+            )
+            if not refused and self._state == "half_open":
+                self._probes += 1
+            retry_after = (
+                self.reset_timeout - (time.monotonic() - self._opened_at)
+                if self._state == "open"
+                else 0.0
+            )
+        self._notify(changed)
+        if refused:
+            raise CircuitOpenError(
+                "Circuit breaker open after repeated upstream failures.",
+                retry_after=max(0.0, retry_after),
+            )
+
+    def record(self, exc: BaseException | None) -> None:
+        """Record the outcome of an admitted request.
+
+        Args:
+            exc: The exception raised by the request, or None on success.
+                Any API response other than a server error proves the
+                upstream is alive, while local failures (e.g. a rate limiter
+                timeout or cancellation) and the "too many crimes" answer
+                leave the failure count and state untouched.
+        """
+        with self._lock:
+            probing = self._state == "half_open"
+            if probing:
+                self._probes = max(0, self._probes - 1)
+
+            if exc is not None and self.is_failure(exc):
+                self._failures += 1
+                if probing or self._failures >= self.failure_threshold:
+                    changed = self._set_state("open")
+                    self._opened_at = time.monotonic()
+                else:
+                    changed = None
+            elif exc is None or (
+                isinstance(exc, PoliceAPIError)
+                and not isinstance(exc, TooManyCrimesError)
+            ):
+                self._failures = 0
+                changed = self._set_state("closed")
+            else:
+                changed = None
+        self._notify(changed)
+
+    def reset(self) -> None:
+        """Force the breaker closed and clear the failure count."""
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            changed = self._set_state("closed")
+        self._notify(changed)
+
+    def _refresh(self) -> tuple | None:
+        """Move an open breaker to half-open once the cool-down is over."""
+        if (
+            self._state == "open"
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._probes = 0
+            return self._set_state("half_open")
+        return None
+
+    def _set_state(self, state: BreakerState) -> tuple | None:
+        """Set the state, returning the (old, new) pair if it changed."""
+        if state == self._state:
+            return None
+        old, self._state = self._state, state
+        return old, state
+
+    def _notify(self, changed: tuple | None) -> None:
+        """Call the listeners outside the lock for a state change."""
+        if changed is None:
+            return
+        for listener in list(self._listeners):
+            listener(*changed)
@@ -0,0 +1,105 @@
+"""Request hedging module for the policedatauk async transports."""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable
+
+from httpx import URL
+
+from ...utils.endpoints import endpoint_template
+
+
+class Hedger:
+    """Decides when a slow request is duplicated to cut tail latency.
+
+    A hedged request sends a duplicate when no response has arrived
+    within a delay derived from recent latencies of the same endpoint
+    (IDs grouped, e.g. "/forces/{id}"), takes whichever response arrives
+    first and cancels the other. Each duplicate takes its own rate limit
+    slot, and is only sent if a slot is free straight away and no other
+    request is queued for one, so hedging never waits on the limiter or
+    delays other requests.
+
+    Only idempotent methods should be hedged, and heavy requests such as
+    POSTed polygon queries are better not duplicated, so only GET
+    requests are hedged by default. The hedger is thread-safe, so one
+    instance can serve several transports for the same upstream.
+
+    Args:
+        percentile: The percentile of recent latencies after which a
+            duplicate is sent.
+            Defaults to 95.
+        min_delay: The shortest hedging delay (in seconds).
+            Defaults to 0.05.
+        max_delay: The longest hedging delay (in seconds).
+            Defaults to 5.
+        initial_delay: The delay (in seconds) used until an endpoint has
+            `min_samples` latencies.
+            Defaults to 1.
+        window: The number of recent latencies kept per endpoint.
+            Defaults to 200.
+        min_samples: The latencies needed before the percentile is used.
+            Defaults to 20.
+        methods: The HTTP methods that are hedged.
+            Defaults to ("GET",).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_delay: float = 0.05,
+        max_delay: float = 5,
+        initial_delay: float = 1,
+        window: int = 200,
+        min_samples: int = 20,
+        methods: Iterable[str] = ("GET",),
+    ) -> None:
+        """Initialise the Hedger class."""
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.methods = frozenset(method.upper() for method in methods)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def delay(self, method: str, url: str | URL) -> float | None:
+        """Return how long to wait for a response before hedging.
+
+        Args:
+            method: The HTTP method.
+            url: The full request URL.
+
+        Returns:
+            The delay in seconds, or None if the method is not hedged.
+        """
+        if method.upper() not in self.methods:
+            return None
+        with self._lock:
+            latencies = self._latencies.get(_key(url))
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)), 1)
+        return min(max(ordered[rank - 1], self.min_delay), self.max_delay)
+
+    def observe(self, url: str | URL, seconds: float) -> None:
+        """Record the latency of a response.
+
+        Args:
+            url: The full request URL.
+            seconds: The time from sending the request to the response.
+        """
+        key = _key(url)
+        with self._lock:
+            if key not in self._latencies:
+                self._latencies[key] = deque(maxlen=self.window)
+            self._latencies[key].append(seconds)
+
+
+def _key(url: str | URL) -> str:
+    """Group a request URL by its endpoint template."""
+    return endpoint_template(URL(url).path)
@@ -0,0 +1,455 @@
+"""Record / replay transports for the policedatauk package."""
+
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Literal
+
+from httpx import HTTPStatusError, Request, Response
+
+from ...exceptions import PoliceAPIError, ReplayMissError, handle_exceptions
+from ...utils import (
+    DecoderName,
+    JSONArrayParser,
+    JSONDecoder,
+    JSONValue,
+    get_decoder,
+)
+from .scheduler import Priority, validate_priority
+from .transports import AsyncTransport, Transport
+
+ReplayMode = Literal["auto", "replay", "record"]
+
+
+def interaction_key(request: Request) -> str:
+    """Identify a request by its method, URL and body.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The key, e.g. "GET https://data.police.uk/api/forces". Request
+        bodies (e.g. POSTed polygons) are included as a digest.
+    """
+    key = f"{request.method} {request.url}"
+    if request.content:
+        key += f" {hashlib.sha256(request.content).hexdigest()[:16]}"
+    return key
+
+
+class Cassette:
+    """A gzip-compressed store of recorded responses.
+
+    Responses are kept as JSON lines, one per interaction. Every
+    recording is appended as its own gzip member, a cheap write that
+    survives interruption. When an interaction is re-recorded the last
+    entry wins, and the superseded entries are dropped by `compact`,
+    which also runs when a cassette holding them is loaded. The cassette
+    is thread-safe, so sync and async transports can share it.
+
+    Args:
+        path: The cassette file, e.g. "tests/cassettes/crimes.jsonl.gz".
+            It is created on the first recording.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialise the Cassette class."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, dict] = {}
+        # Entries in the file superseded by later ones
+        self._stale = 0
+        if self.path.exists():
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    interaction = json.loads(line)
+                    self._stale += interaction["key"] in self._interactions
+                    self._interactions[interaction["key"]] = interaction
+            self.compact()
+
+    def __len__(self) -> int:
+        """Return the number of recorded interactions."""
+        with self._lock:
+            return len(self._interactions)
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether an interaction is recorded."""
+        with self._lock:
+            return key in self._interactions
+
+    def play(self, request: Request) -> Response | None:
+        """Return the recorded response to a request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            The recorded response, or None if it was never recorded.
+        """
+        with self._lock:
+            interaction = self._interactions.get(interaction_key(request))
+        if interaction is None:
+            return None
+        if "text" in interaction:
+            content = interaction["text"].encode("utf-8")
+        else:
+            content = base64.b64decode(interaction["base64"])
+        return Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=content,
+            request=request,
+        )
+
+    def record(self, response: Response) -> None:
+        """Store a response, replacing any earlier recording.
+
+        Args:
+            response: The response (with its request) to store.
+        """
+        interaction = {
+            "key": interaction_key(response.request),
+            "status": response.status_code,
+            "headers": {"content-type": response.headers.get("content-type")}
+            if "content-type" in response.headers
+            else {},
+        }
+        try:
+            interaction["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["base64"] = base64.b64encode(response.content).decode()
+        with self._lock:
+            self._stale += interaction["key"] in self._interactions
+            self._interactions[interaction["key"]] = interaction
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write(_line(interaction))
+
+    def compact(self) -> None:
+        """Rewrite the file without superseded recordings, if it has any.
+
+        Call it once re-recording is done, e.g. at the end of a
+        `replay_mode="record"` session.
+        """
+        with self._lock:
+            if not self._stale:
+                return
+            partial = self.path.with_name(f"{self.path.name}.partial")
+            with gzip.open(partial, "wt", encoding="utf-8") as file:
+                for interaction in self._interactions.values():
+                    file.write(_line(interaction))
+            os.replace(partial, self.path)
+            self._stale = 0
+
+
+def _line(interaction: dict) -> str:
+    """Serialise an interaction as one JSON line."""
+    return json.dumps(interaction, separators=(",", ":")) + "\n"
+
+
+def _recordable(error: PoliceAPIError) -> bool:
+    """Whether an error response is an answer worth replaying.
+
+    Client errors such as 404s are, while rate limiting and server errors
+    are transient and are not recorded.
+    """
+    response = error.response
+    return response is not None and response.status_code < 500
+
+
+def _replay_status(response: Response) -> Response:
+    """Raise the library's exception for a replayed error response."""
+    try:
+        response.raise_for_status()
+    except HTTPStatusError as e:
+        handle_exceptions(e)
+    return response
+
+
+class _ReplayBase:
+    """Shared set-up of the sync and async replay transports."""
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        transport: Transport | AsyncTransport | None,
+        mode: ReplayMode | None,
+        base_url: str | None,
+        decoder: DecoderName | JSONDecoder,
+    ) -> None:
+        """Initialise the replay transport."""
+        if mode is None:
+            mode = "replay" if transport is None else "auto"
+        if mode not in ("auto", "replay", "record"):
+            raise ValueError(f"Unknown replay mode: {mode!r}")
+        if transport is None and mode != "replay":
+            raise ValueError(f'mode="{mode}" needs a transport to record')
+        if transport is None and base_url is None:
+            raise ValueError("base_url is required without a transport")
+        self.cassette = (
+            cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        )
+        self.transport = transport
+        self.mode = mode
+        self.base_url = base_url or transport.base_url
+        self.decoder = (
+            transport.decoder
+            if transport is not None
+            else get_decoder(decoder)
+            if isinstance(decoder, str)
+            else decoder
+        )
+        self.instrumentation = (
+            transport.instrumentation if transport is not None else None
+        )
+
+    def build_url(self, endpoint: str | None) -> str:
+        """Construct the full URL for a request."""
+        return f"{self.base_url}{endpoint or ''}"
+
+    def decode(self, response: Response) -> JSONValue:
+        """Decode the JSON body of a response."""
+        if self.transport is not None:
+            return self.transport.decode(response)
+        return self.decoder(response.content)
+
+    def _lookup(
+        self, method: str, endpoint: str | None, **kwargs
+    ) -> Response | None:
+        """Find the recording of a request, unless re-recording."""
+        request = Request(method.upper(), self.build_url(endpoint), **kwargs)
+        recorded = (
+            None if self.mode == "record" else self.cassette.play(request)
+        )
+        if self.instrumentation is not None:
+            self.instrumentation.cache("replay", recorded is not None)
+        if recorded is None and self.mode == "replay":
+            key = interaction_key(request)
+            raise ReplayMissError(f"No recorded response for {key}", key)
+        return recorded
+
+
+class ReplayTransport(_ReplayBase):
+    """Synchronous transport replaying responses from a cassette.
+
+    Drop-in for Transport: recorded responses are returned without any
+    network access, rate limiting or retries, and responses fetched
+    through the wrapped transport are recorded. Error responses such as
+    404s are replayed as the same exceptions; rate limiting and server
+    errors are never recorded.
+
+    Args:
+        cassette: The Cassette, or the path of its file.
+        transport: The transport that fetches unrecorded responses.
+            Defaults to None, which only replays.
+        mode: "auto" replays recorded responses and records the rest,
+            "replay" never touches the network (missing responses raise
+            ReplayMissError) and "record" refetches and re-records every
+            response. Defaults to None: "auto" with a transport, and
+            "replay" without one.
+        base_url: The base URL of the API.
+            Defaults to None, which uses the transport's.
+        decoder: The JSON backend (without a transport).
+            Defaults to "auto".
+
+    Raises:
+        ValueError: If the mode is not recognised, or needs a transport.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        transport: Transport | None = None,
+        mode: ReplayMode | None = None,
+        base_url: str | None = None,
+        decoder: DecoderName | JSONDecoder = "auto",
+    ) -> None:
+        """Initialise the ReplayTransport class."""
+        super().__init__(cassette, transport, mode, base_url, decoder)
+
+    def to_async(self, **kwargs) -> "AsyncReplayTransport":
+        """Build an asynchronous twin sharing this transport's cassette.
+
+        Args:
+            **kwargs: Passed to the wrapped transport's `to_async`.
+
+        Returns:
+            An AsyncReplayTransport for the same API.
+        """
+        return AsyncReplayTransport(
+            self.cassette,
+            self.transport.to_async(**kwargs) if self.transport else None,
+            mode=self.mode,
+            base_url=self.base_url,
+            decoder=self.decoder,
+        )
+
+    def request(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        **kwargs,
+    ) -> Response:
+        """Return the recorded response, or fetch and record it.
+
+        Args:
+            method: The HTTP method.
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            **kwargs: The request options, e.g. params or data.
+
+        Returns:
+            The server response.
+
+        Raises:
+            ReplayMissError: If the response was not recorded and there is
+                no transport to fetch it with.
+        """
+        recorded = self._lookup(method, endpoint, **kwargs)
+        if recorded is not None:
+            return _replay_status(recorded)
+        try:
+            response = self.transport.request(method, endpoint, **kwargs)
+        except PoliceAPIError as e:
+            if _recordable(e):
+                self.cassette.record(e.response)
+            raise
+        self.cassette.record(response)
+        return response
+
+    def stream(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Return the items of a JSON array response, replayed or fetched.
+
+        Recordings are whole bodies, so the items are parsed in one go.
+
+        Args:
+            method: The HTTP method.
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            **kwargs: The request options, e.g. params or data.
+
+        Yields:
+            The decoded items of the array, in order.
+        """
+        parser = JSONArrayParser()
+        yield from parser.feed(
+            self.request(method, endpoint, **kwargs).content
+        )
+        parser.close()
+
+
+class AsyncReplayTransport(_ReplayBase):
+    """Asynchronous transport replaying responses from a cassette.
+
+    The asynchronous twin of ReplayTransport, a drop-in for
+    AsyncTransport. Replayed requests skip the priority scheduler.
+
+    Args:
+        cassette: The Cassette, or the path of its file.
+        transport: The transport that fetches unrecorded responses.
+            Defaults to None, which only replays.
+        mode: "auto", "replay" or "record" (see ReplayTransport).
+            Defaults to None: "auto" with a transport, and "replay"
+            without one.
+        base_url: The base URL of the API.
+            Defaults to None, which uses the transport's.
+        decoder: The JSON backend (without a transport).
+            Defaults to "auto".
+
+    Raises:
+        ValueError: If the mode is not recognised, or needs a transport.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        transport: AsyncTransport | None = None,
+        mode: ReplayMode | None = None,
+        base_url: str | None = None,
+        decoder: DecoderName | JSONDecoder = "auto",
+    ) -> None:
+        """Initialise the AsyncReplayTransport class."""
+        super().__init__(cassette, transport, mode, base_url, decoder)
+
+    async def request(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        priority: Priority = "normal",
+        **kwargs,
+    ) -> Response:
+        """Return the recorded response, or fetch and record it.
+
+        Args:
+            method: The HTTP method.
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            priority: The scheduling priority of fetched requests.
+                Defaults to "normal".
+            **kwargs: The request options, e.g. params or data.
+
+        Returns:
+            The server response.
+
+        Raises:
+            ReplayMissError: If the response was not recorded and there is
+                no transport to fetch it with.
+            ValueError: If the priority is not "high", "normal" or "low".
+        """
+        validate_priority(priority)
+        recorded = self._lookup(method, endpoint, **kwargs)
+        if recorded is not None:
+            return _replay_status(recorded)
+        try:
+            response = await self.transport.request(
+                method, endpoint, priority=priority, **kwargs
+            )
+        except PoliceAPIError as e:
+            if _recordable(e):
+                self.cassette.record(e.response)
+            raise
+        self.cassette.record(response)
+        return response
+
+    async def stream(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        priority: Priority = "normal",
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Return the items of a JSON array response, replayed or fetched.
+
+        Recordings are whole bodies, so the items are parsed in one go.
+
+        Args:
+            method: The HTTP method.
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            priority: The scheduling priority of fetched requests.
+                Defaults to "normal".
+            **kwargs: The request options, e.g. params or data.
+
+        Yields:
+            The decoded items of the array, in order.
+        """
+        response = await self.request(
+            method, endpoint, priority=priority, **kwargs
+        )
+        parser = JSONArrayParser()
+        for item in parser.feed(response.content):
+            yield item
+        parser.close()
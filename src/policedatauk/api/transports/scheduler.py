@@ -0,0 +1,154 @@
+"""Priority scheduler module for the policedatauk async transports."""
+
+import asyncio
+import heapq
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Generator, List, Literal
+
+from pyrate_limiter import Limiter
+
+Priority = Literal["high", "normal", "low"]
+
+PRIORITY_LEVELS: Dict[str, int] = {"high": 0, "normal": 1, "low": 2}
+
+
+def validate_priority(priority: str) -> None:
+    """Validate a request priority.
+
+    Args:
+        priority: The priority to validate.
+
+    Raises:
+        ValueError: If the priority is not "high", "normal" or "low".
+    """
+    if priority not in PRIORITY_LEVELS:
+        allowed = ", ".join(f'"{level}"' for level in PRIORITY_LEVELS)
+        raise ValueError(
+            f"Unknown priority {priority!r}: must be one of {allowed}."
+        )
+
+
+_caller_tag: ContextVar[str] = ContextVar(
+    "policedatauk_caller_tag", default="default"
+)
+
+
+@contextmanager
+def caller_tag(tag: str) -> Generator[None, None, None]:
+    """Attribute the requests made inside the block to a caller tag.
+
+    Tags share the rate limiter in proportion to their scheduler weights.
+    The tag also applies to tasks created inside the block.
+
+    Args:
+        tag: The name of the caller, e.g. "interactive" or "backfill".
+    """
+    token = _caller_tag.set(tag)
+    try:
+        yield
+    finally:
+        _caller_tag.reset(token)
+
+
+class PriorityScheduler:
+    """Priority queue in front of the rate limiter for async transports.
+
+    Requests take turns acquiring a rate limit slot: "high" priority
+    requests always go before "normal" and "low" ones, and requests of the
+    same priority are ordered by weighted fair queuing across caller tags.
+    Only limiter acquisition is serialised; the HTTP requests themselves
+    still run concurrently.
+
+    Args:
+        weights: The fair-share weight of each caller tag, e.g.
+            {"interactive": 4, "backfill": 1}. Unlisted tags weigh 1.
+    """
+
+    def __init__(self, weights: Dict[str, float] | None = None) -> None:
+        """Initialise the PriorityScheduler class."""
+        self.weights = weights or {}
+        self._queue: List[list] = []
+        self._counter = itertools.count()
+        self._virtual_time = 0.0
+        self._tag_finish: Dict[str, float] = {}
+        self._busy = False
+
+    @property
+    def pending(self) -> int:
+        """The number of requests waiting for their turn."""
+        return sum(1 for entry in self._queue if not entry[-1].done())
+
+    async def acquire(
+        self,
+        limiter: Limiter,
+        timeout: float,
+        priority: Priority = "normal",
+    ) -> bool:
+        """Wait for this request's turn, then acquire a rate limit slot.
+
+        Args:
+            limiter: The rate limiter to acquire from.
+            timeout: The total time (in seconds) to wait for a turn and slot.
+            priority: The priority of the request.
+                Defaults to "normal".
+
+        Returns:
+            True if a slot was acquired within the timeout.
+
+        Raises:
+            ValueError: If the priority is not "high", "normal" or "low".
+        """
+        validate_priority(priority)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await self._wait_turn(priority, timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        try:
+            remaining = max(0.0, timeout - (loop.time() - started))
+            return await limiter.try_acquire_async("api", timeout=remaining)
+        finally:
+            self._release()
+
+    def _finish_tag(self, tag: str) -> float:
+        """Return the virtual finish time for the next request of a tag."""
+        weight = self.weights.get(tag, 1)
+        start = max(self._virtual_time, self._tag_finish.get(tag, 0.0))
+        finish = start + 1 / weight
+        self._tag_finish[tag] = finish
+        return finish
+
+    async def _wait_turn(self, priority: Priority, timeout: float) -> None:
+        """Queue up and wait until this request holds the limiter turn."""
+        finish = self._finish_tag(_caller_tag.get())
+        if not self._busy:
+            self._busy = True
+            self._virtual_time = finish
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = [PRIORITY_LEVELS[priority], finish, next(self._counter)]
+        heapq.heappush(self._queue, [*entry, future])
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # The turn was handed over just as we gave up: pass it on.
+                self._release()
+            else:
+                future.cancel()
+            raise
+
+    def _release(self) -> None:
+        """Hand the limiter turn to the next waiting request."""
+        while self._queue:
+            _, finish, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self._virtual_time = finish
+                future.set_result(None)
+                return
+        self._busy = False
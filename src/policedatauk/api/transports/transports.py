@@ -1,5 +1,9 @@
 """Transport module for the policedatauk package."""
 
+import asyncio
+import time
+from typing import Any, AsyncIterator, Iterator, Tuple
+
 from httpx import (
     AsyncClient,
     Client,
@@ -15,7 +19,18 @@ from ...exceptions import (
     RateLimitError,
     handle_exceptions,
 )
-from ...utils import retry_with_backoff
+from ...utils import (
+    DecoderName,
+    JSONArrayParser,
+    JSONDecoder,
+    JSONValue,
+    RetryPolicy,
+    get_decoder,
+)
+from ..instrumentation import Instrumentation, RequestTiming
+from .breaker import CircuitBreaker
+from .hedging import Hedger
+from .scheduler import Priority, PriorityScheduler, validate_priority
 
 
 class AsyncTransport:
@@ -25,6 +40,23 @@ class AsyncTransport:
         base_url: The base URL for the API.
         client: The HTTP client.
         limiter: The rate limiter.
+        retry_policy: The retry rules applied to every request.
+            Defaults to RetryPolicy().
+        limiter_timeout: The longest (in seconds) a single attempt waits
+            for a rate limit slot. Also bounded by the retry deadline.
+            Defaults to 60.
+        breaker: The circuit breaker guarding the upstream API.
+            Defaults to None, which disables it.
+        decoder: The JSON backend name (see `get_decoder`) or a function
+            decoding raw response bytes.
+            Defaults to "auto", the fastest installed backend.
+        scheduler: The priority queue in front of the rate limiter.
+            Defaults to None, which acquires slots first come, first served.
+        instrumentation: The hooks receiving request timings and the
+            resources' processing stages.
+            Defaults to None, which disables instrumentation.
+        hedger: Duplicates slow GET requests to cut tail latency.
+            Defaults to None, which disables hedging.
     """
 
     def __init__(
@@ -32,11 +64,27 @@ class AsyncTransport:
         base_url: str,
         client: AsyncClient,
         limiter: Limiter,
+        retry_policy: RetryPolicy | None = None,
+        limiter_timeout: float = 60,
+        breaker: CircuitBreaker | None = None,
+        decoder: DecoderName | JSONDecoder = "auto",
+        scheduler: PriorityScheduler | None = None,
+        instrumentation: Instrumentation | None = None,
+        hedger: Hedger | None = None,
     ) -> None:
         """Initialise the AsyncTransport class."""
         self.base_url = base_url
         self.client = client
         self.limiter = limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter_timeout = limiter_timeout
+        self.breaker = breaker
+        self.decoder = (
+            get_decoder(decoder) if isinstance(decoder, str) else decoder
+        )
+        self.scheduler = scheduler
+        self.instrumentation = instrumentation
+        self.hedger = hedger
 
     def build_url(self, endpoint: str | None) -> str:
         """Construct the full URL for a request.
@@ -50,11 +98,61 @@ class AsyncTransport:
         """
         return f"{self.base_url}{endpoint or ''}"
 
-    @retry_with_backoff()
+    def decode(self, response: Response) -> JSONValue:
+        """Decode the JSON body of a response with the configured backend.
+
+        Args:
+            response: The server response.
+
+        Returns:
+            The decoded JSON data.
+        """
+        if self.instrumentation is None or not self.instrumentation.enabled:
+            return self.decoder(response.content)
+        started = time.perf_counter()
+        data = self.decoder(response.content)
+        self.instrumentation.stage(
+            "decode",
+            response.request.url.path,
+            len(data) if isinstance(data, list) else 1,
+            started,
+        )
+        return data
+
+    def timing(
+        self, method: str, endpoint: str | None
+    ) -> RequestTiming | None:
+        """Start measuring a request, if instrumentation is enabled."""
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.timing(self.base_url, method, endpoint)
+
+    def limiter_budget(self, started: float) -> float:
+        """Return how long the next attempt may wait on the rate limiter.
+
+        Args:
+            started: The time.monotonic() value when the call started.
+
+        Returns:
+            The limiter timeout in seconds.
+
+        Raises:
+            RateLimitError: If the retry deadline is already spent.
+        """
+        remaining = self.retry_policy.remaining(started)
+        if remaining is None:
+            return self.limiter_timeout
+        if remaining <= 0:
+            raise RateLimitError(
+                "Retry deadline exhausted before a rate limit slot was free."
+            )
+        return min(self.limiter_timeout, remaining)
+
     async def request(
         self,
         method: str = "GET",
         endpoint: str | None = None,
+        priority: Priority = "normal",
         **kwargs,
     ) -> Response:
         """A single, unified asynchronous request handler with rate limiting.
@@ -64,22 +162,125 @@ class AsyncTransport:
                 Defaults to "GET".
             endpoint: The endpoint of the request.
                 Defaults to None.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
             params: The query parameters for the GET request.
                 Defaults to None.
 
         Returns:
             The server response.
+
+        Raises:
+            ValueError: If the priority is not "high", "normal" or "low".
         """
+        validate_priority(priority)
         url = self.build_url(endpoint)
+        started = time.monotonic()
+        timing = self.timing(method, endpoint)
+        if timing is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timing.async_trace,
+            }
+
+        error = None
+        try:
+            async for attempt in self.retry_policy.async_retrying():
+                with attempt:
+                    return await self._send(
+                        method, url, started, priority, timing, **kwargs
+                    )
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timing is not None:
+                self.instrumentation.emit(timing.finish(error))
 
-        acquired = await self.limiter.try_acquire_async("api", timeout=60)
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        priority: Priority,
+        timing: RequestTiming | None = None,
+        **kwargs,
+    ) -> Response:
+        """Make a single attempt at a request, guarded by the breaker."""
+        if self.breaker is None:
+            return await self._attempt(
+                method, url, started, priority, timing, **kwargs
+            )
+
+        self.breaker.before_request()
+        try:
+            response = await self._attempt(
+                method, url, started, priority, timing, **kwargs
+            )
+        except BaseException as e:
+            self.breaker.record(e)
+            raise
+        self.breaker.record(None)
+        return response
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        priority: Priority,
+        timing: RequestTiming | None = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> Response:
+        """Make a single rate limited attempt at a request.
+
+        With `stream`, only the response headers are read before
+        returning, unless the response is an error.
+        """
+        timeout = self.limiter_budget(started)
+        if timing is not None:
+            timing.attempt()
+            waiting = time.perf_counter()
+        if self.scheduler is None:
+            acquired = await self.limiter.try_acquire_async(
+                "api", timeout=timeout
+            )
+        else:
+            acquired = await self.scheduler.acquire(
+                self.limiter, timeout, priority
+            )
+        if timing is not None:
+            timing.waited(time.perf_counter() - waiting)
         if not acquired:
             raise RateLimitError(
                 "Local rate limit exceeded. Request blocked before sending."
             )
 
         try:
-            response = await self.client.request(method.upper(), url, **kwargs)
+            delay = (
+                None
+                if self.hedger is None or stream
+                else self.hedger.delay(method, url)
+            )
+            if stream:
+                request = self.client.build_request(
+                    method.upper(), url, **kwargs
+                )
+                response = await self.client.send(request, stream=True)
+                if response.is_error:
+                    await response.aread()
+            elif delay is None:
+                response = await self.client.request(
+                    method.upper(), url, **kwargs
+                )
+            else:
+                response = await self._hedged(
+                    method.upper(), url, delay, timing, **kwargs
+                )
+            # Open streams are measured once they have been read
+            if timing is not None and response.is_closed:
+                timing.response(response)
             response.raise_for_status()
             return response
 
@@ -89,6 +290,159 @@ class AsyncTransport:
         except (RequestError, TimeoutException) as e:
             raise NetworkError(f"Network connectivity issue: {str(e)}") from e
 
+    async def _hedged(
+        self,
+        method: str,
+        url: str,
+        delay: float,
+        timing: RequestTiming | None = None,
+        **kwargs,
+    ) -> Response:
+        """Send a request, duplicating it if no response comes in time.
+
+        The first response wins and the other request is cancelled. A
+        duplicate is only sent if a rate limit slot is free straight away.
+        If one request fails, the other is still awaited. The hedger
+        learns the latency of successful responses, each timed from its
+        own send, and when the duplicate wins, how long the cancelled
+        original had been waiting (at least the delay), so the slow tail
+        stays in the percentile.
+        """
+        sent = time.perf_counter()
+        original = asyncio.ensure_future(
+            self._timed_request(method, url, **kwargs)
+        )
+        tasks = {original}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and await self._hedge_slot():
+                if timing is not None:
+                    timing.hedged()
+                # The trace phases are measured on the first request only
+                extensions = {
+                    name: value
+                    for name, value in kwargs.pop("extensions", {}).items()
+                    if name != "trace"
+                }
+                tasks.add(
+                    asyncio.ensure_future(
+                        self._timed_request(
+                            method, url, extensions=extensions, **kwargs
+                        )
+                    )
+                )
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        response, seconds = task.result()
+                        if response.is_success:
+                            self.hedger.observe(url, seconds)
+                        if not original.done():
+                            self.hedger.observe(
+                                url, time.perf_counter() - sent
+                            )
+                        return response
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _timed_request(
+        self, method: str, url: str, **kwargs
+    ) -> Tuple[Response, float]:
+        """Send a request, returning the response and its latency."""
+        sent = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        return response, time.perf_counter() - sent
+
+    async def stream(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        priority: Priority = "normal",
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a JSON array response as they download.
+
+        The request is rate limited and retried like `request` until the
+        response headers arrive. The body is then parsed incrementally,
+        so peak memory stays flat however large the array is, and the
+        caller can process items while the rest downloads. Failures after
+        the first item are not retried.
+
+        Args:
+            method: the request type, e.g. GET, POST, DELETE etc
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            priority: The scheduling priority of the request.
+                Defaults to "normal".
+            **kwargs: The request options, e.g. params or data.
+
+        Yields:
+            The decoded items of the array, in order.
+
+        Raises:
+            ValueError: If the priority is not "high", "normal" or "low", or
+                the body is not a complete JSON array.
+        """
+        validate_priority(priority)
+        url = self.build_url(endpoint)
+        started = time.monotonic()
+        timing = self.timing(method, endpoint)
+        if timing is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timing.async_trace,
+            }
+
+        error = None
+        try:
+            async for attempt in self.retry_policy.async_retrying():
+                with attempt:
+                    response = await self._send(
+                        method,
+                        url,
+                        started,
+                        priority,
+                        timing,
+                        stream=True,
+                        **kwargs,
+                    )
+            parser = JSONArrayParser()
+            try:
+                async for chunk in response.aiter_bytes():
+                    for item in parser.feed(chunk):
+                        yield item
+                parser.close()
+            except (RequestError, TimeoutException) as e:
+                raise NetworkError(
+                    f"Network connectivity issue: {str(e)}"
+                ) from e
+            finally:
+                await response.aclose()
+                if timing is not None:
+                    timing.response(response, parser.bytes_read)
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timing is not None:
+                self.instrumentation.emit(timing.finish(error))
+
+    async def _hedge_slot(self) -> bool:
+        """Take a rate limit slot for a duplicate, if one is free now."""
+        if self.scheduler is not None and self.scheduler.pending:
+            return False
+        return await self.limiter.try_acquire_async("api", blocking=False)
+
 
 class Transport:
     """Synchronous HTTP transport class for the policedatauk package.
@@ -97,15 +451,43 @@ class Transport:
         base_url: The base URL for the API.
         client: The HTTP client.
         limiter: The rate limiter.
+        retry_policy: The retry rules applied to every request.
+            Defaults to RetryPolicy().
+        limiter_timeout: The longest (in seconds) a single attempt waits
+            for a rate limit slot. Also bounded by the retry deadline.
+            Defaults to 60.
+        breaker: The circuit breaker guarding the upstream API.
+            Defaults to None, which disables it.
+        decoder: The JSON backend name (see `get_decoder`) or a function
+            decoding raw response bytes.
+            Defaults to "auto", the fastest installed backend.
+        instrumentation: The hooks receiving request timings and the
+            resources' processing stages.
+            Defaults to None, which disables instrumentation.
     """
 
     def __init__(
-        self, base_url: str, client: Client, limiter: Limiter
+        self,
+        base_url: str,
+        client: Client,
+        limiter: Limiter,
+        retry_policy: RetryPolicy | None = None,
+        limiter_timeout: float = 60,
+        breaker: CircuitBreaker | None = None,
+        decoder: DecoderName | JSONDecoder = "auto",
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         """Initialise the Transport class."""
         self.base_url = base_url
         self.client = client
         self.limiter = limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter_timeout = limiter_timeout
+        self.breaker = breaker
+        self.decoder = (
+            get_decoder(decoder) if isinstance(decoder, str) else decoder
+        )
+        self.instrumentation = instrumentation
 
     def build_url(self, endpoint: str | None) -> str:
         """Construct the full URL for a request.
@@ -119,7 +501,84 @@ class Transport:
         """
         return f"{self.base_url}{endpoint or ''}"
 
-    @retry_with_backoff()
+    def to_async(
+        self, scheduler: PriorityScheduler | None = None
+    ) -> AsyncTransport:
+        """Build an asynchronous twin of this transport.
+
+        The twin shares the rate limiter, retry policy, circuit breaker and
+        instrumentation, so sync and async traffic draw on the same budgets
+        and report to the same hooks.
+
+        Args:
+            scheduler: The priority queue for the twin's rate limiter.
+                Defaults to a new PriorityScheduler.
+
+        Returns:
+            An AsyncTransport for the same API.
+        """
+        return AsyncTransport(
+            base_url=self.base_url,
+            client=AsyncClient(timeout=self.client.timeout),
+            limiter=self.limiter,
+            retry_policy=self.retry_policy,
+            limiter_timeout=self.limiter_timeout,
+            breaker=self.breaker,
+            decoder=self.decoder,
+            scheduler=scheduler or PriorityScheduler(),
+            instrumentation=self.instrumentation,
+        )
+
+    def decode(self, response: Response) -> JSONValue:
+        """Decode the JSON body of a response with the configured backend.
+
+        Args:
+            response: The server response.
+
+        Returns:
+            The decoded JSON data.
+        """
+        if self.instrumentation is None or not self.instrumentation.enabled:
+            return self.decoder(response.content)
+        started = time.perf_counter()
+        data = self.decoder(response.content)
+        self.instrumentation.stage(
+            "decode",
+            response.request.url.path,
+            len(data) if isinstance(data, list) else 1,
+            started,
+        )
+        return data
+
+    def timing(
+        self, method: str, endpoint: str | None
+    ) -> RequestTiming | None:
+        """Start measuring a request, if instrumentation is enabled."""
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.timing(self.base_url, method, endpoint)
+
+    def limiter_budget(self, started: float) -> float:
+        """Return how long the next attempt may wait on the rate limiter.
+
+        Args:
+            started: The time.monotonic() value when the call started.
+
+        Returns:
+            The limiter timeout in seconds.
+
+        Raises:
+            RateLimitError: If the retry deadline is already spent.
+        """
+        remaining = self.retry_policy.remaining(started)
+        if remaining is None:
+            return self.limiter_timeout
+        if remaining <= 0:
+            raise RateLimitError(
+                "Retry deadline exhausted before a rate limit slot was free."
+            )
+        return min(self.limiter_timeout, remaining)
+
     def request(
         self,
         method: str = "GET",
@@ -140,13 +599,84 @@ class Transport:
             The server response.
         """
         url = self.build_url(endpoint)
+        started = time.monotonic()
+        timing = self.timing(method, endpoint)
+        if timing is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timing.trace,
+            }
+
+        error = None
+        try:
+            for attempt in self.retry_policy.retrying():
+                with attempt:
+                    return self._send(method, url, started, timing, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timing is not None:
+                self.instrumentation.emit(timing.finish(error))
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        timing: RequestTiming | None = None,
+        **kwargs,
+    ) -> Response:
+        """Make a single attempt at a request, guarded by the breaker."""
+        if self.breaker is None:
+            return self._attempt(method, url, started, timing, **kwargs)
+
+        self.breaker.before_request()
+        try:
+            response = self._attempt(method, url, started, timing, **kwargs)
+        except BaseException as e:
+            self.breaker.record(e)
+            raise
+        self.breaker.record(None)
+        return response
 
-        acquired = self.limiter.try_acquire("api", timeout=60)
+    def _attempt(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        timing: RequestTiming | None = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> Response:
+        """Make a single rate limited attempt at a request.
+
+        With `stream`, only the response headers are read before
+        returning, unless the response is an error.
+        """
+        timeout = self.limiter_budget(started)
+        if timing is not None:
+            timing.attempt()
+            waiting = time.perf_counter()
+        acquired = self.limiter.try_acquire("api", timeout=timeout)
+        if timing is not None:
+            timing.waited(time.perf_counter() - waiting)
         if not acquired:
             raise RateLimitError("Local rate limit exceeded.")
 
         try:
-            response = self.client.request(method.upper(), url, **kwargs)
+            if stream:
+                request = self.client.build_request(
+                    method.upper(), url, **kwargs
+                )
+                response = self.client.send(request, stream=True)
+                if response.is_error:
+                    response.read()
+            else:
+                response = self.client.request(method.upper(), url, **kwargs)
+            # Open streams are measured once they have been read
+            if timing is not None and response.is_closed:
+                timing.response(response)
             response.raise_for_status()
             return response
 
@@ -155,3 +685,68 @@ class Transport:
 
         except (RequestError, TimeoutException) as e:
             raise NetworkError(f"Network connectivity issue: {str(e)}") from e
+
+    def stream(
+        self,
+        method: str = "GET",
+        endpoint: str | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Stream the items of a JSON array response as they download.
+
+        The request is rate limited and retried like `request` until the
+        response headers arrive. The body is then parsed incrementally,
+        so peak memory stays flat however large the array is, and the
+        caller can process items while the rest downloads. Failures after
+        the first item are not retried.
+
+        Args:
+            method: the request type, e.g. GET, POST, DELETE etc
+                Defaults to "GET".
+            endpoint: The endpoint of the request.
+                Defaults to None.
+            **kwargs: The request options, e.g. params or data.
+
+        Yields:
+            The decoded items of the array, in order.
+
+        Raises:
+            ValueError: If the body is not a complete JSON array.
+        """
+        url = self.build_url(endpoint)
+        started = time.monotonic()
+        timing = self.timing(method, endpoint)
+        if timing is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timing.trace,
+            }
+
+        error = None
+        try:
+            for attempt in self.retry_policy.retrying():
+                with attempt:
+                    response = self._send(
+                        method, url, started, timing, stream=True, **kwargs
+                    )
+            parser = JSONArrayParser()
+            try:
+                for chunk in response.iter_bytes():
+                    yield from parser.feed(chunk)
+                parser.close()
+            except (RequestError, TimeoutException) as e:
+                raise NetworkError(
+                    f"Network connectivity issue: {str(e)}"
+                ) from e
+            finally:
+                response.close()
+                if timing is not None:
+                    timing.response(response, parser.bytes_read)
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timing is not None:
+                self.instrumentation.emit(timing.finish(error))
@@ -0,0 +1,161 @@
+"""Data versioning module for the policedatauk package."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Tuple
+
+from ..utils.concurrency import RefreshLock
+
+
+class UpdateTracker:
+    """Memoised stamp of when the Police API last published crime data.
+
+    Holds the date from `/crime-last-updated`, e.g. "2024-02-01", which
+    serves both as the default month for crime requests and as a version
+    stamp for cached responses: cached results are only refetched after an
+    actual publication. The stamp is re-polled once older than `ttl`.
+
+    The tracker is thread-safe, so the sync resources and their async bulk
+    engine can share one instance, and concurrent async callers that find
+    the stamp stale share a single poll (see `refresh`).
+
+    Args:
+        ttl: How long (in seconds) the stamp is trusted before polling.
+            Defaults to 300.
+    """
+
+    def __init__(self, ttl: float = 300) -> None:
+        """Initialise the UpdateTracker class."""
+        self.ttl = ttl
+        self._stamp: str | None = None
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
+        self._refresh_lock = RefreshLock()
+
+    @property
+    def stale(self) -> bool:
+        """Whether the stamp is missing or older than its TTL."""
+        with self._lock:
+            return (
+                self._checked_at is None
+                or time.monotonic() - self._checked_at >= self.ttl
+            )
+
+    @property
+    def stamp(self) -> str | None:
+        """The last update date reported by the API."""
+        with self._lock:
+            return self._stamp
+
+    @property
+    def latest_month(self) -> str | None:
+        """The newest month of crime data, in YYYY-MM format."""
+        stamp = self.stamp
+        return stamp[:7] if stamp else None
+
+    def update(self, stamp: str) -> bool:
+        """Record a freshly polled stamp.
+
+        Args:
+            stamp: The date returned by /crime-last-updated.
+
+        Returns:
+            True if the stamp changed, i.e. new data was published.
+        """
+        with self._lock:
+            changed = self._stamp is not None and stamp != self._stamp
+            self._stamp = stamp
+            self._checked_at = time.monotonic()
+        return changed
+
+    async def refresh(self, poll: Callable[[], Awaitable[str]]) -> bool:
+        """Poll the stamp if it is stale, once for all concurrent callers.
+
+        Callers that find the stamp stale while a poll is in flight wait
+        for it rather than sending their own.
+
+        Args:
+            poll: Returns the date from /crime-last-updated.
+
+        Returns:
+            True if the stamp changed, i.e. new data was published.
+        """
+        if not self.stale:
+            return False
+        async with self._refresh_lock():
+            if not self.stale:
+                return False
+            return self.update(await poll())
+
+    def invalidate(self) -> None:
+        """Mark the stamp stale, so it is re-polled before the next use."""
+        with self._lock:
+            self._checked_at = None
+
+
+class VersionedCache:
+    """LRU cache of parsed responses tagged with a data version stamp.
+
+    Entries stored under one version miss once the version changes, so a
+    new publication invalidates every cached crime response at once.
+    Results are deep-copied in and out, so callers that modify the models
+    they get back cannot change later cache hits.
+
+    Args:
+        maxsize: The maximum number of cached responses.
+            Defaults to 256.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialise the VersionedCache class."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[str, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, version: str) -> list | None:
+        """Return a copy of a cached result if it matches the version.
+
+        Args:
+            key: The request key.
+            version: The current data version.
+
+        Returns:
+            The cached result, or None on a miss or outdated entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Stored results are never modified, so they can be copied unlocked
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: Hashable, version: str, value: list) -> None:
+        """Cache a result under the current data version.
+
+        Args:
+            key: The request key.
+            version: The current data version.
+            value: The parsed result.
+        """
+        entry = (version, copy.deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
@@ -40,6 +40,45 @@ class RateLimitError(PoliceDataError):
     pass
 
 
+class CircuitOpenError(PoliceDataError):
+    """Raised when a request is refused because the circuit breaker is open.
+
+    The upstream API failed repeatedly, so requests fail fast until the
+    cool-down window has passed.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialise Circuit Open Error class."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DataNotAvailableError(PoliceDataError):
+    """Raised locally when the requested month has not been published yet.
+
+    Only raised when the client checks the availability index, in which
+    case no request is sent.
+    """
+
+    def __init__(self, message: str, month: str) -> None:
+        """Initialise Data Not Available Error class."""
+        super().__init__(message)
+        self.month = month
+
+
+class ReplayMissError(PoliceDataError, LookupError):
+    """Raised when a replay-only transport has no recording of a request.
+
+    No request is sent: record the cassette again (in "auto" or "record"
+    mode) to add the missing response.
+    """
+
+    def __init__(self, message: str, key: str) -> None:
+        """Initialise Replay Miss Error class."""
+        super().__init__(message)
+        self.key = key
+
+
 class PoliceAPIError(PoliceDataError):
     """Base exception for non-2xx API responses."""
 
@@ -80,8 +119,51 @@ class ServerError(PoliceAPIError):
     pass
 
 
+class TooManyCrimesError(ServerError):
+    """Raised for the Police API's 503 "too many crimes" response.
+
+    data.police.uk answers a custom area holding more than 10,000 crimes
+    with a 503, so the same request can never succeed: split the area
+    into smaller polygons instead. Unlike other server errors, it is not
+    retried and says nothing about the health of the API.
+    """
+
+    pass
+
+
 # --- ERROR HANDLING UTILITY ---
 
+# Endpoints searching a custom area, which answer with a 503 when the
+# area holds more than 10,000 crimes
+CRIME_AREA_ENDPOINTS = ("/crimes-street/", "/outcomes-at-location")
+
+
+def is_too_many_crimes(response: httpx.Response) -> bool:
+    """Check whether a response is the 503 "too many crimes" answer.
+
+    The answer is a 503 from a custom area crime endpoint, with an empty
+    body or one mentioning the limit. Other 503s, e.g. a "Service
+    Unavailable" page during an outage, are ordinary server errors.
+
+    Args:
+        response: The server response.
+
+    Returns:
+        True if the area of the request held too many crimes.
+    """
+    if response.status_code != 503:
+        return False
+    try:
+        path = response.request.url.path
+    except RuntimeError:  # A response built without its request
+        return False
+    if not any(endpoint in path for endpoint in CRIME_AREA_ENDPOINTS):
+        return False
+    text = response.text.strip().lower()
+    return not text or any(
+        marker in text for marker in ("10,000", "10000", "too many")
+    )
+
 
 def handle_exceptions(e: httpx.HTTPStatusError) -> None:
     """Parses an httpx.HTTPStatusError and raises appropriate PoliceAPIError.
@@ -115,6 +197,13 @@ def handle_exceptions(e: httpx.HTTPStatusError) -> None:
         raise RateLimitError(
             f"API Rate limit exceeded: {error_message}"
         ) from e
+    elif is_too_many_crimes(response):
+        raise TooManyCrimesError(
+            "Too many crimes in the requested area (over 10,000): "
+            "split it into smaller polygons",
+            request=e.request,
+            response=response,
+        ) from e
     elif status_code >= 500:
         raise ServerError(
             f"Upstream server error ({status_code}): {error_message}",
@@ -1,23 +1,40 @@
 """Initialisation file for the models submodule."""
 
-from .crime import CrimeCategory, CrimeReport, CrimeWithOutcomes
+from .crime import (
+    AvailableDate,
+    CrimeCategory,
+    CrimeReport,
+    CrimeWithOutcomes,
+    LastUpdated,
+    LocationOutcome,
+)
 from .force import Force, ForceSummary, Person
 from .neighbourhood import (
     Neighbourhood,
+    NeighbourhoodEvent,
+    NeighbourhoodPriority,
     NeighbourhoodResult,
     NeighbourhoodSummary,
 )
 from .postcodes import PostCode
+from .stop import OutcomeObject, StopAndSearch
 
 __all__ = [
+    "AvailableDate",
     "CrimeCategory",
     "CrimeReport",
     "CrimeWithOutcomes",
+    "LastUpdated",
+    "LocationOutcome",
     "Force",
     "ForceSummary",
     "Neighbourhood",
+    "NeighbourhoodEvent",
+    "NeighbourhoodPriority",
     "NeighbourhoodSummary",
     "NeighbourhoodResult",
+    "OutcomeObject",
     "Person",
     "PostCode",
+    "StopAndSearch",
 ]
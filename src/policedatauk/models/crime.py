@@ -91,13 +91,13 @@ class LocationOutcome(BaseModel):
 
         person_id (str | None): Person ID of the crime outcome.
 
-        crime (StreetLocation): Crime location of the crime outcome.
+        crime (CrimeReport): The crime the outcome belongs to.
     """
 
     category: OutcomeCategory
     date: str
     person_id: str | None = None
-    crime: StreetLocation
+    crime: CrimeReport
 
 
 class CrimeOutcome(BaseModel):
@@ -125,3 +125,30 @@ class CrimeWithOutcomes(BaseModel):
 
     crime: CrimeReport
     outcomes: List[CrimeOutcome]
+
+
+class AvailableDate(BaseModel):
+    """Represents a month of published street-level crime data.
+
+    Args:
+        date (str): The month, in YYYY-MM format.
+        stop_and_search (List[str]): The IDs of the forces that published
+            stop and search data for the month.
+    """
+
+    date: str = Field(..., description="Month of the data, e.g. '2024-01'.")
+    stop_and_search: List[str] = Field(
+        default_factory=list,
+        alias="stop-and-search",
+        description="Forces with stop and search data for the month.",
+    )
+
+
+class LastUpdated(BaseModel):
+    """Represents the date crime data was last published.
+
+    Args:
+        date (str): The date of the last update, e.g. '2024-02-01'.
+    """
+
+    date: str = Field(..., description="Date of the last update.")
@@ -1,21 +1,52 @@
 """Force-related pydantic models."""
 
-from typing import Dict
+from typing import Annotated, Dict, Literal
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
+
+CoordinateMode = Literal["float", "str"]
+
+
+def _parse_coordinate(
+    value: object, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+) -> float | str | None:
+    """Parse a coordinate as a float, or keep the raw string in str mode.
+
+    The API sends coordinates as strings, e.g. "52.343315". They are parsed
+    to floats unless the validation context sets {"coordinates": "str"}.
+    Blank strings are treated as missing.
+    """
+    if value is None or (info.context or {}).get("coordinates") == "str":
+        return handler(value)
+    if isinstance(value, str) and not value.strip():
+        return handler(None)
+    return handler(float(value))
+
+
+Coordinate = Annotated[float | str, WrapValidator(_parse_coordinate)]
+OptionalCoordinate = Annotated[
+    float | str | None, WrapValidator(_parse_coordinate)
+]
 
 
 class StreetLocation(BaseModel):
     """Represents a street location.
 
     Args:
-        latitude (str): Latitude of the street location.
+        latitude (float): Latitude of the street location. Kept as the raw
+            string when the client uses coordinates="str".
 
-        longitude (str): Longitude of the street location.
+        longitude (float): Longitude of the street location. Kept as the raw
+            string when the client uses coordinates="str".
 
         street (Dict[str, str | int]): Street details of the street location.
     """
 
-    latitude: str
-    longitude: str
+    latitude: Coordinate
+    longitude: Coordinate
     street: Dict[str, str | int]
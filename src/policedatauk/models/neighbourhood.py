@@ -1,9 +1,12 @@
 """Neighbourhood-related pydantic models."""
 
+from datetime import datetime
 from typing import List
 
 from pydantic import BaseModel, Field
 
+from .location import OptionalCoordinate
+
 
 class NeighbourhoodLinks(BaseModel):
     """Represents a follow-on link for a neighbourhood.
@@ -75,8 +78,8 @@ class NeighbourhoodLocation(BaseModel):
 
     Args:
         name (str | None): Name of the location (if available).
-        longitude (str | None): Longitude of the location.
-        latitude (str | None): Latitude of the location.
+        longitude (float | None): Longitude of the location.
+        latitude (float | None): Latitude of the location.
         postcode (str | None): Postcode of the location.
         address (str | None): Address of the location.
         telephone (str | None): Telephone number of the location.
@@ -88,10 +91,12 @@ class NeighbourhoodLocation(BaseModel):
     """
 
     name: str | None = Field(None, description="Name of the location.")
-    longitude: str | None = Field(
+    longitude: OptionalCoordinate = Field(
         None, description="Longitude of the location."
     )
-    latitude: str | None = Field(None, description="Latitude of the location.")
+    latitude: OptionalCoordinate = Field(
+        None, description="Latitude of the location."
+    )
     postcode: str | None = Field(None, description="Postcode of the location.")
     address: str | None = Field(None, description="Address of the location.")
     telephone: str | None = Field(
@@ -182,3 +187,69 @@ class Person(BaseModel):
     contact_details: dict = Field(
         default_factory=dict, description="Contact information if available."
     )
+
+
+class NeighbourhoodEvent(BaseModel):
+    """Represents a neighbourhood event, e.g. a beat meeting.
+
+    Args:
+        contact_details (dict): Contact information for the event.
+        title (str): Title of the event.
+        description (str | None): Description of the event.
+        address (str | None): Address of the event.
+        type (str | None): Type of event, e.g. 'meeting'.
+        start_date (datetime | None): Start of the event, in local time.
+        end_date (datetime | None): End of the event, in local time.
+
+    Exceptions:
+        ValidationError: If the data is invalid.
+    """
+
+    contact_details: dict = Field(
+        default_factory=dict, description="Contact information if available."
+    )
+    title: str = Field(..., description="Title of the event.")
+    description: str | None = Field(
+        None, description="Description of the event."
+    )
+    address: str | None = Field(None, description="Address of the event.")
+    type: str | None = Field(
+        None, description="Type of event.", examples=["meeting"]
+    )
+    start_date: datetime | None = Field(
+        None, description="Start of the event, in local time."
+    )
+    end_date: datetime | None = Field(
+        None, description="End of the event, in local time."
+    )
+
+
+class NeighbourhoodPriority(BaseModel):
+    """Represents a policing priority set for a neighbourhood.
+
+    Args:
+        issue (str | None): HTML-formatted description of the issue.
+        issue_date (datetime | None): When the priority was agreed.
+        action (str | None): HTML-formatted action taken.
+        action_date (datetime | None): When the action was taken.
+
+    Exceptions:
+        ValidationError: If the data is invalid.
+    """
+
+    issue: str | None = Field(
+        None, description="HTML-formatted description of the issue."
+    )
+    issue_date: datetime | None = Field(
+        None,
+        alias="issue-date",
+        description="When the priority was agreed.",
+    )
+    action: str | None = Field(
+        None, description="HTML-formatted action taken."
+    )
+    action_date: datetime | None = Field(
+        None,
+        alias="action-date",
+        description="When the action was taken.",
+    )
@@ -0,0 +1,95 @@
+"""Stop and search-related pydantic models."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+from .location import StreetLocation
+
+
+class OutcomeObject(BaseModel):
+    """Represents the outcome of a stop and search.
+
+    Args:
+        id (str): Outcome code, e.g. 'bu-no-further-action'.
+        name (str): Human name for the outcome.
+    """
+
+    id: str = Field(..., description="Outcome code.")
+    name: str = Field(..., description="Human name for the outcome.")
+
+
+class StopAndSearch(BaseModel):
+    """Represents a stop and search.
+
+    Args:
+        type (str): Type of search, e.g. 'Person search'.
+
+        involved_person (bool): Whether the search involved a person.
+
+        datetime (datetime): Date and time of the stop and search.
+
+        operation (bool | None): Whether it was part of a policing
+            operation. Defaults to None.
+
+        operation_name (str | None): Name of the operation.
+            Defaults to None.
+
+        location (StreetLocation | None): Approximate location of the stop
+            and search. Defaults to None.
+
+        gender (str | None): Gender of the person searched.
+            Defaults to None.
+
+        age_range (str | None): Age range of the person searched.
+            Defaults to None.
+
+        self_defined_ethnicity (str | None): Ethnicity of the person
+            searched, as given by them. Defaults to None.
+
+        officer_defined_ethnicity (str | None): Ethnicity of the person
+            searched, as recorded by the officer. Defaults to None.
+
+        legislation (str | None): Power used to carry out the search.
+            Defaults to None.
+
+        object_of_search (str | None): Reason for the search.
+            Defaults to None.
+
+        outcome (str | None): Outcome of the search. The API sends false
+            when no outcome was recorded, which is parsed to None.
+            Defaults to None.
+
+        outcome_object (OutcomeObject | None): Code and name of the
+            outcome. Defaults to None.
+
+        outcome_linked_to_object_of_search (bool | None): Whether the
+            outcome was linked to the reason for the search.
+            Defaults to None.
+
+        removal_of_more_than_outer_clothing (bool | None): Whether more
+            than outer clothing was removed. Defaults to None.
+    """
+
+    type: str
+    involved_person: bool
+    datetime: datetime
+    operation: bool | None = None
+    operation_name: str | None = None
+    location: StreetLocation | None = None
+    gender: str | None = None
+    age_range: str | None = None
+    self_defined_ethnicity: str | None = None
+    officer_defined_ethnicity: str | None = None
+    legislation: str | None = None
+    object_of_search: str | None = None
+    outcome: str | None = None
+    outcome_object: OutcomeObject | None = None
+    outcome_linked_to_object_of_search: bool | None = None
+    removal_of_more_than_outer_clothing: bool | None = None
+
+    @field_validator("outcome", mode="before")
+    @classmethod
+    def _no_outcome(cls, value: object) -> object:
+        """Parse the API's false placeholder for no outcome as None."""
+        return None if value is False else value
@@ -0,0 +1,280 @@
+"""msgspec Struct mirrors of the pydantic models.
+
+These lightweight models have the same names and fields as the pydantic
+models, and are decoded straight from the raw response bytes. They skip
+pydantic's object construction, which dominates CPU time for large crime
+responses. Select them with `PoliceClient(model_backend="msgspec")`.
+
+Coordinates are always floats here; decode with `strict=False` so the
+API's numeric strings (e.g. "52.343315") are accepted.
+
+Requires the optional msgspec dependency (the "fast" extra).
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+import msgspec
+
+
+class Struct(msgspec.Struct, omit_defaults=True):
+    """Base class for the fast-path models.
+
+    Subclasses are keyword-only, so fields keep the pydantic declaration
+    order even where optional fields come before required ones.
+    """
+
+
+class StreetLocation(Struct, kw_only=True):
+    """Represents a street location."""
+
+    latitude: float
+    longitude: float
+    street: Dict[str, str | int]
+
+
+class CrimeCategory(Struct, kw_only=True):
+    """Represents a crime category."""
+
+    name: str
+    url: str
+
+
+class CrimeStatus(Struct, kw_only=True):
+    """Represents a crime status."""
+
+    category: str
+    date: str
+
+
+class CrimeReport(Struct, kw_only=True):
+    """Represents a crime report."""
+
+    category: str
+    location_type: str | None = None
+    location: StreetLocation | None = None
+    context: str
+    id: int
+    month: str
+    outcome_status: CrimeStatus | None = None
+    persistent_id: str | None = None
+
+
+class AvailableDate(Struct, kw_only=True):
+    """Represents a month of published street-level crime data."""
+
+    date: str
+    stop_and_search: List[str] = msgspec.field(
+        default_factory=list, name="stop-and-search"
+    )
+
+
+class LastUpdated(Struct, kw_only=True):
+    """Represents the date crime data was last published."""
+
+    date: str
+
+
+class OutcomeCategory(Struct, kw_only=True):
+    """Represents a crime outcome category."""
+
+    code: str
+    name: str
+
+
+class LocationOutcome(Struct, kw_only=True):
+    """Represents a crime outcome."""
+
+    category: OutcomeCategory
+    date: str
+    person_id: str | None = None
+    crime: CrimeReport
+
+
+class CrimeOutcome(Struct, kw_only=True):
+    """Represents a crime outcome."""
+
+    category: OutcomeCategory
+    date: str
+    person_id: str | None = None
+
+
+class CrimeWithOutcomes(Struct, kw_only=True):
+    """Represents a crime report with its associated outcomes."""
+
+    crime: CrimeReport
+    outcomes: List[CrimeOutcome]
+
+
+class OutcomeObject(Struct, kw_only=True):
+    """Represents the outcome of a stop and search."""
+
+    id: str
+    name: str
+
+
+class StopAndSearch(Struct, kw_only=True):
+    """Represents a stop and search."""
+
+    type: str
+    involved_person: bool
+    datetime: datetime
+    operation: bool | None = None
+    operation_name: str | None = None
+    location: StreetLocation | None = None
+    gender: str | None = None
+    age_range: str | None = None
+    self_defined_ethnicity: str | None = None
+    officer_defined_ethnicity: str | None = None
+    legislation: str | None = None
+    object_of_search: str | None = None
+    outcome: str | bool | None = None
+    outcome_object: OutcomeObject | None = None
+    outcome_linked_to_object_of_search: bool | None = None
+    removal_of_more_than_outer_clothing: bool | None = None
+
+    def __post_init__(self) -> None:
+        """Parse the API's false placeholder for no outcome as None."""
+        if self.outcome is False:
+            self.outcome = None
+
+
+class EngagementMethod(Struct, kw_only=True):
+    """Represents a single engagement method for a police force."""
+
+    url: str
+    type: str | None = None
+    description: str | None = None
+    title: str
+
+
+class ForceSummary(Struct, kw_only=True):
+    """Represents the basic summary information returned by /forces."""
+
+    id: str
+    name: str
+
+
+class Force(Struct, kw_only=True):
+    """Represents a police force."""
+
+    description: str | None = None
+    url: str
+    engagement_methods: List[EngagementMethod]
+    telephone: str
+    id: str
+    name: str
+
+
+class Person(Struct, kw_only=True):
+    """Represents a person in a police force or neighbourhood."""
+
+    name: str
+    rank: str
+    bio: str | None = None
+    contact_details: dict = msgspec.field(default_factory=dict)
+
+
+class NeighbourhoodLinks(Struct, kw_only=True):
+    """Represents a follow-on link for a neighbourhood."""
+
+    url: str
+    description: str | None = None
+    title: str
+
+
+class NeighbourhoodResult(Struct, kw_only=True):
+    """Result from /locate-neighbourhood endpoint."""
+
+    force: str
+    neighbourhood: str
+
+
+class NeighbourhoodSummary(Struct, kw_only=True):
+    """Represents the basic summary returned by /neighbourhoods endpoint."""
+
+    id: str
+    name: str
+
+
+class NeighbourhoodLocation(Struct, kw_only=True):
+    """Represents a significant location within a neighbourhood."""
+
+    name: str | None = None
+    longitude: float | None = None
+    latitude: float | None = None
+    postcode: str | None = None
+    address: str | None = None
+    telephone: str | None = None
+    type: str
+    description: str | None = None
+
+
+class Neighbourhood(Struct, kw_only=True):
+    """Represents a neighbourhood."""
+
+    contact_details: dict = msgspec.field(default_factory=dict)
+    name: str
+    description: str | None = None
+    links: List[NeighbourhoodLinks]
+    id: str
+    centre: dict
+    locations: List[NeighbourhoodLocation]
+    url_force: str
+    population: str
+
+
+class NeighbourhoodEvent(Struct, kw_only=True):
+    """Represents a neighbourhood event, e.g. a beat meeting."""
+
+    contact_details: dict = msgspec.field(default_factory=dict)
+    title: str
+    description: str | None = None
+    address: str | None = None
+    type: str | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+
+class NeighbourhoodPriority(Struct, kw_only=True):
+    """Represents a policing priority set for a neighbourhood."""
+
+    issue: str | None = None
+    issue_date: datetime | None = msgspec.field(
+        default=None, name="issue-date"
+    )
+    action: str | None = None
+    action_date: datetime | None = msgspec.field(
+        default=None, name="action-date"
+    )
+
+
+class PostCode(Struct, kw_only=True):
+    """Represents a postcode in the UK."""
+
+    postcode: str
+    quality: int
+    eastings: int
+    northings: int
+    country: str
+    nhs_ha: str
+    longitude: float
+    latitude: float
+    european_electoral_region: str
+    primary_care_trust: str
+    region: str
+    lsoa: str
+    msoa: str
+    incode: str
+    outcode: str
+    parliamentary_constituency: str
+    admin_district: str
+    parish: str
+    admin_county: str | None = None
+    date_of_introduction: str
+    admin_ward: str
+    ced: str | None = None
+    ccg: str
+    nuts: str
+    pfa: str
+    codes: Dict[str, str | None]
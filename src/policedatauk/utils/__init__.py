@@ -1,15 +1,68 @@
-"""Initialisation file for utility submodule."""
+"""Initialisation file for utility submodule.
 
-from .dataframe import pydantic_to_df
+The DataFrame and catalogue utilities import polars (and shapely), so they
+are loaded on first access rather than with the package.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .concurrency import gather_limited
 from .dates import get_last_month
+from .decoding import DecoderName, JSONDecoder, JSONValue, get_decoder
+from .endpoints import endpoint_template
 from .geo import buffer_point, parse_lat_lon, parse_polygon
-from .retries import retry_with_backoff
+from .retries import RetryPolicy, retry_with_backoff
+from .streaming import JSONArrayParser
 from .validation import validate_date, validate_lat, validate_lon
 
+if TYPE_CHECKING:
+    from .catalogue import (
+        CATALOGUE_SCHEMA,
+        catalogue_boundaries,
+        catalogue_row,
+        load_catalogue,
+        save_catalogue,
+    )
+    from .dataframe import pydantic_to_df
+
+# Lazily loaded attribute -> submodule
+_LAZY = {
+    "CATALOGUE_SCHEMA": "catalogue",
+    "catalogue_boundaries": "catalogue",
+    "catalogue_row": "catalogue",
+    "load_catalogue": "catalogue",
+    "save_catalogue": "catalogue",
+    "pydantic_to_df": "dataframe",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the lazily loaded utilities on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
+    "RetryPolicy",
     "retry_with_backoff",
+    "save_catalogue",
     "buffer_point",
+    "CATALOGUE_SCHEMA",
+    "catalogue_boundaries",
+    "catalogue_row",
+    "DecoderName",
+    "JSONArrayParser",
+    "JSONDecoder",
+    "JSONValue",
+    "endpoint_template",
+    "gather_limited",
+    "get_decoder",
     "get_last_month",
+    "load_catalogue",
     "parse_lat_lon",
     "parse_polygon",
     "pydantic_to_df",
@@ -0,0 +1,110 @@
+"""Utilities for neighbourhood catalogue snapshots."""
+
+import json
+from pathlib import Path
+from typing import List
+
+import polars as pl
+import shapely
+from shapely.geometry import Polygon
+
+from .dataframe import _to_record
+
+CATALOGUE_SCHEMA = {
+    "force": pl.Utf8,
+    "neighbourhood_id": pl.Utf8,
+    "name": pl.Utf8,
+    "description": pl.Utf8,
+    "population": pl.Utf8,
+    "url_force": pl.Utf8,
+    "latitude": pl.Float64,
+    "longitude": pl.Float64,
+    "details": pl.Utf8,
+    "people": pl.Utf8,
+    "boundary": pl.Binary,
+    "error": pl.Utf8,
+}
+
+
+def catalogue_row(
+    force: str,
+    neighbourhood: object,
+    people: List[object] | None,
+    boundary: Polygon | None,
+    error: str | None = None,
+) -> dict:
+    """Build one catalogue row from a neighbourhood's fetched data.
+
+    Nested details (contact details, links, locations) and the people are
+    kept as JSON strings, which `str.json_decode` expands on demand, and the
+    boundary as WKB.
+
+    Args:
+        force: The ID of the police force.
+        neighbourhood: The neighbourhood (pydantic model or msgspec Struct).
+        people: The neighbourhood's people (officers), or None if they
+            could not be fetched.
+        boundary: The neighbourhood's boundary polygon, or None if it could
+            not be fetched.
+        error: Why part of the neighbourhood's data is missing.
+            Defaults to None.
+
+    Returns:
+        A dict matching CATALOGUE_SCHEMA.
+    """
+    details = _to_record(neighbourhood, exclude_none=True)
+    centre = details.get("centre") or {}
+    return {
+        "force": force,
+        "neighbourhood_id": details["id"],
+        "name": details["name"],
+        "description": details.get("description"),
+        "population": details.get("population"),
+        "url_force": details.get("url_force"),
+        "latitude": float(centre["latitude"]) if centre else None,
+        "longitude": float(centre["longitude"]) if centre else None,
+        "details": json.dumps(details),
+        "people": None
+        if people is None
+        else json.dumps(
+            [_to_record(person, exclude_none=True) for person in people]
+        ),
+        "boundary": None if boundary is None else shapely.to_wkb(boundary),
+        "error": error,
+    }
+
+
+def save_catalogue(df: pl.DataFrame, path: str | Path) -> None:
+    """Write a neighbourhood catalogue snapshot to a Parquet file.
+
+    Args:
+        df: The catalogue, as built by `build_catalogue`.
+        path: The Parquet file to write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.write_parquet(path, compression="zstd")
+
+
+def load_catalogue(path: str | Path) -> pl.DataFrame:
+    """Read a neighbourhood catalogue snapshot from a Parquet file.
+
+    Args:
+        path: The Parquet file to read.
+
+    Returns:
+        The catalogue DataFrame.
+    """
+    return pl.read_parquet(path)
+
+
+def catalogue_boundaries(df: pl.DataFrame) -> List[Polygon]:
+    """Decode the WKB boundaries of a catalogue to shapely Polygons.
+
+    Args:
+        df: The catalogue DataFrame.
+
+    Returns:
+        The boundary polygons, in row order.
+    """
+    return list(shapely.from_wkb(df["boundary"].to_numpy()))
@@ -0,0 +1,66 @@
+"""Utilities for running requests concurrently."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Iterable, List, TypeVar
+from weakref import WeakKeyDictionary
+
+T = TypeVar("T")
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[Any]],
+    limit: int,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Await many awaitables with at most `limit` running at once.
+
+    Args:
+        aws: The awaitables (e.g. resource method calls) to run.
+        limit: The maximum number of awaitables in flight.
+        return_exceptions: Whether to return exceptions in the results
+            instead of raising the first one, as in asyncio.gather.
+            Defaults to False.
+
+    Returns:
+        The results, in the same order as `aws`.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+class RefreshLock:
+    """An asyncio lock per event loop, for single-flight refreshes.
+
+    Shared state such as the availability index is thread-safe and may be
+    refreshed from several event loops (e.g. an AsyncPoliceClient and the
+    background loop of a PoliceClient), while an asyncio.Lock only works
+    on one loop. Calling the RefreshLock returns the running loop's lock.
+
+    Example:
+        async with self._refresh_lock():
+            if self.stale:
+                ...
+    """
+
+    def __init__(self) -> None:
+        """Initialise the RefreshLock class."""
+        self._locks: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = WeakKeyDictionary()
+        self._guard = threading.Lock()
+
+    def __call__(self) -> asyncio.Lock:
+        """Return the lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            if loop not in self._locks:
+                self._locks[loop] = asyncio.Lock()
+            return self._locks[loop]
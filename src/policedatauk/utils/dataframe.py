@@ -5,6 +5,8 @@ from typing import Dict, List
 import polars as pl
 from pydantic import BaseModel
 
+from .profiling import profiled
+
 RENAME_MAP = {
     "categories": {
         "name": "category_name",
@@ -28,7 +30,27 @@ RENAME_MAP = {
         "outcomes_category_code": "outcome_code",
         "outcomes_category_name": "outcome_name",
         "outcomes_date": "outcome_date",
+        # /outcomes-at-location: one row per outcome with its crime
+        "category_code": "outcome_code",
+        "category_name": "outcome_name",
+        "date": "outcome_date",
     },
+    "stops": {
+        "location_latitude": "latitude",
+        "location_longitude": "longitude",
+        "location_street_id": "street_id",
+        "location_street_name": "street_name",
+        "outcome_object_id": "outcome_code",
+        "outcome_object_name": "outcome_name",
+    },
+}
+
+# ISO 8601 timestamp columns parsed to datetimes, by rename key, with
+# their time zone (None for the API's naive local times)
+DATETIME_MAP = {
+    "stops": {"datetime": "UTC"},
+    "events": {"start_date": None, "end_date": None},
+    "priorities": {"issue_date": None, "action_date": None},
 }
 
 
@@ -86,36 +108,75 @@ def normalise_records(records: list[dict], sep: str = "_") -> list[dict]:
     return flat_records
 
 
+def _to_record(model: object, exclude_none: bool) -> dict:
+    """Dump a pydantic model or msgspec Struct to JSON-compatible data."""
+    if isinstance(model, BaseModel):
+        return model.model_dump(exclude_none=exclude_none, mode="json")
+    return _struct_to_builtins(model, exclude_none)
+
+
+def _struct_to_builtins(value: object, exclude_none: bool) -> object:
+    """Dump msgspec Structs keyed by attribute name, like model_dump.
+
+    msgspec.to_builtins uses the renamed wire keys (e.g. "issue-date"),
+    which would make the DataFrame columns depend on the model backend.
+    """
+    import msgspec
+
+    if isinstance(value, msgspec.Struct):
+        fields = (
+            (name, getattr(value, name)) for name in value.__struct_fields__
+        )
+        return {
+            name: _struct_to_builtins(field, exclude_none)
+            for name, field in fields
+            if not (exclude_none and field is None)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_struct_to_builtins(item, exclude_none) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: _struct_to_builtins(item, exclude_none)
+            for key, item in value.items()
+        }
+    return msgspec.to_builtins(value)
+
+
 def pydantic_to_df(
     models: BaseModel | List[BaseModel],
     sep: str = "_",
     exclude_none: bool = True,
     rename: Dict[str, str] | None = None,
     rename_key: str | None = None,
+    columns: Dict[str, list] | None = None,
 ) -> pl.DataFrame:
     """Converts Pydantic models into a Polars DataFrame.
 
+    msgspec Structs from `policedatauk.models.structs` are accepted too.
     Handles nested dicts with pl.json_normalize and optionally explodes
     list-of-dicts into rows + flattens them.
 
     Args:
-        models: Pydantic model/s.
+        models: Pydantic model/s or msgspec Struct/s.
         sep: Separator for flattened keys.
             Default is "_".
         exclude_none: Exclude fields containing Nones in model results.
         rename: Optional dict mapping old column names to new names.
         rename_key: Optional key to look up in RENAME_MAP for renaming.
             If provided, this will override the `rename` argument.
+        columns: Optional extra columns, one value per model, placed
+            before the model fields (e.g. the ID a result was fetched by).
 
     Returns:
         A Polars DataFrame.
     """
-    if isinstance(models, BaseModel):
-        records = [models.model_dump(exclude_none=exclude_none, mode="json")]
-    else:
+    if not isinstance(models, list):
+        models = [models]
+    records = [_to_record(model, exclude_none) for model in models]
+    if columns:
         records = [
-            model.model_dump(exclude_none=exclude_none, mode="json")
-            for model in models
+            {**{name: values[i] for name, values in columns.items()}, **record}
+            for i, record in enumerate(records)
         ]
 
     records = normalise_records(records, sep=sep)
@@ -127,6 +188,8 @@ def pydantic_to_df(
         df = df.rename(rename, strict=False)
 
     df = clean_polars_df(df)
+    if rename_key in DATETIME_MAP:
+        df = parse_timestamp_columns(df, DATETIME_MAP[rename_key])
     return df
 
 
@@ -223,6 +286,31 @@ def parse_datetime_columns(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
+def parse_timestamp_columns(
+    df: pl.DataFrame, columns: Dict[str, str | None]
+) -> pl.DataFrame:
+    """Parse ISO 8601 timestamp columns to datetimes.
+
+    Columns that are missing (e.g. dropped as empty) are skipped.
+
+    Args:
+        df: The input DataFrame.
+        columns: The names of the timestamp columns, mapped to their time
+            zone, or None to keep naive timestamps naive.
+
+    Returns:
+        DataFrame with the timestamp columns parsed.
+    """
+    return df.with_columns(
+        [
+            pl.col(column).str.to_datetime(time_zone=time_zone)
+            for column, time_zone in columns.items()
+            if df.schema.get(column) == pl.Utf8
+        ]
+    )
+
+
+@profiled
 def clean_polars_df(df: pl.DataFrame) -> pl.DataFrame:
     """
     Clean a Polars DataFrame from JSON API response data.
@@ -0,0 +1,60 @@
+"""Utilities for decoding JSON response bodies."""
+
+import json
+from typing import Callable, Dict, List, Literal
+
+# A decoded JSON document
+JSONValue = (
+    Dict[str, "JSONValue"]
+    | List["JSONValue"]
+    | str
+    | int
+    | float
+    | bool
+    | None
+)
+JSONDecoder = Callable[[bytes], JSONValue]
+DecoderName = Literal["auto", "orjson", "msgspec", "json"]
+
+
+def get_decoder(name: DecoderName = "auto") -> JSONDecoder:
+    """Return a function decoding raw JSON bytes into Python objects.
+
+    The optional orjson and msgspec backends decode large crime payloads
+    roughly 1.5-2x faster than the standard library (see
+    benchmarks/bench_decoding.py). Install them with the "fast" extra.
+
+    Args:
+        name: The backend to use. "auto" picks orjson, then msgspec, then
+            falls back to the standard library json module.
+            Defaults to "auto".
+
+    Returns:
+        The decoding function.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+        ValueError: If the backend name is not recognised.
+    """
+    if name not in ("auto", "orjson", "msgspec", "json"):
+        raise ValueError(f"Unknown JSON decoder: {name!r}")
+
+    if name in ("auto", "orjson"):
+        try:
+            import orjson
+
+            return orjson.loads
+        except ImportError:
+            if name == "orjson":
+                raise
+
+    if name in ("auto", "msgspec"):
+        try:
+            import msgspec
+
+            return msgspec.json.Decoder().decode
+        except ImportError:
+            if name == "msgspec":
+                raise
+
+    return json.loads
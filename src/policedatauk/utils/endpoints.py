@@ -0,0 +1,43 @@
+"""Utilities for grouping API endpoints."""
+
+# Path segments of the Police and Postcodes.io APIs; any other segment is
+# an ID (force, neighbourhood, crime, postcode) and grouped as "{id}"
+API_SEGMENTS = frozenset(
+    {
+        "all-crime",
+        "boundary",
+        "crime-categories",
+        "crime-last-updated",
+        "crimes-at-location",
+        "crimes-no-location",
+        "crimes-street",
+        "crimes-street-dates",
+        "events",
+        "forces",
+        "locate-neighbourhood",
+        "neighbourhoods",
+        "outcomes-at-location",
+        "outcomes-for-crime",
+        "people",
+        "priorities",
+        "stops-force",
+        "stops-no-location",
+        "stops-street",
+        "validate",
+    }
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Group an endpoint by replacing its IDs with "{id}".
+
+    Args:
+        endpoint: The endpoint, e.g. "/leicestershire/NC04/people".
+
+    Returns:
+        The endpoint template, e.g. "/{id}/{id}/people".
+    """
+    segments = endpoint.strip("/").split("/")
+    return "/" + "/".join(
+        segment if segment in API_SEGMENTS else "{id}" for segment in segments
+    )
@@ -1,16 +1,21 @@
-"""Utilities for geo parsing and data manipulation."""
+"""Utilities for geo parsing and data manipulation.
+
+pyproj and shapely are imported on first use, as loading them (and the
+PROJ database) is slow and most requests need neither.
+"""
+
+from __future__ import annotations
 
 import json
 import re
-from typing import Tuple
-
-import pyproj
-from shapely import wkt
-from shapely.geometry import Point, Polygon, mapping
-from shapely.ops import transform
+from typing import TYPE_CHECKING, Tuple
 
+from .profiling import profiled
 from .validation import validate_lat, validate_lon
 
+if TYPE_CHECKING:
+    from shapely.geometry import Polygon
+
 LAT_LON_REGEX = re.compile(
     r"""
         ^\s*                    # optional leading whitespace
@@ -30,6 +35,7 @@ API_POLYGON_REGEX = re.compile(
 )
 
 
+@profiled
 def buffer_point(
     lat: float, lon: float, radius_m: float, output: str = "wkt"
 ) -> str:
@@ -45,6 +51,10 @@ def buffer_point(
     Returns:
         str: WKT representation of the buffered polygon.
     """
+    import pyproj
+    from shapely.geometry import Point, mapping
+    from shapely.ops import transform
+
     validate_lat(lat)
     validate_lon(lon)
     wgs84 = pyproj.CRS("EPSG:4326")
@@ -102,6 +112,7 @@ def parse_lat_lon(coord: str) -> Tuple[float, float]:
     return lat, lon
 
 
+@profiled
 def parse_polygon(polygon: str | Polygon) -> str:
     """Parse a polygon string into the required format.
 
@@ -114,6 +125,9 @@ def parse_polygon(polygon: str | Polygon) -> str:
     Raises:
         ValueError if the polygon string is not valid.
     """
+    from shapely import wkt
+    from shapely.geometry import Polygon
+
     if isinstance(polygon, Polygon):
         if not polygon.is_valid:
             raise ValueError("Invalid polygon provided.")
@@ -0,0 +1,68 @@
+"""Process-wide timing of CPU-heavy helper functions."""
+
+import functools
+import time
+from typing import Callable, Protocol, TypeVar
+from weakref import WeakSet
+
+F = TypeVar("F", bound=Callable)
+
+
+class StageListener(Protocol):
+    """An object receiving the timings of `profiled` functions."""
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record one call of a profiled function."""
+        ...
+
+
+# Held weakly, so a discarded profiler stops receiving timings
+_listeners: "WeakSet[StageListener]" = WeakSet()
+
+
+def add_listener(listener: StageListener) -> None:
+    """Start passing the timings of profiled functions to a listener.
+
+    Args:
+        listener: The listener, e.g. a Profiler.
+    """
+    _listeners.add(listener)
+
+
+def remove_listener(listener: StageListener) -> None:
+    """Stop passing timings to a listener.
+
+    Args:
+        listener: The listener to remove.
+    """
+    _listeners.discard(listener)
+
+
+def profiled(func: F) -> F:
+    """Report the duration of every call of a function to the listeners.
+
+    The timings are process-wide, as helpers like `buffer_point` do not
+    know which client called them. Without listeners, the wrapper only
+    adds a truthiness check.
+
+    Args:
+        func: The function to time, reported under its name.
+
+    Returns:
+        The wrapped function.
+    """
+    stage = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> object:
+        if not _listeners:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - started
+            for listener in list(_listeners):
+                listener.record_stage(stage, seconds)
+
+    return wrapper
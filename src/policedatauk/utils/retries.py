@@ -1,16 +1,166 @@
 """Utilities for retrying HTTPX requests."""
 
-from typing import Callable
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict
 
 from httpx import HTTPStatusError, TimeoutException
 from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    stop_before_delay,
+    wait_random_exponential,
 )
 
-from ..exceptions import RateLimitError
+from ..exceptions import (
+    NetworkError,
+    PoliceAPIError,
+    TooManyCrimesError,
+    is_too_many_crimes,
+)
+
+DEFAULT_STATUS_RULES: Dict[int | str, bool] = {
+    "4xx": False,
+    429: True,
+    "5xx": True,
+    501: False,
+}
+
+
+def _status_code(exc: BaseException) -> int | None:
+    """Return the HTTP status code behind an exception, if there is one."""
+    if isinstance(exc, PoliceAPIError):
+        return exc.status_code
+    if isinstance(exc, HTTPStatusError):
+        return exc.response.status_code
+    # API 429s surface as RateLimitError raised from the HTTPStatusError
+    if isinstance(exc.__cause__, HTTPStatusError):
+        return exc.__cause__.response.status_code
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """Retry rules applied by the transports to every request.
+
+    Backoff is exponential with full jitter, and each call is bounded by a
+    total deadline covering rate limiter waits, attempts and backoff sleeps.
+
+    Args:
+        max_attempts: The maximum number of attempts per call.
+            Defaults to 5.
+        base_wait: The base wait time (in seconds) for exponential backoff.
+            Defaults to 1.
+        max_wait: The maximum wait time (in seconds) between attempts.
+            Defaults to 10.
+        deadline: The total time budget (in seconds) for a single call.
+            Defaults to 60. None disables the deadline.
+        status_rules: Whether a status code is retryable, keyed by exact
+            code (e.g. 503) or status class (e.g. "5xx"). Exact codes take
+            precedence over classes, and unlisted statuses are not retried.
+        retry_network: Whether to retry connection failures and timeouts.
+            Defaults to True.
+    """
+
+    max_attempts: int = 5
+    base_wait: float = 1
+    max_wait: float = 10
+    deadline: float | None = 60
+    status_rules: Dict[int | str, bool] = field(
+        default_factory=lambda: dict(DEFAULT_STATUS_RULES)
+    )
+    retry_network: bool = True
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Check whether a response status code should be retried.
+
+        Args:
+            status_code: The HTTP status code of the response.
+
+        Returns:
+            True if the request should be attempted again.
+        """
+        if status_code in self.status_rules:
+            return self.status_rules[status_code]
+        return self.status_rules.get(f"{status_code // 100}xx", False)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Check whether an exception raised by an attempt is retryable.
+
+        Local rate limit failures are never retried, as the limiter has
+        already waited for as long as the deadline allowed. Nor is the
+        Police API's 503 "too many crimes" answer, which the same request
+        gets every time; other 503s follow the status rules.
+
+        Args:
+            exc: The exception raised by the attempt.
+
+        Returns:
+            True if the request should be attempted again.
+        """
+        if isinstance(exc, TooManyCrimesError) or (
+            isinstance(exc, HTTPStatusError)
+            and is_too_many_crimes(exc.response)
+        ):
+            return False
+        status_code = _status_code(exc)
+        if status_code is not None:
+            return self.is_retryable_status(status_code)
+        if isinstance(exc, (NetworkError, TimeoutException)):
+            return self.retry_network
+        return False
+
+    def remaining(self, started: float) -> float | None:
+        """Return the unused part of the deadline for a call.
+
+        Args:
+            started: The time.monotonic() value when the call started.
+
+        Returns:
+            The remaining budget in seconds, or None if there is no deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - (time.monotonic() - started))
+
+    def _wait(self) -> Callable[[RetryCallState], float]:
+        """Build the jittered wait, clipped to the remaining deadline."""
+        jitter = wait_random_exponential(
+            multiplier=self.base_wait, max=self.max_wait
+        )
+
+        def wait(retry_state: RetryCallState) -> float:
+            delay = jitter(retry_state)
+            if self.deadline is None:
+                return delay
+            spent = retry_state.seconds_since_start or 0.0
+            return max(0.0, min(delay, self.deadline - spent))
+
+        return wait
+
+    def tenacity_kwargs(self) -> dict:
+        """Return the keyword arguments for a tenacity retry controller."""
+        stop = stop_after_attempt(self.max_attempts)
+        if self.deadline is not None:
+            stop = stop | stop_before_delay(self.deadline)
+        return {
+            "retry": retry_if_exception(self.is_retryable),
+            "stop": stop,
+            "wait": self._wait(),
+            "reraise": True,
+        }
+
+    def retrying(self) -> Retrying:
+        """Return a synchronous tenacity retry controller for one call."""
+        return Retrying(**self.tenacity_kwargs())
+
+    def async_retrying(self) -> AsyncRetrying:
+        """Return an asynchronous tenacity retry controller for one call."""
+        return AsyncRetrying(**self.tenacity_kwargs())
 
 
 def retry_with_backoff(
@@ -18,9 +168,8 @@ def retry_with_backoff(
 ) -> Callable:
     """Create a retry strategy for HTTPX requests.
 
-    Configures and returns a retry decorator using the tenacity library.
-    The retry strategy handles exceptions of types HTTPStatusError and
-    TimeoutException with exponential backoff.
+    Configures and returns a retry decorator using the tenacity library,
+    following the default RetryPolicy rules with jittered backoff.
 
     Args:
         max_attempts: The maximum number of retry attempts.
@@ -28,17 +177,12 @@ def retry_with_backoff(
         base_wait: The base wait time (in seconds) for exponential backoff.
             Defaults to 1.
         max_wait: The maximum wait time (in seconds) for exponential backoff.
-            Defaults to 4.
+            Defaults to 10.
 
     Returns:
         A tenacity.retry decorator configured with specified retry strategy.
     """
-
-    return retry(
-        retry=retry_if_exception_type(
-            (HTTPStatusError, TimeoutException, RateLimitError)
-        ),
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=base_wait, max=max_wait),
-        reraise=True,
+    policy = RetryPolicy(
+        max_attempts=max_attempts, base_wait=base_wait, max_wait=max_wait
     )
+    return retry(**policy.tenacity_kwargs())
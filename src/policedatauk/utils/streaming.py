@@ -0,0 +1,102 @@
+"""Utilities for parsing JSON array response bodies as they download."""
+
+import codecs
+import json
+import re
+from typing import Any, List, Literal
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayParser:
+    """Incremental parser for a JSON array, yielding items as they arrive.
+
+    Feed the response body chunk by chunk: each call returns the items
+    completed so far, so only one partial item is ever buffered and the
+    whole document never needs to be in memory. Items are decoded with
+    the standard library, as the faster backends cannot resume from a
+    partial buffer.
+
+    Example:
+        parser = JSONArrayParser()
+        for chunk in response.iter_bytes():
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self) -> None:
+        """Initialise the JSONArrayParser class."""
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state: Literal["start", "first", "item", "separator", "done"]
+        self._state = "start"
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body.
+
+        Args:
+            chunk: The next bytes of the body.
+
+        Returns:
+            The items completed by this chunk, in order.
+
+        Raises:
+            ValueError: If the body is not a JSON array.
+        """
+        self.bytes_read += len(chunk)
+        self._buffer += self._text.decode(chunk)
+        items = []
+        pos = 0
+        buffer = self._buffer
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                pos += 1
+                self._state = "first"
+            elif self._state == "first" and char == "]":
+                # An empty array
+                pos += 1
+                self._state = "done"
+            elif self._state == "separator":
+                if char == ",":
+                    self._state = "item"
+                elif char == "]":
+                    self._state = "done"
+                else:
+                    raise ValueError(f"Unexpected {char!r} in JSON array")
+                pos += 1
+            elif self._state in ("first", "item"):
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # The item is still downloading
+                after = _WHITESPACE.match(buffer, end).end()
+                if after == len(buffer) or buffer[after] not in ",]":
+                    # Wait for the delimiter: the chunk may have cut a
+                    # number short, e.g. "1" of "1.5"
+                    break
+                items.append(item)
+                pos = end
+                self._state = "separator"
+            else:
+                raise ValueError("Unexpected data after the JSON array")
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array was received.
+
+        Raises:
+            ValueError: If the body ended before the array did.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        if self._state != "done" or self._buffer.strip():
+            raise ValueError("The JSON array is incomplete")
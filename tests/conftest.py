@@ -6,7 +6,10 @@ import pytest
 import respx
 from aiolimiter import AsyncLimiter
 
-from policedatauk import PoliceClient
+from policedatauk import AsyncPoliceClient, PoliceClient
+
+POLICE_URL = "https://data.police.uk/api"
+POSTCODE_URL = "https://api.postcodes.io/postcodes"
 
 
 @pytest.fixture
@@ -44,3 +47,29 @@ def postcode_mock_respx(
     """Fixture to provide a respx mock for the Postcodes.io API."""
     with respx.mock(base_url=api_client.postcode_url) as mock:
         yield mock
+
+
+@pytest.fixture
+def sync_client() -> Generator[PoliceClient, None, None]:
+    """Fixture to provide a PoliceClient instance."""
+    yield PoliceClient()
+
+
+@pytest.fixture
+def async_client() -> Generator[AsyncPoliceClient, None, None]:
+    """Fixture to provide an AsyncPoliceClient instance."""
+    yield AsyncPoliceClient()
+
+
+@pytest.fixture
+def police_api() -> Generator[respx.MockRouter, None, None]:
+    """Fixture to provide a respx mock for the Police Data API."""
+    with respx.mock(base_url=POLICE_URL) as mock:
+        yield mock
+
+
+@pytest.fixture
+def postcode_api() -> Generator[respx.MockRouter, None, None]:
+    """Fixture to provide a respx mock for the Postcodes.io API."""
+    with respx.mock(base_url=POSTCODE_URL) as mock:
+        yield mock
@@ -1,10 +1,16 @@
 """Tests for crimes-related functionality."""
 
+import asyncio
+import json
+
+import httpx
 import polars as pl
 import pytest
 from respx import MockRouter
 
-from policedatauk import PoliceClient
+from policedatauk import AsyncPoliceClient, DataNotAvailableError, PoliceClient
+from policedatauk.exceptions import BadRequestError
+from policedatauk.models import CrimeReport
 from policedatauk.utils.dataframe import pydantic_to_df
 
 
@@ -141,3 +147,460 @@ async def test_no_geo_params(api_client: PoliceClient) -> None:
     """Tests get_crimes_by_location fails when no geo params provided."""
     with pytest.raises(ValueError):
         await api_client.crimes.get_crimes_by_location()
+
+
+def test_crimes_by_locations_bulk(
+    sync_client: PoliceClient, police_api: MockRouter
+) -> None:
+    """Tests get_crimes_by_locations combines the crimes of every polygon."""
+    crime = {
+        "category": "burglary",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.343315",
+            "street": {"id": 2043533, "name": "On or near Kennedy Road"},
+            "longitude": "0.417594",
+        },
+        "context": "",
+        "outcome_status": None,
+        "persistent_id": "",
+        "id": 1,
+        "month": "2024-01",
+    }
+    route = police_api.post("/crimes-street/all-crime").respond(
+        200, json=[crime]
+    )
+
+    crimes = sync_client.crimes.get_crimes_by_locations(
+        [
+            "52.268,0.543:52.794,0.238:52.130,0.478",
+            "52.168,0.543:52.694,0.238:52.030,0.478",
+        ],
+        date="2024-01",
+        to_polars=True,
+    )
+
+    assert crimes.height == 2
+    assert route.call_count == 2
+
+
+async def test_crimes_msgspec_models(police_api: MockRouter) -> None:
+    """Tests the msgspec backend returns Structs matching the pydantic path."""
+    structs = pytest.importorskip("policedatauk.models.structs")
+    crime = {
+        "category": "burglary",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.343315",
+            "street": {"id": 2043533, "name": "On or near Kennedy Road"},
+            "longitude": "0.417594",
+        },
+        "context": "",
+        "outcome_status": {
+            "category": "Under investigation",
+            "date": "2024-01",
+        },
+        "persistent_id": "abc",
+        "id": 1,
+        "location_subtype": "",
+        "month": "2024-01",
+    }
+    police_api.post("/crimes-street/all-crime").respond(200, json=[crime])
+    fast = AsyncPoliceClient(model_backend="msgspec")
+    default = AsyncPoliceClient()
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+
+    crimes = await fast.crimes.get_crimes_by_location(poly=poly)
+    fast_df = await fast.crimes.get_crimes_by_location(
+        poly=poly, to_polars=True
+    )
+    default_df = await default.crimes.get_crimes_by_location(
+        poly=poly, to_polars=True
+    )
+
+    assert isinstance(crimes[0], structs.CrimeReport)
+    assert crimes[0].location.street["name"] == "On or near Kennedy Road"
+    assert fast_df.equals(default_df)
+
+
+async def test_backends_share_columns(police_api: MockRouter) -> None:
+    """Tests renamed fields give the same columns with either backend."""
+    pytest.importorskip("msgspec")
+    police_api.get("/crimes-street-dates").respond(
+        200, json=[{"date": "2024-01", "stop-and-search": ["kent"]}]
+    )
+
+    fast = await AsyncPoliceClient(
+        model_backend="msgspec"
+    ).crimes.get_available_dates(to_polars=True)
+    default = await AsyncPoliceClient().crimes.get_available_dates(
+        to_polars=True
+    )
+
+    assert fast.columns == default.columns == ["date", "stop_and_search"]
+    assert fast.equals(default)
+
+
+async def test_crimes_trusted_validation(police_api: MockRouter) -> None:
+    """Tests trusted validation builds the same nested pydantic models."""
+    crime = {
+        "category": "burglary",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.343315",
+            "street": {"id": 2043533, "name": "On or near Kennedy Road"},
+            "longitude": "0.417594",
+        },
+        "context": "",
+        "outcome_status": None,
+        "persistent_id": "abc",
+        "id": 1,
+        "month": "2024-01",
+    }
+    police_api.post("/crimes-street/all-crime").respond(200, json=[crime])
+    trusted = AsyncPoliceClient(validate="trusted")
+    default = AsyncPoliceClient()
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+
+    crimes = await trusted.crimes.get_crimes_by_location(poly=poly)
+    expected = await default.crimes.get_crimes_by_location(poly=poly)
+
+    assert isinstance(crimes[0], CrimeReport)
+    assert crimes == expected
+
+
+@pytest.mark.parametrize(
+    ("coordinates", "latitude", "dtype"),
+    [("float", 52.343315, pl.Float64), ("str", "52.343315", pl.Utf8)],
+)
+async def test_crime_coordinates(
+    police_api: MockRouter,
+    coordinates: str,
+    latitude: float | str,
+    dtype: pl.DataType,
+) -> None:
+    """Tests coordinates are floats, or raw strings in legacy mode."""
+    crime = {
+        "category": "burglary",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.343315",
+            "street": {"id": 2043533, "name": "On or near Kennedy Road"},
+            "longitude": "0.417594",
+        },
+        "context": "",
+        "outcome_status": None,
+        "persistent_id": "abc",
+        "id": 1,
+        "month": "2024-01",
+    }
+    police_api.post("/crimes-street/all-crime").respond(200, json=[crime])
+    client = AsyncPoliceClient(coordinates=coordinates)
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+
+    crimes = await client.crimes.get_crimes_by_location(poly=poly)
+    df = await client.crimes.get_crimes_by_location(poly=poly, to_polars=True)
+
+    assert crimes[0].location.latitude == latitude
+    assert df.schema["location_latitude"] == dtype
+
+
+async def test_outcomes_for_crimes_bulk(police_api: MockRouter) -> None:
+    """Tests bulk outcomes dedupe IDs, skip 404s and cache closed cases."""
+
+    def case(persistent_id: str, code: str) -> dict:
+        return {
+            "crime": {
+                "category": "burglary",
+                "location_type": "Force",
+                "location": None,
+                "context": "",
+                "persistent_id": persistent_id,
+                "id": 1,
+                "month": "2024-01",
+            },
+            "outcomes": [
+                {
+                    "category": {"code": "under-investigation", "name": "U"},
+                    "date": "2024-01",
+                    "person_id": None,
+                },
+                {
+                    "category": {"code": code, "name": code},
+                    "date": "2024-02",
+                    "person_id": None,
+                },
+            ],
+        }
+
+    closed = police_api.post("/outcomes-for-crime/closed").respond(
+        200, json=case("closed", "unable-to-prosecute")
+    )
+    still_open = police_api.post("/outcomes-for-crime/open").respond(
+        200, json=case("open", "awaiting-court-result")
+    )
+    police_api.post("/outcomes-for-crime/unknown").respond(404)
+    client = AsyncPoliceClient()
+    ids = ["closed", "open", "closed", "unknown"]
+
+    first = await client.crimes.get_outcomes_for_crimes(ids)
+    df = await client.crimes.get_outcomes_for_crimes(ids, to_polars=True)
+
+    assert [c.crime.persistent_id for c in first] == ["closed", "open"]
+    assert closed.call_count == 1
+    assert still_open.call_count == 2
+    assert df.height == 4
+    assert df["outcome_code"].to_list()[1] == "unable-to-prosecute"
+
+    # Cached cases are copies, and hits refresh their place in the LRU order
+    first[0].outcomes.clear()
+    police_api.post("/outcomes-for-crime/other").respond(
+        200, json=case("other", "unable-to-prosecute")
+    )
+    client.crimes.max_cached_cases = 2
+    await client.crimes.get_outcomes_for_crimes(["other"])
+    await client.crimes.get_outcomes_for_crimes(["closed"])
+    assert list(client.crimes._closed_cases) == ["other", "closed"]
+    (again,) = await client.crimes.get_outcomes_for_crimes(["closed"])
+    assert len(again.outcomes) == 2
+
+
+def test_outcomes_by_location(
+    sync_client: PoliceClient, police_api: MockRouter
+) -> None:
+    """Tests get_outcomes_by_location returns one renamed row per outcome."""
+    outcome = {
+        "category": {"code": "no-further-action", "name": "No action"},
+        "date": "2024-01",
+        "person_id": None,
+        "crime": {
+            "category": "burglary",
+            "location_type": "Force",
+            "location": {
+                "latitude": "52.343315",
+                "street": {"id": 2043533, "name": "On or near Kennedy Road"},
+                "longitude": "0.417594",
+            },
+            "context": "",
+            "persistent_id": "abc",
+            "id": 1,
+            "location_subtype": "",
+            "month": "2023-12",
+        },
+    }
+    route = police_api.post("/outcomes-at-location").respond(
+        200, json=[outcome, outcome]
+    )
+
+    df = sync_client.crimes.get_outcomes_by_location(
+        poly="52.268,0.543:52.794,0.238:52.130,0.478",
+        date="2024-01",
+        to_polars=True,
+    )
+
+    assert route.calls.last.request.content == (
+        b"date=2024-01&poly=52.268%2C0.543%3A52.794%2C0.238%3A52.130%2C0.478"
+    )
+    assert df.height == 2
+    assert {"outcome_code", "outcome_date", "persistent_id"} <= set(df.columns)
+    assert df["latitude"].to_list() == [52.343315, 52.343315]
+
+
+async def test_availability_index(police_api: MockRouter) -> None:
+    """Tests unpublished months fail locally without a crimes request."""
+    dates = police_api.get("/crimes-street-dates").respond(
+        200,
+        json=[
+            {"date": "2024-01", "stop-and-search": ["kent"]},
+            {"date": "2023-12", "stop-and-search": []},
+        ],
+    )
+    crimes = police_api.post("/crimes-street/all-crime").respond(200, json=[])
+    client = AsyncPoliceClient(check_availability=True)
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+
+    with pytest.raises(DataNotAvailableError):
+        await client.crimes.get_crimes_by_location(poly=poly, date="2024-02")
+    skipped = await client.crimes.get_crimes_by_locations(
+        [poly, poly], date="2024-02"
+    )
+    await client.crimes.get_crimes_by_location(poly=poly, date="2024-01")
+
+    assert skipped == []
+    assert crimes.call_count == 1
+    assert dates.call_count == 1
+    assert client.availability.latest_month == "2024-01"
+    assert client.availability.has_stop_and_search("kent", "2024-01")
+
+
+async def test_availability_single_flight(police_api: MockRouter) -> None:
+    """Tests concurrent callers share one availability index refresh."""
+    released = asyncio.Event()
+
+    async def slow_dates(request: httpx.Request) -> httpx.Response:
+        await released.wait()
+        return httpx.Response(
+            200, json=[{"date": "2024-01", "stop-and-search": []}]
+        )
+
+    dates = police_api.get("/crimes-street-dates").mock(side_effect=slow_dates)
+    police_api.post("/crimes-street/all-crime").respond(200, json=[])
+    client = AsyncPoliceClient(check_availability=True)
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+    asyncio.get_running_loop().call_later(0.05, released.set)
+
+    await asyncio.gather(
+        *(
+            client.crimes.get_crimes_by_location(poly=poly, date="2024-01")
+            for _ in range(10)
+        )
+    )
+
+    assert dates.call_count == 1
+
+
+async def test_last_updated_versioned_cache(police_api: MockRouter) -> None:
+    """Tests the default month and cache follow /crime-last-updated."""
+    last_updated = police_api.get("/crime-last-updated").respond(
+        200, json={"date": "2024-01-01"}
+    )
+    crimes = police_api.post("/crimes-street/all-crime").respond(
+        200, json=[street_crime(1, 883407)]
+    )
+    client = AsyncPoliceClient(cache_size=8)
+    poly = "52.268,0.543:52.794,0.238:52.130,0.478"
+
+    first = await client.crimes.get_crimes_by_location(poly=poly)
+    first[0].category = "changed"  # Results are copies of the cached ones
+    cached = await client.crimes.get_crimes_by_location(
+        poly=poly, date="2024-01"
+    )
+    assert cached[0].category == "burglary"
+    assert crimes.call_count == 1
+    assert b"date=2024-01" in crimes.calls.last.request.content
+
+    # A new publication invalidates the cached results
+    last_updated.respond(200, json={"date": "2024-02-01"})
+    client.updates.invalidate()
+    await client.crimes.get_crimes_by_location(poly=poly, date="2024-01")
+
+    assert crimes.call_count == 2
+    assert last_updated.call_count == 2
+    assert client.updates.latest_month == "2024-02"
+
+
+async def test_last_updated_single_flight(police_api: MockRouter) -> None:
+    """Tests concurrent callers share one /crime-last-updated poll."""
+    released = asyncio.Event()
+
+    async def slow_poll(request: httpx.Request) -> httpx.Response:
+        await released.wait()
+        return httpx.Response(200, json={"date": "2024-01-01"})
+
+    last_updated = police_api.get("/crime-last-updated").mock(
+        side_effect=slow_poll
+    )
+    police_api.get("/crimes-at-location").respond(200, json=[])
+    client = AsyncPoliceClient(cache_size=8)
+    asyncio.get_running_loop().call_later(0.05, released.set)
+
+    await asyncio.gather(
+        *(
+            client.crimes.get_crimes_at_location(street_id, date="2024-01")
+            for street_id in range(10)
+        )
+    )
+    await client.crimes.get_crimes_at_locations(range(10, 20), date="2024-01")
+
+    assert last_updated.call_count == 1
+
+
+def street_crime(crime_id: int, street_id: int) -> dict:
+    """Build a minimal street-level crime for a street ID."""
+    return {
+        "category": "burglary",
+        "location": {
+            "latitude": "52.6",
+            "longitude": "-1.1",
+            "street": {"id": street_id, "name": "On or near High Street"},
+        },
+        "context": "",
+        "id": crime_id,
+        "month": "2024-01",
+    }
+
+
+async def test_crimes_at_locations_street_index(
+    police_api: MockRouter,
+) -> None:
+    """Tests street ID watchlists are fetched once per ID and indexed."""
+    route = police_api.get("/crimes-at-location").mock(
+        side_effect=lambda request: httpx.Response(
+            200,
+            json=[street_crime(1, int(request.url.params["location_id"]))],
+        )
+    )
+    client = AsyncPoliceClient(index_streets=True)
+
+    crimes = await client.crimes.get_crimes_at_locations(
+        [883407, 883408, 883407], date="2024-01"
+    )
+
+    assert route.call_count == 2
+    assert route.calls.last.request.url.params["date"] == "2024-01"
+    assert len(crimes) == 2
+    assert len(client.streets) == 2
+    assert client.streets.get(883407) == (52.6, -1.1)
+    assert client.streets.missing([883407, 1]) == [1]
+    assert client.streets.within("52.5,-1.2:52.7,-1.2:52.7,-1.0") == [
+        883407,
+        883408,
+    ]
+    assert client.streets.to_polars().height == 2
+
+
+def test_stream_crimes_by_location(police_api: MockRouter) -> None:
+    """Tests crimes are parsed in batches from a chunked response."""
+    body = json.dumps([street_crime(i, 883407 + i) for i in range(25)])
+    chunks = [body[i : i + 37].encode() for i in range(0, len(body), 37)]
+    police_api.post("/crimes-street/all-crime").mock(
+        side_effect=lambda request: httpx.Response(200, content=iter(chunks))
+    )
+    client = PoliceClient(index_streets=True)
+
+    batches = list(
+        client.crimes.stream_crimes_by_location(
+            lat=52.63, lon=-1.13, date="2024-01", batch_size=10
+        )
+    )
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert isinstance(batches[0][0], CrimeReport)
+    assert batches[-1][-1].id == 24
+    assert len(client.streets) == 25
+
+    frames = client.crimes.stream_crimes_by_location(
+        lat=52.63, lon=-1.13, date="2024-01", batch_size=10, to_polars=True
+    )
+    assert pl.concat(frames, how="diagonal_relaxed").height == 25
+
+
+async def test_stream_crimes_errors(police_api: MockRouter) -> None:
+    """Tests streamed error responses raise before any batch."""
+    police_api.post("/crimes-street/all-crime").mock(
+        side_effect=[
+            httpx.Response(400, text="Bad polygon"),
+            httpx.Response(200, content=b'[{"category": "burglary"'),
+        ]
+    )
+    client = AsyncPoliceClient()
+
+    with pytest.raises(BadRequestError, match="Bad polygon"):
+        async for _ in client.crimes.stream_crimes_by_location(
+            lat=52.63, lon=-1.13, date="2024-01"
+        ):
+            pass
+    with pytest.raises(ValueError, match="incomplete"):
+        async for _ in client.crimes.stream_crimes_by_location(
+            lat=52.63, lon=-1.13, date="2024-01"
+        ):
+            pass
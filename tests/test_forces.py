@@ -1,9 +1,19 @@
 """Tests for forces-related functionality."""
 
 import pytest
+import respx
 from respx import MockRouter
 
-from policedatauk import PoliceClient
+from policedatauk import AsyncPoliceClient, PoliceClient
+
+FORCE = {
+    "description": None,
+    "url": "http://www.leics.police.uk/",
+    "engagement_methods": [
+        {"url": "http://www.twitter.com/leicspolice", "title": "twitter"}
+    ],
+    "telephone": "101",
+}
 
 
 @pytest.mark.asyncio
@@ -33,3 +43,58 @@ async def test_get_all_forces(
     assert forces[0].id == "avon-and-somerset"
     assert forces[1].name == "Bedfordshire Police"
     assert mock_route.called
+
+
+def test_get_specific_forces_bulk(
+    sync_client: PoliceClient, police_api: MockRouter
+) -> None:
+    """Tests the sync bulk method runs on the background event loop."""
+    for force_id in ("leicestershire", "lincolnshire"):
+        police_api.get(f"/forces/{force_id}").respond(
+            200, json={**FORCE, "id": force_id, "name": force_id.title()}
+        )
+    police_api.get("/forces/nowhere").respond(404)
+
+    forces = sync_client.forces.get_specific_forces(
+        ["leicestershire", "nowhere", "lincolnshire"]
+    )
+
+    assert sorted(force.id for force in forces) == [
+        "leicestershire",
+        "lincolnshire",
+    ]
+    df = sync_client.forces.get_specific_forces(
+        ["leicestershire"], to_polars=True
+    )
+    assert df.height == 1
+
+
+async def test_get_specific_forces_async(
+    async_client: AsyncPoliceClient, police_api: MockRouter
+) -> None:
+    """Tests the async bulk method drops forces that failed."""
+    police_api.get("/forces/leicestershire").respond(
+        200, json={**FORCE, "id": "leicestershire", "name": "Leicestershire"}
+    )
+    police_api.get("/forces/nowhere").respond(404)
+
+    forces = await async_client.forces.get_specific_forces(
+        ["leicestershire", "nowhere"]
+    )
+
+    assert [force.id for force in forces] == ["leicestershire"]
+
+
+def test_custom_base_url() -> None:
+    """Tests clients can be pointed at a mirror or local stand-in."""
+    with respx.mock(base_url="http://127.0.0.1:8000/api") as mirror:
+        route = mirror.get("/forces").respond(
+            200, json=[{"id": "kent", "name": "Kent Police"}]
+        )
+        client = PoliceClient(police_url="http://127.0.0.1:8000/api")
+
+        forces = client.forces.get_all_forces()
+
+    assert route.called
+    assert forces[0].id == "kent"
+    assert client.postcode_url == client.POSTCODE_URL
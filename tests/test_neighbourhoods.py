@@ -0,0 +1,203 @@
+"""Tests for neighbourhood-related functionality."""
+
+from pathlib import Path
+
+import httpx
+import polars as pl
+import pytest
+from respx import MockRouter
+
+from policedatauk import AsyncPoliceClient, PoliceClient
+from policedatauk.utils import catalogue_boundaries
+
+NEIGHBOURHOOD = {
+    "contact_details": {"email": "team@example.police.uk"},
+    "name": "City Centre",
+    "description": None,
+    "links": [],
+    "id": "NC04",
+    "centre": {"latitude": "52.6389", "longitude": "-1.1350"},
+    "locations": [],
+    "url_force": "http://www.leics.police.uk/local-policing/city-centre",
+    "population": "0",
+}
+BOUNDARY = [
+    {"latitude": "52.60", "longitude": "-1.20"},
+    {"latitude": "52.70", "longitude": "-1.20"},
+    {"latitude": "52.70", "longitude": "-1.10"},
+]
+
+
+def test_build_catalogue_snapshot(
+    police_api: MockRouter, tmp_path: Path
+) -> None:
+    """Tests the catalogue is fetched once, then reloaded from Parquet."""
+    summaries = police_api.get("/leicestershire/neighbourhoods").respond(
+        200,
+        json=[
+            {"id": "NC04", "name": "City Centre"},
+            {"id": "NC66", "name": "Cultural Quarter"},
+        ],
+    )
+    police_api.get(url__regex=r"/leicestershire/NC\d+$").respond(
+        200, json=NEIGHBOURHOOD
+    )
+    people = police_api.get(url__regex=r"/NC\d+/people$").respond(
+        200, json=[{"name": "Andy Cooper", "rank": "Sgt"}]
+    )
+    police_api.get(url__regex=r"/NC\d+/boundary$").respond(200, json=BOUNDARY)
+    client = PoliceClient()
+    path = tmp_path / "leicestershire.parquet"
+
+    catalogue = client.neighbourhoods.build_catalogue("leicestershire", path)
+    reloaded = client.neighbourhoods.build_catalogue("leicestershire", path)
+
+    assert summaries.call_count == 1
+    assert people.call_count == 2
+    assert path.exists()
+    assert reloaded.equals(catalogue)
+    assert catalogue["latitude"].to_list() == [52.6389, 52.6389]
+    assert catalogue_boundaries(reloaded)[0].bounds == (
+        -1.2,
+        52.6,
+        -1.1,
+        52.7,
+    )
+    officer = reloaded["people"].str.json_decode().list.first()[0]
+    assert officer["name"] == "Andy Cooper"
+
+
+def test_build_catalogue_partial_failures(
+    police_api: MockRouter, tmp_path: Path
+) -> None:
+    """Tests failed neighbourhoods keep null rows and snapshots check force."""
+    police_api.get("/kent/neighbourhoods").respond(
+        200,
+        json=[
+            {"id": "NC04", "name": "City Centre"},
+            {"id": "NC66", "name": "Cultural Quarter"},
+            {"id": "NC99", "name": "Gone"},
+        ],
+    )
+    police_api.get("/kent/NC99").respond(404)
+    police_api.get(url__regex=r"/kent/NC\d+$").respond(200, json=NEIGHBOURHOOD)
+    police_api.get(url__regex=r"/NC\d+/people$").respond(200, json=[])
+    police_api.get("/kent/NC66/boundary").respond(404)
+    police_api.get(url__regex=r"/NC\d+/boundary$").respond(200, json=BOUNDARY)
+    client = PoliceClient()
+    path = tmp_path / "catalogue.parquet"
+
+    catalogue = client.neighbourhoods.build_catalogue("kent", path)
+
+    assert catalogue["name"].to_list() == [
+        "City Centre",
+        "City Centre",
+        "Gone",
+    ]
+    assert catalogue["boundary"].is_null().to_list() == [False, True, False]
+    assert catalogue["people"].is_null().to_list() == [False, False, False]
+    errors = catalogue["error"].to_list()
+    assert errors[0] is None
+    assert errors[1].startswith("NotFoundError")
+    assert errors[2].startswith("NotFoundError")
+    with pytest.raises(ValueError, match="is of kent"):
+        client.neighbourhoods.build_catalogue("leicestershire", path)
+
+
+@pytest.mark.parametrize("model_backend", ["pydantic", "msgspec"])
+async def test_all_priorities_and_events(
+    police_api: MockRouter, model_backend: str
+) -> None:
+    """Tests bulk events / priorities are keyed by force and neighbourhood."""
+    for force in ("leicestershire", "kent"):
+        police_api.get(f"/{force}/neighbourhoods").respond(
+            200, json=[{"id": "NC04", "name": "City Centre"}]
+        )
+    priorities = police_api.get(url__regex=r"/NC04/priorities$").respond(
+        200,
+        json=[
+            {
+                "action": None,
+                "issue-date": "2024-05-18T00:00:00",
+                "action-date": None,
+                "issue": "<p>Anti-social behaviour</p>",
+            }
+        ],
+    )
+    police_api.get(url__regex=r"/NC04/events$").respond(
+        200,
+        json=[
+            {
+                "contact_details": {},
+                "description": None,
+                "title": "Beat meeting",
+                "address": "Town Hall",
+                "type": "meeting",
+                "start_date": "2024-09-17T12:00:00",
+                "end_date": "2024-09-17T14:00:00",
+            }
+        ],
+    )
+    client = AsyncPoliceClient(model_backend=model_backend)
+
+    df = await client.neighbourhoods.get_all_priorities(
+        ["leicestershire", "kent"], to_polars=True
+    )
+    events = await client.neighbourhoods.get_all_events("kent")
+
+    assert priorities.call_count == 2
+    assert df["force"].to_list() == ["leicestershire", "kent"]
+    assert df["neighbourhood_id"].to_list() == ["NC04", "NC04"]
+    assert df.schema["issue_date"] == pl.Datetime("us")
+    assert list(events) == [("kent", "NC04")]
+    assert events["kent", "NC04"][0].title == "Beat meeting"
+
+
+async def test_all_priorities_skip_failures(police_api: MockRouter) -> None:
+    """Tests failed forces and neighbourhoods are left out of bulk results."""
+    police_api.get("/kent/neighbourhoods").respond(
+        200,
+        json=[
+            {"id": "NC04", "name": "City Centre"},
+            {"id": "NC66", "name": "Cultural Quarter"},
+        ],
+    )
+    police_api.get("/nowhere/neighbourhoods").respond(404)
+    police_api.get("/kent/NC04/priorities").respond(200, json=[])
+    police_api.get("/kent/NC66/priorities").respond(404)
+    client = AsyncPoliceClient()
+
+    results = await client.neighbourhoods.get_all_priorities(
+        ["kent", "nowhere"]
+    )
+
+    assert results == {("kent", "NC04"): []}
+
+
+def test_locate_neighbourhoods_dedup(police_api: MockRouter) -> None:
+    """Tests near-duplicate points share one lookup and join back."""
+    route = police_api.get("/locate-neighbourhood").mock(
+        side_effect=lambda request: (
+            httpx.Response(404)
+            if request.url.params["q"].startswith("60")
+            else httpx.Response(
+                200, json={"force": "leicestershire", "neighbourhood": "NC04"}
+            )
+        )
+    )
+    client = PoliceClient()
+    points = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "latitude": [52.63891, 52.63893, 60.0, None],
+            "longitude": [-1.13501, -1.13502, -1.0, -1.1],
+        }
+    )
+
+    df = client.neighbourhoods.locate_neighbourhoods(points)
+    pairs = client.neighbourhoods.locate_neighbourhoods([(52.6389, -1.135)])
+
+    assert route.call_count == 3
+    assert df["id"].to_list() == [1, 2, 3, 4]
+    assert df["neighbourhood"].to_list() == ["NC04", "NC04", None, None]
+    assert pairs[0].force == "leicestershire"
@@ -0,0 +1,79 @@
+"""Tests for stop and search-related functionality."""
+
+import polars as pl
+import pytest
+from respx import MockRouter
+
+from policedatauk import AsyncPoliceClient, PoliceClient
+
+STOP = {
+    "age_range": "18-24",
+    "outcome": False,
+    "involved_person": True,
+    "self_defined_ethnicity": "White - English/Welsh/Scottish/Northern Irish",
+    "gender": "Male",
+    "legislation": "Misuse of Drugs Act 1971 (section 23)",
+    "outcome_linked_to_object_of_search": None,
+    "datetime": "2024-01-06T22:45:00+00:00",
+    "removal_of_more_than_outer_clothing": None,
+    "outcome_object": {
+        "id": "bu-no-further-action",
+        "name": "A no further action disposal",
+    },
+    "location": {
+        "latitude": "52.634407",
+        "street": {"id": 883407, "name": "On or near Petrol Station"},
+        "longitude": "-1.122544",
+    },
+    "operation": False,
+    "officer_defined_ethnicity": "White",
+    "type": "Person search",
+    "operation_name": None,
+    "object_of_search": "Controlled drugs",
+}
+
+
+@pytest.mark.parametrize("model_backend", ["pydantic", "msgspec"])
+def test_stops_by_force_polars(
+    police_api: MockRouter, model_backend: str
+) -> None:
+    """Tests stop and searches convert to a typed Polars DataFrame."""
+    route = police_api.get("/stops-force").respond(200, json=[STOP])
+    client = PoliceClient(model_backend=model_backend)
+
+    stops = client.stops.get_stops_by_force("leicestershire", "2024-01")
+    df = client.stops.get_stops_by_force(
+        "leicestershire", date="2024-01", to_polars=True
+    )
+
+    assert stops[0].outcome is None
+    assert stops[0].outcome_object.id == "bu-no-further-action"
+    assert route.calls.last.request.url.params["date"] == "2024-01"
+    assert df.schema["datetime"] == pl.Datetime("us", "UTC")
+    assert df.schema["latitude"] == pl.Float64
+    assert df.schema["involved_person"] == pl.Boolean
+    assert df["outcome_code"].to_list() == ["bu-no-further-action"]
+
+
+async def test_stops_by_forces_skips_unpublished(
+    police_api: MockRouter,
+) -> None:
+    """Tests bulk force retrieval skips forces without data for a month."""
+    police_api.get("/crimes-street-dates").respond(
+        200,
+        json=[
+            {"date": "2024-01", "stop-and-search": ["kent", "leicestershire"]}
+        ],
+    )
+    route = police_api.get("/stops-force").respond(200, json=[STOP])
+    client = AsyncPoliceClient(check_availability=True)
+
+    stops = await client.stops.get_stops_by_forces(
+        ["kent", "leicestershire", "essex"]
+    )
+
+    assert len(stops) == 2
+    assert route.call_count == 2
+    forces = {call.request.url.params["force"] for call in route.calls}
+    assert forces == {"kent", "leicestershire"}
+    assert route.calls.last.request.url.params["date"] == "2024-01"
@@ -0,0 +1,573 @@
+"""Tests for transport-level behaviour."""
+
+import asyncio
+import gzip
+from pathlib import Path
+from typing import AsyncGenerator, Generator, List
+
+import httpx
+import pytest
+import respx
+from pyrate_limiter import Duration, InMemoryBucket, Limiter, Rate
+from shapely.geometry import Polygon
+
+from policedatauk import PoliceClient
+from policedatauk.api.instrumentation import (
+    CacheEvent,
+    Instrumentation,
+    MetricsRegistry,
+    RequestEvent,
+)
+from policedatauk.api.transports import (
+    AsyncReplayTransport,
+    AsyncTransport,
+    Cassette,
+    CircuitBreaker,
+    Hedger,
+    PriorityScheduler,
+    Transport,
+    caller_tag,
+)
+from policedatauk.exceptions import (
+    CircuitOpenError,
+    NotFoundError,
+    ReplayMissError,
+    ServerError,
+    TooManyCrimesError,
+)
+from policedatauk.utils import RetryPolicy
+
+BASE_URL = "https://data.police.uk/api"
+
+
+def _limiter() -> Limiter:
+    """Build a generous limiter so tests never wait on it."""
+    return Limiter(InMemoryBucket([Rate(1000, Duration.SECOND)]))
+
+
+@pytest.fixture
+def mock_api() -> Generator[respx.MockRouter, None, None]:
+    """Fixture to provide a respx mock for the Police Data API."""
+    with respx.mock(base_url=BASE_URL) as mock:
+        yield mock
+
+
+@pytest.fixture
+async def async_transport() -> AsyncGenerator[AsyncTransport, None]:
+    """Fixture to provide an AsyncTransport with instant retries."""
+    async with httpx.AsyncClient() as client:
+        yield AsyncTransport(
+            base_url=BASE_URL,
+            client=client,
+            limiter=_limiter(),
+            retry_policy=RetryPolicy(base_wait=0, max_wait=0),
+        )
+
+
+@pytest.fixture
+def transport() -> Generator[Transport, None, None]:
+    """Fixture to provide a Transport with instant retries."""
+    with httpx.Client() as client:
+        yield Transport(
+            base_url=BASE_URL,
+            client=client,
+            limiter=_limiter(),
+            retry_policy=RetryPolicy(base_wait=0, max_wait=0),
+        )
+
+
+def test_retry_policy_status_rules() -> None:
+    """Tests exact status codes take precedence over status classes."""
+    policy = RetryPolicy()
+    assert policy.is_retryable_status(429)
+    assert policy.is_retryable_status(502)
+    assert policy.is_retryable_status(503)
+    assert not policy.is_retryable_status(501)
+    assert not policy.is_retryable_status(404)
+
+    policy = RetryPolicy(status_rules={"5xx": False, 502: True})
+    assert policy.is_retryable_status(502)
+    assert not policy.is_retryable_status(500)
+    assert not policy.is_retryable_status(429)
+
+
+async def test_too_many_crimes_is_not_retried(
+    async_transport: AsyncTransport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a 503 'too many crimes' response fails on the first attempt."""
+    route = mock_api.post("/crimes-street/all-crime").respond(503)
+
+    with pytest.raises(TooManyCrimesError):
+        await async_transport.request("POST", "/crimes-street/all-crime")
+    assert route.call_count == 1
+
+
+async def test_service_unavailable_is_retried(
+    async_transport: AsyncTransport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a 503 outage is retried, on crime endpoints too."""
+    outage = httpx.Response(503, text="Service Unavailable")
+    crimes = mock_api.post("/crimes-street/all-crime").mock(
+        side_effect=[outage, httpx.Response(200, json=[])]
+    )
+    forces = mock_api.get("/forces").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, json=[])]
+    )
+
+    await async_transport.request("POST", "/crimes-street/all-crime")
+    await async_transport.request("GET", "/forces")
+    assert (crimes.call_count, forces.call_count) == (2, 2)
+
+
+async def test_server_errors_are_retried(
+    async_transport: AsyncTransport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a transient 502 is retried until the request succeeds."""
+    route = mock_api.get("/forces").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json=[])]
+    )
+
+    response = await async_transport.request("GET", "/forces")
+    assert response.status_code == 200
+    assert route.call_count == 2
+
+
+def test_not_found_is_not_retried(
+    transport: Transport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a 404 response fails on the first attempt."""
+    route = mock_api.get("/forces/nowhere").respond(404)
+
+    with pytest.raises(NotFoundError):
+        transport.request("GET", "/forces/nowhere")
+    assert route.call_count == 1
+
+
+def test_max_attempts(
+    transport: Transport, mock_api: respx.MockRouter
+) -> None:
+    """Tests retries stop once the attempt budget is spent."""
+    transport.retry_policy.max_attempts = 3
+    route = mock_api.get("/forces").respond(500)
+
+    with pytest.raises(ServerError):
+        transport.request("GET", "/forces")
+    assert route.call_count == 3
+
+
+async def test_circuit_breaker_fails_fast(
+    async_transport: AsyncTransport, mock_api: respx.MockRouter
+) -> None:
+    """Tests an open breaker refuses requests without hitting the API."""
+    changes = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.add_listener(lambda old, new: changes.append((old, new)))
+    async_transport.breaker = breaker
+    async_transport.retry_policy.max_attempts = 1
+    route = mock_api.get("/forces").respond(500)
+
+    for _ in range(2):
+        with pytest.raises(ServerError):
+            await async_transport.request("GET", "/forces")
+    assert breaker.state == "open"
+    assert changes == [("closed", "open")]
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await async_transport.request("GET", "/forces")
+    assert exc_info.value.retry_after > 0
+    assert route.call_count == 2
+
+
+def test_circuit_breaker_half_open_probe(
+    transport: Transport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a successful probe closes the breaker after the cool-down."""
+    changes = []
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.add_listener(lambda old, new: changes.append((old, new)))
+    transport.breaker = breaker
+    transport.retry_policy.max_attempts = 1
+    mock_api.get("/forces").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json=[])]
+    )
+
+    with pytest.raises(ServerError):
+        transport.request("GET", "/forces")
+    assert transport.request("GET", "/forces").status_code == 200
+    assert breaker.state == "closed"
+    assert changes == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+
+
+def test_circuit_breaker_ignores_too_many_crimes() -> None:
+    """Tests the 503 'too many crimes' response is neutral to the breaker."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    request = httpx.Request("POST", f"{BASE_URL}/crimes-street/all-crime")
+    response = httpx.Response(503, request=request)
+    too_many = TooManyCrimesError("", request=request, response=response)
+    outage = ServerError("", request=request, response=response)
+
+    breaker.before_request()
+    breaker.record(outage)
+    breaker.before_request()
+    breaker.record(too_many)
+    assert breaker.state == "closed"
+    # The earlier failure still counts
+    breaker.before_request()
+    breaker.record(outage)
+    assert breaker.state == "half_open"  # open, with no cool-down
+
+    breaker.before_request()
+    breaker.record(too_many)
+    assert breaker.state == "half_open"
+
+
+def test_circuit_breaker_opens_on_503_outage(
+    transport: Transport, mock_api: respx.MockRouter
+) -> None:
+    """Tests Service Unavailable responses open and re-open the breaker."""
+    changes = []
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.add_listener(lambda old, new: changes.append((old, new)))
+    transport.breaker = breaker
+    transport.retry_policy.max_attempts = 1
+    mock_api.get("/forces").respond(503, text="Service Unavailable")
+    mock_api.get("/forces/kent").respond(500)
+
+    for endpoint in ("/forces", "/forces/kent", "/forces"):
+        with pytest.raises(ServerError):
+            transport.request("GET", endpoint)
+    assert breaker.state == "open"
+
+    breaker.reset_timeout = 0
+    with pytest.raises(ServerError):
+        transport.request("GET", "/forces")
+    assert changes == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "open"),
+    ]
+
+
+async def _yield() -> None:
+    """Let other tasks run (asyncio.sleep is patched out in conftest)."""
+    future = asyncio.get_running_loop().create_future()
+    asyncio.get_running_loop().call_soon(future.set_result, None)
+    await future
+
+
+class GatedLimiter:
+    """Limiter stand-in that grants slots only when the test allows."""
+
+    def __init__(self) -> None:
+        """Initialise the GatedLimiter class."""
+        self.gate = asyncio.Event()
+        self.granted: List[str] = []
+
+    async def try_acquire_async(self, name: str, timeout: float) -> bool:
+        """Record the acquisition once the gate is open."""
+        await self.gate.wait()
+        self.granted.append(name)
+        return True
+
+
+async def test_scheduler_priority_order() -> None:
+    """Tests high priority requests jump ahead of queued bulk requests."""
+    scheduler = PriorityScheduler()
+    limiter = GatedLimiter()
+    order = []
+
+    async def call(label: str, priority: str) -> None:
+        await scheduler.acquire(limiter, 10, priority)
+        order.append(label)
+
+    tasks = [asyncio.create_task(call("first", "low"))]
+    await _yield()
+    for i in range(3):
+        tasks.append(asyncio.create_task(call(f"bulk-{i}", "low")))
+    tasks.append(asyncio.create_task(call("interactive", "high")))
+    await _yield()
+    assert scheduler.pending == 4
+
+    limiter.gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["first", "interactive", "bulk-0", "bulk-1", "bulk-2"]
+
+
+async def test_scheduler_fair_share() -> None:
+    """Tests tags share the limiter in proportion to their weights."""
+    scheduler = PriorityScheduler(weights={"dashboard": 2})
+    limiter = GatedLimiter()
+    order = []
+
+    async def call(tag: str) -> None:
+        with caller_tag(tag):
+            await scheduler.acquire(limiter, 10)
+        order.append(tag)
+
+    tasks = [asyncio.create_task(call("warmup"))]
+    await _yield()
+    tasks += [asyncio.create_task(call("backfill")) for _ in range(4)]
+    tasks += [asyncio.create_task(call("dashboard")) for _ in range(4)]
+    await _yield()
+
+    limiter.gate.set()
+    await asyncio.gather(*tasks)
+    assert order[1:7].count("dashboard") == 4
+
+
+async def test_scheduler_turn_timeout() -> None:
+    """Tests a request gives up when its turn does not come in time."""
+    scheduler = PriorityScheduler()
+    limiter = GatedLimiter()
+    holder = asyncio.create_task(scheduler.acquire(limiter, 10))
+    await _yield()
+
+    assert not await scheduler.acquire(limiter, 0)
+    limiter.gate.set()
+    assert await holder
+    assert scheduler.pending == 0
+
+
+async def test_scheduled_transport_request(
+    async_transport: AsyncTransport, mock_api: respx.MockRouter
+) -> None:
+    """Tests priority is consumed by the transport, not sent to httpx."""
+    async_transport.scheduler = PriorityScheduler()
+    route = mock_api.get("/forces").respond(200, json=[])
+
+    response = await async_transport.request("GET", "/forces", priority="high")
+    assert response.status_code == 200
+    assert route.called
+    with pytest.raises(ValueError, match='"high", "normal", "low"'):
+        await async_transport.request("GET", "/forces", priority="urgent")
+    with pytest.raises(ValueError):
+        await async_transport.scheduler.acquire(
+            async_transport.limiter, 1, "urgent"
+        )
+    assert route.call_count == 1
+
+
+def test_instrumentation_events(mock_api: respx.MockRouter) -> None:
+    """Tests requests, stages and cache lookups reach the hooks."""
+    mock_api.get("/crime-last-updated").respond(
+        200, json={"date": "2024-02-01"}
+    )
+    mock_api.post("/crimes-street/all-crime").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json=[])]
+    )
+    mock_api.get("/forces/nowhere").respond(404)
+    registry = MetricsRegistry()
+    events = []
+    client = PoliceClient(
+        retry_policy=RetryPolicy(base_wait=0, max_wait=0),
+        cache_size=8,
+        hooks=[registry, events.append],
+    )
+
+    for _ in range(2):
+        client.crimes.get_crimes_by_location(
+            lat=52.63, lon=-1.13, date="2024-01", to_polars=True
+        )
+    with pytest.raises(NotFoundError):
+        client.forces.get_specific_force("nowhere")
+
+    crimes = next(
+        event
+        for event in events
+        if isinstance(event, RequestEvent) and event.method == "POST"
+    )
+    assert crimes.api == "data.police.uk"
+    assert (crimes.status, crimes.attempts, crimes.retries) == (200, 2, 1)
+    assert crimes.bytes_sent > 0 and crimes.bytes_received == 2
+    assert crimes.total >= crimes.limiter_wait
+    assert events[-1].error == "NotFoundError"
+    assert [e.hit for e in events if isinstance(e, CacheEvent)] == [
+        False,
+        True,
+    ]
+    assert registry.counter("policedatauk_requests_total", status="404") == 1
+    assert registry.counter("policedatauk_request_retries_total") == 1
+    # The /crime-last-updated stamp: the crime responses were empty
+    assert (
+        registry.counter("policedatauk_stage_items_total", stage="validate")
+        == 1
+    )
+    assert (
+        registry.histogram(
+            "policedatauk_stage_seconds", stage="to_polars"
+        ).count
+        == 2
+    )
+    assert 'phase="limiter_wait"' in registry.render()
+
+
+def test_failing_hook_warns(
+    transport: Transport, mock_api: respx.MockRouter
+) -> None:
+    """Tests a broken hook does not fail the request it measured."""
+
+    def broken(event: object) -> None:
+        raise RuntimeError("boom")
+
+    transport.instrumentation = Instrumentation([broken])
+    mock_api.get("/forces").respond(200, json=[])
+
+    with pytest.warns(RuntimeWarning, match="boom"):
+        assert transport.request("GET", "/forces").status_code == 200
+
+
+def test_profiler_report(mock_api: respx.MockRouter, tmp_path: Path) -> None:
+    """Tests the session summary groups endpoints and times stages."""
+    mock_api.get(url__regex=r"/[\w-]+/neighbourhoods$").respond(
+        200, json=[{"id": "NC04", "name": "City Centre"}]
+    )
+    mock_api.post("/crimes-street/all-crime").respond(200, json=[])
+    client = PoliceClient(profile=True)
+    poly = Polygon([(-1.2, 52.6), (-1.2, 52.7), (-1.1, 52.7)])
+
+    for force in ("kent", "avon-and-somerset", "essex"):
+        client.neighbourhoods.get_all_neighbourhoods(force, to_polars=True)
+    client.crimes.get_crimes_by_location(poly=poly, date="2024-01")
+
+    summary = client.profiler.summary()
+    endpoints = {row["endpoint"]: row for row in summary["endpoints"]}
+    hoods = endpoints["/{id}/neighbourhoods"]
+    assert set(endpoints) == {
+        "/{id}/neighbourhoods",
+        "/crimes-street/all-crime",
+    }
+    assert hoods["calls"] == 3 and hoods["p99_ms"] >= hoods["p50_ms"]
+    stages = {row["stage"]: row["calls"] for row in summary["stages"]}
+    assert stages["to_polars"] == stages["clean_polars_df"] == 3
+    assert stages["parse_polygon"] == 1
+    assert 0 <= summary["limiter"]["stalls"] <= 4
+    assert summary["time"]["bound"] in ("network", "cpu")
+    assert "/{id}/neighbourhoods" in client.profiler.report()
+    client.profiler.to_json(tmp_path / "profile.json")
+    assert (tmp_path / "profile.json").exists()
+
+
+def test_replay_round_trip(mock_api: respx.MockRouter, tmp_path: Path) -> None:
+    """Tests recorded responses replay offline, errors included."""
+    cassette = tmp_path / "cassette.jsonl.gz"
+    forces = mock_api.get("/forces").respond(
+        200, json=[{"id": "kent", "name": "Kent Police"}]
+    )
+    mock_api.get("/forces/nowhere").respond(404, text="Not found")
+    mock_api.get("/forces/flaky").respond(503)
+    client = PoliceClient(
+        retry_policy=RetryPolicy(max_attempts=1), cassette=cassette
+    )
+    recorded = client.forces.get_all_forces(to_polars=True)
+    with pytest.raises(NotFoundError):
+        client.forces.get_specific_force("nowhere")
+    with pytest.raises(ServerError):
+        client.forces.get_specific_force("flaky")
+    assert len(Cassette(cassette)) == 2
+
+    # Re-recording appends, and compacting drops the superseded entry
+    rerecord = PoliceClient(cassette=cassette, replay_mode="record")
+    rerecord.forces.get_all_forces()
+    with gzip.open(cassette, "rt") as file:
+        assert len(file.readlines()) == 3
+    assert len(Cassette(cassette)) == 2  # Loading compacts the file
+    with gzip.open(cassette, "rt") as file:
+        assert len(file.readlines()) == 2
+    rerecord.forces.get_all_forces()
+    rerecord.cassette.compact()
+    with gzip.open(cassette, "rt") as file:
+        assert len(file.readlines()) == 2
+
+    events = []
+    offline = PoliceClient(
+        cassette=cassette, replay_mode="replay", hooks=[events.append]
+    )
+    assert offline.forces.get_all_forces(to_polars=True).equals(recorded)
+    with pytest.raises(NotFoundError, match="Not found"):
+        offline.forces.get_specific_force("nowhere")
+    with pytest.raises(ReplayMissError):
+        offline.forces.get_specific_force("flaky")
+    assert forces.call_count == 3  # recorded, then re-recorded twice
+    assert [e.hit for e in events if isinstance(e, CacheEvent)] == [
+        True,
+        True,
+        False,
+    ]
+    assert not any(isinstance(e, RequestEvent) for e in events)
+
+
+async def test_async_replay_without_transport(tmp_path: Path) -> None:
+    """Tests a replay-only transport needs neither network nor limiter."""
+    cassette = Cassette(tmp_path / "cassette.jsonl.gz")
+    request = httpx.Request("GET", f"{BASE_URL}/forces")
+    cassette.record(httpx.Response(200, json=[], request=request))
+    transport = AsyncReplayTransport(cassette, base_url=BASE_URL)
+
+    response = await transport.request("GET", "/forces", priority="high")
+    assert transport.decode(response) == []
+    with pytest.raises(ReplayMissError):
+        await transport.request("GET", "/forces/kent")
+    with pytest.raises(ValueError):
+        AsyncReplayTransport(cassette, base_url=BASE_URL, mode="auto")
+
+
+async def test_hedged_request(mock_api: respx.MockRouter) -> None:
+    """Tests a slow GET is duplicated and the first response wins."""
+    calls = []
+
+    async def stalls_first(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.Event().wait()
+        return httpx.Response(200, json={"call": len(calls)})
+
+    mock_api.get("/forces/kent").mock(side_effect=stalls_first)
+    limiter = Limiter(InMemoryBucket([Rate(3, Duration.MINUTE)]))
+    events = []
+    async with httpx.AsyncClient() as client:
+        transport = AsyncTransport(
+            base_url=BASE_URL,
+            client=client,
+            limiter=limiter,
+            instrumentation=Instrumentation([events.append]),
+            hedger=Hedger(initial_delay=0.01),
+        )
+        response = await asyncio.wait_for(
+            transport.request("GET", "/forces/kent"), timeout=1
+        )
+        assert response.json() == {"call": 2}
+        assert (events[-1].attempts, events[-1].hedges) == (1, 1)
+        # The cancelled original is recorded as at least the delay
+        (latencies,) = transport.hedger._latencies.values()
+        assert len(latencies) == 2
+        assert max(latencies) >= 0.01
+        assert transport.hedger.delay("POST", f"{BASE_URL}/forces") is None
+
+        # The last limiter slot goes to the request, leaving none to hedge
+        calls.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                transport.request("GET", "/forces/kent"), timeout=0.1
+            )
+
+
+async def test_hedger_ignores_failed_responses(
+    mock_api: respx.MockRouter,
+) -> None:
+    """Tests fast error responses are not learned as hedging latencies."""
+    mock_api.get("/forces/kent").mock(return_value=httpx.Response(500))
+    async with httpx.AsyncClient() as client:
+        transport = AsyncTransport(
+            base_url=BASE_URL,
+            client=client,
+            limiter=Limiter(InMemoryBucket([Rate(3, Duration.MINUTE)])),
+            retry_policy=RetryPolicy(max_attempts=1),
+            hedger=Hedger(),
+        )
+        with pytest.raises(ServerError):
+            await transport.request("GET", "/forces/kent")
+        assert transport.hedger._latencies == {}
@@ -1,13 +1,21 @@
 """Tests for utility functions."""
 
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import httpx
 import pytest
 from respx import MockRouter
 from shapely.errors import GEOSException
 
+import policedatauk
 from policedatauk import PoliceClient
 from policedatauk.utils import (
     buffer_point,
+    get_decoder,
     parse_polygon,
     validate_lat,
     validate_lon,
@@ -90,3 +98,53 @@ async def test_rate_limit(
         assert response.status_code == 429
         assert response.text == "Rate limit exceeded"
     assert mock_route.called
+
+
+@pytest.mark.parametrize("name", ["auto", "json", "orjson", "msgspec"])
+def test_get_decoder(name: str) -> None:
+    """Tests every decoder backend gives the same result as the stdlib."""
+    if name in ("orjson", "msgspec"):
+        pytest.importorskip(name)
+    body = b'[{"id": 1, "location": {"latitude": "52.1"}, "context": ""}]'
+
+    assert get_decoder(name)(body) == json.loads(body)
+
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+IMPORT_PROBE = """
+import json, sys
+
+import policedatauk
+bare = sorted(m for m in {heavy} if m in sys.modules)
+
+import respx
+from policedatauk import PoliceClient
+
+with respx.mock(base_url="https://data.police.uk/api") as mock:
+    mock.get("/forces").respond(200, json=[{{"id": "kent", "name": "Kent"}}])
+    PoliceClient().forces.get_all_forces()
+used = sorted(m for m in {heavy} if m in sys.modules)
+print(json.dumps({{"bare": bare, "used": used}}))
+"""
+
+
+def test_import_time() -> None:
+    """Tests importing the package, and plain requests, stay lightweight."""
+    heavy = {"polars", "pyproj", "shapely", "numpy", "httpx", "pydantic"}
+    # Run the probe against this checkout, in a fresh interpreter
+    source = str(Path(policedatauk.__file__).parents[1])
+    path = os.pathsep.join(filter(None, [source, os.getenv("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE.format(heavy=heavy)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": path},
+    )
+    probe = json.loads(result.stdout)
+
+    # Module checks rather than wall-clock limits, which are flaky on CI
+    assert probe["bare"] == []
+    assert probe["used"] == ["httpx", "pydantic"]